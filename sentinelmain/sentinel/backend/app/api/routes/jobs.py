@@ -0,0 +1,137 @@
+"""
+Sentinel AI - Analysis Job Routes
+POST /jobs/{audio|video}[/object] and GET /jobs/{job_id} endpoints
+"""
+import asyncio
+import time
+from typing import Literal, Optional
+
+import httpx
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Query
+
+from app.schemas.responses import JobStatus, JobPriority, ObjectJobRequest, ErrorResponse
+from app.utils.callbacks import validate_callback_url
+from app.utils.file_handler import save_upload
+from app.utils.upload_store import delete_file
+from app.utils.object_storage import object_source, stat_object
+from app.utils.results import JobRejected, check_job_media
+from app.workers.jobs import get_job, submit_job
+from app.config import settings
+
+
+router = APIRouter()
+
+
+@router.post(
+    "/{content_type}",
+    response_model=JobStatus,
+    status_code=202,
+    responses={
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Queue audio or video analysis",
+    description="Saves the upload, queues it for the analysis workers and returns a job id immediately. "
+                "Poll GET /jobs/{job_id} or pass callback_url to be notified when it finishes."
+)
+async def create_job(
+    content_type: Literal["audio", "video"],
+    file: UploadFile = File(..., description="Audio or video file"),
+    callback_url: Optional[str] = Form(None, description="URL to POST the final job status to"),
+    priority: Optional[JobPriority] = Form(None, description="Priority lane (default interactive); use bulk for batch reprocessing")
+):
+    """
+    Queue analysis of an audio or video file.
+    
+    Long videos are split across workers; the result has the same shape as
+    the inline /analyze endpoints. Bulk jobs queue behind interactive ones.
+    """
+    await validate_callback_url(callback_url)
+    
+    # Kept for the job lifetime in case the queue is backed up
+    file_path, digest = await save_upload(file, content_type, retention=settings.job_ttl_seconds)
+    
+    try:
+        # Refuse over-long media now rather than failing the job after analysis
+        await asyncio.to_thread(check_job_media, content_type, file_path)
+    except JobRejected as e:
+        delete_file(file_path)
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        # Redis and broker calls are blocking; keep them off the event loop
+        job_id = await asyncio.to_thread(submit_job, content_type, file_path, callback_url, priority)
+    except Exception as e:
+        delete_file(file_path)
+        raise HTTPException(
+            status_code=503,
+            detail=f"Job queue unavailable: {str(e)}"
+        )
+    
+    return JobStatus(job_id=job_id, status="queued", content_type=content_type)
+
+
+@router.post(
+    "/{content_type}/object",
+    response_model=JobStatus,
+    status_code=202,
+    responses={
+        400: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Queue analysis of an object storage upload",
+    description="Queues a file uploaded to a URL from POST /uploads/presigned. The workers download it "
+                "from object storage; only its first bytes are read here, to check size and format. "
+                "Its duration is checked by the worker before analysis."
+)
+async def create_object_job(content_type: Literal["audio", "video"], request: ObjectJobRequest):
+    """Queue analysis of an uploaded object."""
+    await validate_callback_url(request.callback_url)
+    
+    try:
+        await asyncio.to_thread(stat_object, request.object_key, content_type)
+    except httpx.HTTPError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Object storage unavailable: {str(e)}"
+        )
+    
+    try:
+        job_id = await asyncio.to_thread(
+            submit_job, content_type, object_source(request.object_key), request.callback_url, request.priority
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Job queue unavailable: {str(e)}"
+        )
+    
+    return JobStatus(job_id=job_id, status="queued", content_type=content_type)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobStatus,
+    responses={404: {"model": ErrorResponse}},
+    summary="Get job status and result",
+    description="Returns the job status, and the analysis result once it has succeeded. "
+                "With wait > 0 the request is held until the job finishes or the wait runs out."
+)
+async def get_job_status(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=settings.job_max_wait_seconds, description="Seconds to long-poll for completion")
+):
+    """Report a job's status, optionally waiting for it to finish."""
+    deadline = time.monotonic() + wait
+    
+    while True:
+        job = await asyncio.to_thread(get_job, job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail="Job not found or expired")
+        
+        if job.status in ("succeeded", "failed") or time.monotonic() >= deadline:
+            return job
+        await asyncio.sleep(settings.job_poll_interval_seconds)
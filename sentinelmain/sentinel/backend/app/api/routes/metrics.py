@@ -0,0 +1,100 @@
+"""
+Sentinel AI - Metrics Routes
+GET /metrics/* endpoints for operational statistics
+"""
+import asyncio
+
+from fastapi import APIRouter, HTTPException
+
+from app.models.inference_pool import get_inference_pool
+from app.models.onnx_audio import get_onnx_audio_backend
+from app.utils.executors import executor_stats
+from app.utils.janitor import get_janitor
+from app.utils.result_cache import get_result_cache
+from app.workers.autoscaler import autoscaler_stats
+from app.workers.lanes import lane_stats
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/audio",
+    summary="Audio inference throughput",
+    description="Per-length-bucket batching and throughput statistics for the audio model."
+)
+async def audio_metrics():
+    """Report audio backend statistics."""
+    backend = get_onnx_audio_backend()
+    if backend is None:
+        return {"backend": "mock", "buckets": {}}
+    return backend.stats()
+
+
+@router.get(
+    "/executors",
+    summary="Analysis executor load",
+    description="Per-modality worker pool occupancy, queue depth, rejections and timeouts."
+)
+async def executor_metrics():
+    """Report analysis executor statistics."""
+    return executor_stats()
+
+
+@router.get(
+    "/inference",
+    summary="Inference process pool",
+    description="Worker restarts, requests in flight and shared-memory usage of the inference processes."
+)
+async def inference_metrics():
+    """Report inference pool statistics."""
+    pool = get_inference_pool()
+    if pool is None:
+        return {"processes": 0}
+    return {"processes": pool.processes, **pool.stats()}
+
+
+@router.get(
+    "/cache",
+    summary="Result cache effectiveness",
+    description="Hits per tier, misses, coalesced concurrent requests and in-process cache size."
+)
+async def cache_metrics():
+    """Report result cache statistics."""
+    return get_result_cache().stats()
+
+
+@router.get(
+    "/uploads",
+    summary="Upload cleanup",
+    description="Uploads waiting in the expiry index and files deleted by the janitor."
+)
+async def upload_metrics():
+    """Report upload janitor statistics."""
+    return get_janitor().stats()
+
+
+@router.get(
+    "/lanes",
+    summary="Job queue lanes",
+    description="Queue depth, oldest waiting task and recent queue-wait percentiles per modality and priority lane."
+)
+async def lane_metrics():
+    """Report priority lane statistics from the broker."""
+    try:
+        return await asyncio.to_thread(lane_stats)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Job queue unavailable: {str(e)}")
+
+
+@router.get(
+    "/autoscaler",
+    summary="Worker autoscaling",
+    description="Pool sizes the autoscaler last observed and chose for each worker, and its recent scaling decisions."
+)
+async def autoscaler_metrics():
+    """Report the worker autoscaler's state and decisions."""
+    try:
+        return await asyncio.to_thread(autoscaler_stats)
+    except Exception as e:
+        raise HTTPException(status_code=503, detail=f"Job queue unavailable: {str(e)}")
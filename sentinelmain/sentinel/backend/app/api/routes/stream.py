@@ -0,0 +1,232 @@
+"""
+Sentinel AI - Streaming Audio Route
+WebSocket /analyze/audio/stream endpoint
+"""
+import asyncio
+import time
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+from app.models.audio_analyzer import get_audio_analyzer
+from app.models.audio_stream import AudioStreamSession
+from app.utils.executors import ExecutorSaturated, get_executor
+from app.utils.stream_decoder import FfmpegStreamDecoder
+from app.utils.explainer import explain_audio_analysis, get_verdict
+from app.config import settings
+
+
+router = APIRouter()
+
+SUPPORTED_CODECS = {"pcm", "opus"}
+
+
+@router.websocket("/audio/stream")
+async def stream_audio(websocket: WebSocket, codec: str = "pcm", sample_rate: int = 16000):
+    """
+    Score a live call while it is still in progress.
+    
+    Protocol:
+    - Connect with ``?codec=pcm&sample_rate=16000`` (16-bit little-endian
+      mono PCM) or ``?codec=opus`` (Ogg or WebM container)
+    - Send audio as binary messages of any size
+    - Send the text message ``end`` to get a final verdict
+    
+    The server pushes a ``score`` message for every new window. If the
+    client sends faster than windows can be scored, reading pauses (TCP
+    flow control pushes back on the sender) and a ``backpressure`` message
+    is sent. A window that takes longer than the latency budget is reported
+    as ``skipped`` instead of delaying later windows; audio that arrives
+    while it finishes is scored as one window right after. A stream ffmpeg
+    cannot decode gets an ``error`` message and a final verdict on the
+    audio decoded so far.
+    """
+    await websocket.accept()
+    
+    if codec not in SUPPORTED_CODECS or not 8000 <= sample_rate <= 48000:
+        await websocket.send_json({
+            "type": "error",
+            "detail": f"Unsupported stream format. Codecs: {', '.join(sorted(SUPPORTED_CODECS))}"
+        })
+        await websocket.close(code=1003)
+        return
+    
+    analyzer = get_audio_analyzer()
+    input_rate = sample_rate if codec == "pcm" else analyzer.sample_rate
+    session = AudioStreamSession(analyzer, input_rate=input_rate)
+    hops: asyncio.Queue = asyncio.Queue(maxsize=settings.stream_max_pending_windows)
+    send_lock = asyncio.Lock()
+    executor = get_executor("audio")
+    busy = None  # Scoring of the latest window, which may outlive its budget
+    decoder = None
+    tasks = []
+    
+    async def send(message: dict):
+        async with send_lock:
+            await websocket.send_json(message)
+    
+    async def enqueue(new_hops: list):
+        for hop in new_hops:
+            if hops.full():
+                await send({"type": "backpressure", "pending_windows": hops.qsize()})
+            await hops.put((hop, time.monotonic()))
+    
+    def build_message(kind: str, scores: dict) -> dict:
+        risk_score, explanations, action = explain_audio_analysis(
+            human_voice=scores["human_voice"],
+            tts_likelihood=scores["tts_likelihood"],
+            voice_cloning=scores["voice_cloning"]
+        )
+        return {
+            "type": kind,
+            "window": session.hops_scored,
+            "stream_seconds": round(session.seconds_received, 2),
+            "human_voice": scores["human_voice"],
+            "tts_likelihood": scores["tts_likelihood"],
+            "voice_cloning": scores["voice_cloning"],
+            "speech_ratio": scores["speech_ratio"],
+            "known_clip": scores["known_clip"],
+            "risk_score": risk_score,
+            "verdict": get_verdict(risk_score).value,
+            "explanations": explanations,
+            "action": action
+        }
+    
+    async def receive_audio():
+        """Read client messages until ``end`` or disconnect."""
+        try:
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    break
+                if message.get("text") == "end":
+                    break
+                data = message.get("bytes")
+                if not data:
+                    continue
+                
+                if session.seconds_received > settings.stream_max_session_seconds:
+                    await send({"type": "error", "detail": "Stream too long"})
+                    break
+                
+                if decoder:
+                    try:
+                        await decoder.write(data)
+                    except OSError:
+                        # ffmpeg exited, e.g. on a malformed Opus stream
+                        await send({"type": "error", "detail": "Audio stream could not be decoded"})
+                        break
+                else:
+                    await enqueue(session.feed_pcm(data))
+        finally:
+            if decoder:
+                await decoder.finish()
+            else:
+                await enqueue(session.flush())
+                await hops.put(None)
+    
+    async def pump_decoder():
+        """Move decoded PCM from ffmpeg into the hop queue."""
+        try:
+            while chunk := await decoder.read():
+                await enqueue(session.feed_pcm(chunk))
+            await enqueue(session.flush())
+        finally:
+            await hops.put(None)
+    
+    async def score(hop, queued_at: float):
+        """Score one window within the latency budget and report it."""
+        nonlocal busy
+        try:
+            busy = asyncio.wrap_future(executor.submit(session.score_hop, hop))
+        except ExecutorSaturated:
+            await send({"type": "skipped", "reason": "server busy"})
+            return
+        
+        try:
+            scores = await asyncio.wait_for(
+                asyncio.shield(busy),
+                timeout=settings.stream_window_timeout_seconds
+            )
+        except asyncio.TimeoutError:
+            await send({"type": "skipped", "reason": "latency budget exceeded"})
+            return
+        
+        message = build_message("score", scores)
+        message["latency_ms"] = int((time.monotonic() - queued_at) * 1000)
+        await send(message)
+    
+    async def score_windows():
+        """Score hops in order within the per-window latency budget."""
+        import numpy as np
+        
+        # Hops that arrive while a timed-out window is still running wait
+        # here and are scored together as soon as it finishes; only audio
+        # older than the rolling window is dropped
+        backlog = []
+        next_hop = asyncio.ensure_future(hops.get())
+        try:
+            while next_hop is not None or backlog:
+                running = busy is not None and not busy.done()
+                if next_hop is not None:
+                    waiting = {next_hop, busy} if running and backlog else {next_hop}
+                    await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+                    if next_hop.done():
+                        item = next_hop.result()
+                        next_hop = None if item is None else asyncio.ensure_future(hops.get())
+                        if item is not None:
+                            backlog.append(item)
+                elif running:
+                    # No more audio; give the running window one more budget
+                    try:
+                        await asyncio.wait_for(asyncio.shield(busy), timeout=settings.stream_window_timeout_seconds)
+                    except asyncio.TimeoutError:
+                        await send({"type": "skipped", "reason": "latency budget exceeded"})
+                        return
+                
+                # A timed-out window may still be running; never overlap a session
+                if not backlog or (busy is not None and not busy.done()):
+                    continue
+                
+                for _ in backlog[:-session.window_hops]:
+                    await send({"type": "skipped", "reason": "scoring behind"})
+                backlog = backlog[-session.window_hops:]
+                hop = backlog[0][0] if len(backlog) == 1 else np.concatenate([h for h, _ in backlog])
+                queued_at = backlog[0][1]
+                backlog = []
+                await score(hop, queued_at)
+            
+            if busy is not None and not busy.done():
+                # The final verdict pools the windows scored so far if the last one overruns
+                try:
+                    await asyncio.wait_for(asyncio.shield(busy), timeout=settings.stream_window_timeout_seconds)
+                except asyncio.TimeoutError:
+                    await send({"type": "skipped", "reason": "latency budget exceeded"})
+        finally:
+            if next_hop is not None:
+                next_hop.cancel()
+        await send(build_message("final", session.window_scores()))
+    
+    try:
+        if codec == "opus":
+            decoder = FfmpegStreamDecoder(analyzer.sample_rate)
+            try:
+                await decoder.start()
+            except OSError as e:
+                print(f"Stream decoder failed to start: {e}")
+                await send({"type": "error", "detail": "Audio decoding unavailable"})
+                await websocket.close(code=1011)
+                return
+        
+        tasks = [asyncio.create_task(receive_audio()), asyncio.create_task(score_windows())]
+        if decoder:
+            tasks.append(asyncio.create_task(pump_decoder()))
+        await asyncio.gather(*tasks)
+        await websocket.close()
+    except (WebSocketDisconnect, RuntimeError):
+        # Client went away mid-stream; nothing left to deliver
+        pass
+    finally:
+        for task in tasks:
+            task.cancel()
+        if decoder:
+            await decoder.close()
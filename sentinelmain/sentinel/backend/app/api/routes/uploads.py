@@ -0,0 +1,184 @@
+"""
+Sentinel AI - Resumable Upload Routes
+POST/PATCH/HEAD /uploads endpoints for uploads sent in byte ranges or to object storage
+"""
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, Body, Header, HTTPException, Request, Response
+
+from app.schemas.responses import UploadCreateRequest, UploadStatus, PresignedUpload, JobStatus, JobPriority, ErrorResponse
+from app.utils.callbacks import validate_callback_url
+from app.utils.upload_store import delete_file
+from app.utils.object_storage import create_presigned_upload
+from app.utils.results import JobRejected, check_job_media
+from app.utils.resumable import append_chunk, create_upload, discard_upload, finalize_upload, get_upload
+from app.workers.jobs import submit_job
+from app.config import settings
+
+
+router = APIRouter()
+
+
+def _status(upload: dict, response: Response) -> UploadStatus:
+    """Build the upload status and mirror the offset in headers."""
+    response.headers["Upload-Offset"] = str(upload["offset"])
+    response.headers["Upload-Length"] = str(upload["size"])
+    response.headers["Cache-Control"] = "no-store"
+    return UploadStatus(
+        upload_id=upload["upload_id"],
+        content_type=upload["content_type"],
+        size=upload["size"],
+        offset=upload["offset"],
+        expires_at=upload["expires_at"]
+    )
+
+
+@router.post(
+    "",
+    response_model=UploadStatus,
+    status_code=201,
+    responses={
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse}
+    },
+    summary="Start a resumable upload",
+    description="Creates an upload for a large audio or video file. Send the bytes with PATCH, "
+                "check progress with HEAD after a dropped connection, then finalize to queue analysis."
+)
+async def start_upload(request: UploadCreateRequest, response: Response):
+    """Create a resumable upload."""
+    upload = create_upload(request.filename, request.content_type, request.size)
+    response.headers["Location"] = f"/uploads/{upload['upload_id']}"
+    return _status(upload, response)
+
+
+@router.post(
+    "/presigned",
+    response_model=PresignedUpload,
+    status_code=201,
+    responses={
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Get a presigned object storage upload URL",
+    description="Returns a URL to PUT a large audio or video file to, straight to object storage "
+                "and bypassing the API. Queue analysis afterwards with POST /jobs/{content_type}/object."
+)
+async def presigned_upload(request: UploadCreateRequest):
+    """Hand out a direct upload URL."""
+    return PresignedUpload(**create_presigned_upload(request.filename, request.content_type, request.size))
+
+
+@router.api_route(
+    "/{upload_id}",
+    methods=["GET", "HEAD"],
+    response_model=UploadStatus,
+    responses={404: {"model": ErrorResponse}},
+    summary="Get upload offset",
+    description="Returns how many bytes have been received (also in the Upload-Offset header)."
+)
+async def upload_offset(upload_id: str, response: Response):
+    """Report where the upload stands so the client can resume."""
+    return _status(get_upload(upload_id), response)
+
+
+@router.patch(
+    "/{upload_id}",
+    response_model=UploadStatus,
+    responses={
+        400: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+        409: {"model": ErrorResponse},
+        413: {"model": ErrorResponse}
+    },
+    summary="Append bytes to an upload",
+    description="Appends the raw request body at Upload-Offset, which must equal the current offset. "
+                "On a 409 the Upload-Offset response header says where to resume."
+)
+async def upload_chunk(
+    upload_id: str,
+    request: Request,
+    response: Response,
+    upload_offset: int = Header(..., alias="Upload-Offset", ge=0),
+    content_length: Optional[int] = Header(None, alias="Content-Length")
+):
+    """
+    Append one byte range.
+    
+    Bytes that arrive before a connection drops are kept; HEAD the
+    upload to find where to continue.
+    """
+    upload = get_upload(upload_id)
+    if content_length is not None and upload_offset + content_length > upload["size"]:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Range ends past the upload size of {upload['size']} bytes"
+        )
+    
+    upload = await append_chunk(upload_id, upload_offset, request.stream())
+    return _status(upload, response)
+
+
+@router.post(
+    "/{upload_id}/finalize",
+    response_model=JobStatus,
+    status_code=202,
+    responses={
+        400: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+        409: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Finish an upload and queue analysis",
+    description="Stores the complete upload and queues it like POST /jobs/{content_type}. "
+                "Poll GET /jobs/{job_id} or pass callback_url to be notified when it finishes."
+)
+async def finalize(
+    upload_id: str,
+    callback_url: Optional[str] = Body(None, embed=True, description="URL to POST the final job status to"),
+    priority: Optional[JobPriority] = Body(None, embed=True, description="Priority lane (default interactive); use bulk for batch reprocessing")
+):
+    """Queue analysis of a completed upload."""
+    await validate_callback_url(callback_url)
+    
+    # Hashing and linking touch the disk; keep them off the event loop
+    upload, file_path, digest = await asyncio.to_thread(
+        finalize_upload, upload_id, settings.job_ttl_seconds
+    )
+    content_type = upload["content_type"]
+    
+    try:
+        await asyncio.to_thread(check_job_media, content_type, file_path)
+    except JobRejected as e:
+        # Finalizing again would not help
+        delete_file(file_path)
+        discard_upload(upload_id)
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        job_id = await asyncio.to_thread(submit_job, content_type, file_path, callback_url, priority)
+    except Exception as e:
+        # The upload is kept, so finalize can be retried
+        delete_file(file_path)
+        raise HTTPException(
+            status_code=503,
+            detail=f"Job queue unavailable: {str(e)}"
+        )
+    
+    discard_upload(upload_id)
+    return JobStatus(job_id=job_id, status="queued", content_type=content_type)
+
+
+@router.delete(
+    "/{upload_id}",
+    status_code=204,
+    responses={404: {"model": ErrorResponse}},
+    summary="Cancel an upload",
+    description="Discards an unfinished upload."
+)
+async def cancel_upload(upload_id: str):
+    """Discard an unfinished upload."""
+    discard_upload(upload_id)
+    return Response(status_code=204)
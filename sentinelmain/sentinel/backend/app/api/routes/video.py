@@ -1,91 +1,169 @@
-"""
-Sentinel AI - Video Analysis Route
-POST /analyze/video endpoint
-"""
-from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks
-
-from app.schemas.responses import VideoAnalysisResult, VideoAnalysisDetails, ErrorResponse
-from app.models.video_analyzer import get_video_analyzer
-from app.utils.file_handler import save_upload, delete_file
-from app.utils.explainer import explain_video_analysis, get_verdict
-from app.config import settings
-
-
-router = APIRouter()
-
-
-@router.post(
-    "/video",
-    response_model=VideoAnalysisResult,
-    responses={
-        400: {"model": ErrorResponse},
-        413: {"model": ErrorResponse},
-        500: {"model": ErrorResponse}
-    },
-    summary="Analyze video for deepfake content",
-    description="Analyzes video content to detect deepfakes by sampling frames and analyzing temporal patterns."
-)
-async def analyze_video(
-    background_tasks: BackgroundTasks,
-    file: UploadFile = File(..., description="Video file (MP4, MOV, ≤8 seconds)")
-):
-    """
-    Analyze video content for:
-    - Real/authentic video
-    - Deepfake detection
-    - Frame-by-frame analysis
-    """
-    file_path = None
-    
-    try:
-        # Save uploaded file
-        file_path, file_id = await save_upload(file, "video")
-        
-        # Get analyzer
-        analyzer = get_video_analyzer()
-        
-        # Run analysis
-        result = analyzer.analyze(file_path)
-        
-        # Check duration limit
-        if result["duration_seconds"] > settings.max_video_duration_seconds:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Video too long. Maximum duration: {settings.max_video_duration_seconds} seconds"
-            )
-        
-        # Generate explanations
-        risk_score, explanations, action = explain_video_analysis(
-            real_probability=result["real_probability"],
-            deepfake_likelihood=result["deepfake_likelihood"]
-        )
-        
-        # Schedule file cleanup
-        background_tasks.add_task(delete_file, file_path)
-        
-        # Build response
-        return VideoAnalysisResult(
-            risk_score=risk_score,
-            verdict=get_verdict(risk_score),
-            explanations=explanations,
-            action=action,
-            content_type="video",
-            details=VideoAnalysisDetails(
-                real_probability=result["real_probability"],
-                deepfake_likelihood=result["deepfake_likelihood"],
-                frames_analyzed=result["frames_analyzed"]
-            ),
-            duration_seconds=result["duration_seconds"]
-        )
-        
-    except HTTPException:
-        if file_path:
-            delete_file(file_path)
-        raise
-    except Exception as e:
-        if file_path:
-            delete_file(file_path)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Analysis failed: {str(e)}"
-        )
+"""
+Sentinel AI - Video Analysis Route
+POST /analyze/video endpoint
+POST /analyze/video/segments endpoint (streamed per-segment results)
+"""
+import json
+
+from fastapi import APIRouter, UploadFile, File, HTTPException, BackgroundTasks, Query
+from fastapi.responses import StreamingResponse
+
+from app.schemas.responses import VideoAnalysisResult, ErrorResponse
+from app.models.video_analyzer import get_video_analyzer
+from app.utils.file_handler import save_upload
+from app.utils.upload_store import delete_file
+from app.utils.explainer import explain_video_analysis, get_verdict
+from app.utils.results import build_video_result
+from app.utils.executors import get_executor
+from app.utils.result_cache import cached_analysis
+from app.config import settings
+
+
+router = APIRouter()
+
+
+@router.post(
+    "/video",
+    response_model=VideoAnalysisResult,
+    responses={
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Analyze video for deepfake content",
+    description="Analyzes video content to detect deepfakes by sampling frames and analyzing temporal patterns."
+)
+async def analyze_video(
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(..., description="Video file (MP4, MOV, ≤8 seconds)")
+):
+    """
+    Analyze video content for:
+    - Real/authentic video
+    - Deepfake detection
+    - Frame-by-frame analysis
+    """
+    file_path = None
+    
+    try:
+        # Save uploaded file
+        file_path, digest = await save_upload(file, "video")
+        
+        # Get analyzer
+        analyzer = get_video_analyzer()
+        
+        # Run analysis (or reuse the result for identical content)
+        result = await cached_analysis(
+            "video", digest, analyzer.model_version,
+            lambda: get_executor("video").run(analyzer.analyze, file_path, digest)
+        )
+        
+        # Check duration limit
+        if result["duration_seconds"] > settings.max_video_duration_seconds:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Video too long. Maximum duration: {settings.max_video_duration_seconds} seconds"
+            )
+        
+        # Schedule file cleanup
+        background_tasks.add_task(delete_file, file_path)
+        
+        # Build response
+        return build_video_result(result)
+        
+    except HTTPException:
+        if file_path:
+            delete_file(file_path)
+        raise
+    except Exception as e:
+        if file_path:
+            delete_file(file_path)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Analysis failed: {str(e)}"
+        )
+
+
+def _encode_event(event: dict, stream_format: str) -> str:
+    """Serialize one segment event as an NDJSON line or SSE message."""
+    data = json.dumps(event)
+    if stream_format == "sse":
+        return f"event: {event['type']}\ndata: {data}\n\n"
+    return data + "\n"
+
+
+@router.post(
+    "/video/segments",
+    responses={
+        400: {"model": ErrorResponse},
+        413: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    },
+    summary="Analyze a long video segment by segment",
+    description="Splits the video into time ranges and streams a result per segment as it finishes "
+                "(NDJSON, or Server-Sent Events with format=sse), followed by a summary."
+)
+async def analyze_video_segments(
+    file: UploadFile = File(..., description="Video file (MP4, MOV)"),
+    stream_format: str = Query("ndjson", alias="format", pattern="^(ndjson|sse)$")
+):
+    """
+    Analyze a long video progressively.
+    
+    Each event carries the segment's time range so the suspicious part
+    can be located. The last event has type ``summary``; failures after
+    streaming has started arrive as an ``error`` event.
+    
+    The video is probed before the response starts, so an unreadable or
+    over-long video is a 400 rather than an error event. The analysis
+    runs in the video executor, holding one of its slots while it streams.
+    """
+    file_path, digest = await save_upload(file, "video")
+    analyzer = get_video_analyzer()
+    
+    try:
+        video_info = await get_executor("video").run(analyzer.probe, file_path)
+    except HTTPException:
+        delete_file(file_path)
+        raise
+    except Exception as e:
+        delete_file(file_path)
+        raise HTTPException(status_code=400, detail=f"Could not read video: {str(e)}")
+    
+    limit = settings.max_segmented_video_duration_seconds
+    if video_info["duration"] <= 0:
+        delete_file(file_path)
+        raise HTTPException(status_code=400, detail="Could not read video: no frames found")
+    if video_info["duration"] > limit:
+        delete_file(file_path)
+        raise HTTPException(status_code=400, detail=f"Video too long. Maximum duration: {limit} seconds")
+    
+    # The executor deletes the upload once the analysis has stopped
+    segments = get_executor("video").iterate(
+        analyzer.analyze_segments, file_path, video_info,
+        cleanup=lambda: delete_file(file_path)
+    )
+    
+    async def events():
+        try:
+            async for event in segments:
+                risk_score, explanations, action = explain_video_analysis(
+                    real_probability=event["real_probability"],
+                    deepfake_likelihood=event["deepfake_likelihood"]
+                )
+                event["risk_score"] = risk_score
+                event["verdict"] = get_verdict(risk_score).value
+                if event["type"] == "summary":
+                    event["explanations"] = explanations
+                    event["action"] = action
+                yield _encode_event(event, stream_format)
+        except Exception as e:
+            yield _encode_event({"type": "error", "detail": f"Analysis failed: {str(e)}"}, stream_format)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream" if stream_format == "sse" else "application/x-ndjson",
+        # Stop nginx from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
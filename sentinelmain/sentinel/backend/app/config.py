@@ -1,51 +1,159 @@
-"""
-Sentinel AI - Configuration Module
-Loads environment variables and provides app-wide settings.
-"""
-import os
-from pathlib import Path
-from pydantic_settings import BaseSettings
-from typing import List
-
-
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
-    
-    # API Keys
-    gemini_api_key: str = "<GEMINI_API_KEY>"
-    api_secret_key: str = "<API_SECRET_KEY>"
-    object_storage_key: str = "<OBJECT_STORAGE_KEY>"
-    object_storage_secret: str = "<OBJECT_STORAGE_SECRET>"
-    
-    # Redis
-    redis_url: str = "redis://localhost:6379/0"
-    
-    # Upload settings
-    max_upload_size_mb: int = 50
-    upload_dir: Path = Path("/tmp/uploads")
-    file_retention_seconds: int = 300
-    
-    # Application
-    debug: bool = False
-    cors_origins: str = "http://localhost:3000,http://localhost:8080"
-    
-    # Content limits
-    max_text_length: int = 10000
-    max_audio_duration_seconds: int = 30
-    max_video_duration_seconds: int = 8
-    
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins from comma-separated string."""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
-    
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-
-
-# Global settings instance
-settings = Settings()
-
-# Ensure upload directory exists
-settings.upload_dir.mkdir(parents=True, exist_ok=True)
+"""
+Sentinel AI - Configuration Module
+Loads environment variables and provides app-wide settings.
+"""
+import os
+from pathlib import Path
+from pydantic_settings import BaseSettings
+from typing import List
+
+
+class Settings(BaseSettings):
+    """Application settings loaded from environment variables."""
+    
+    # API Keys
+    gemini_api_key: str = "<GEMINI_API_KEY>"
+    api_secret_key: str = "<API_SECRET_KEY>"
+    object_storage_key: str = "<OBJECT_STORAGE_KEY>"
+    object_storage_secret: str = "<OBJECT_STORAGE_SECRET>"
+    
+    # Redis
+    redis_url: str = "redis://localhost:6379/0"
+    
+    # Upload settings
+    max_upload_size_mb: int = 50
+    upload_dir: Path = Path("/tmp/uploads")
+    upload_memory_threshold_mb: int = 8  # Image/audio uploads up to this size never touch disk
+    file_retention_seconds: int = 300
+    resumable_upload_ttl_seconds: int = 86400  # Unfinished resumable uploads are dropped after this
+    
+    # Object storage (S3-compatible): clients upload media to presigned URLs
+    object_storage_endpoint: str = ""  # e.g. http://minio:9000 as workers reach it; empty = disabled
+    object_storage_public_endpoint: str = ""  # As clients reach it, if different
+    object_storage_bucket: str = "sentinel-uploads"
+    object_storage_region: str = "us-east-1"
+    object_storage_presign_seconds: int = 900
+    object_storage_range_mb: int = 8  # Workers download objects in ranges of this size
+    object_storage_timeout_seconds: float = 30.0
+    
+    # Application
+    debug: bool = False
+    cors_origins: str = "http://localhost:3000,http://localhost:8080"
+    
+    # Content limits
+    max_text_length: int = 10000
+    max_audio_duration_seconds: int = 30
+    max_video_duration_seconds: int = 8
+    
+    # Inference processes fed through shared memory (API only; 0 = analyze in-process)
+    inference_processes: int = 0
+    inference_slots: int = 0  # Shared memory holds this many largest inputs; 0 = 2 per process
+    inference_slot_mb: int = 8  # Largest image/frame accepted
+    inference_block_kb: int = 256  # Shared memory is handed out in blocks of this size
+    inference_timeout_seconds: float = 30.0
+    
+    # Result cache: in-process LRU in front of a Redis tier shared by replicas
+    result_cache_enabled: bool = True
+    result_cache_size: int = 1024  # Results kept in each API process
+    result_cache_ttl_seconds: int = 86400  # Lifetime in Redis
+    result_cache_version: str = "1"  # Bump to invalidate every cached result
+    
+    # Analysis executors (per modality, off the event loop)
+    analysis_workers: int = 0  # Threads per modality; 0 = CPU count
+    video_analysis_workers: int = 2  # Each video also runs ffmpeg and an audio branch
+    analysis_max_queued: int = 8  # Waiting requests per modality before 503
+    analysis_timeout_seconds: float = 60.0
+    
+    # Audio model (ONNX Runtime)
+    audio_model_path: Path = Path("/app/models/audio_wav2vec2.onnx")
+    audio_model_int8_path: Path = Path("/app/models/audio_wav2vec2.int8.onnx")
+    audio_model_use_int8: bool = True
+    audio_bucket_seconds: List[float] = [2, 4, 8, 16, 32]
+    audio_max_batch_size: int = 8
+    audio_max_batch_wait_ms: int = 15
+    audio_intra_op_threads: int = 0  # 0 = ONNX Runtime default
+    audio_inference_timeout_seconds: float = 30.0
+    
+    # Video decoding: "ffmpeg" (scaled inside the decoder) or "opencv"
+    video_decode_backend: str = "ffmpeg"
+    
+    # Video frame sampling: "adaptive" (scene-aware) or "uniform" (1 fps)
+    video_sampling_mode: str = "adaptive"
+    video_frame_budget: int = 8
+    video_candidate_fps: float = 4.0  # Highest candidate rate; lowered so candidates span long clips
+    video_max_candidates: int = 64
+    
+    # Video early exit (sequential probability ratio test)
+    video_early_exit: bool = True
+    video_sprt_alpha: float = 0.05
+    video_sprt_beta: float = 0.05
+    video_sprt_min_frames: int = 3
+    
+    # Video face ROI: crop frames to the tracked face before scoring
+    video_face_roi: bool = True
+    video_roi_working_size: int = 480  # Longest side frames are decoded at for cropping
+    
+    # Video audio track: scored concurrently with frames and fused into the verdict
+    video_audio_track: bool = True
+    video_audio_weight: float = 0.6  # How far a more suspicious voice pulls the score up
+    video_audio_workers: int = 2  # Threads in the analyzing process, shared by all videos
+    video_audio_timeout_seconds: float = 20.0  # Wait for the audio track once frames are scored
+    
+    # Segmented long-video analysis (/analyze/video/segments)
+    video_segment_seconds: float = 10.0
+    max_segmented_video_duration_seconds: int = 900
+    
+    # Distributed video analysis: Celery fan-out over time ranges
+    video_fanout_range_seconds: float = 10.0
+    
+    # Async job API (/jobs)
+    job_ttl_seconds: int = 3600  # How long job status and results are kept
+    job_max_wait_seconds: float = 30.0  # Longest long-poll on GET /jobs/{id}
+    job_poll_interval_seconds: float = 0.5
+    job_webhook_timeout_seconds: float = 10.0
+    job_callback_allowed_hosts: str = ""  # Comma-separated; empty = any host with public addresses
+    
+    # Priority lanes: one Celery queue per modality and priority ("interactive" or "bulk")
+    job_default_priority: str = "interactive"
+    lane_wait_samples: int = 1000  # Recent queue waits kept per lane for percentiles
+    
+    # Worker autoscaler (python -m app.workers.autoscaler): resizes worker pools
+    autoscale_min_processes: int = 1
+    autoscale_max_processes: int = 8
+    autoscale_tasks_per_process: float = 1.0  # Queued + running tasks per process at the target size
+    autoscale_max_wait_seconds: float = 10.0  # Add a process while a lane's oldest task waits longer
+    autoscale_step: int = 2  # Most processes added per step (removed: 1)
+    autoscale_scale_down_delay_seconds: float = 60.0  # Demand must stay low this long before shrinking
+    autoscale_interval_seconds: float = 5.0
+    autoscale_inspect_timeout_seconds: float = 1.0
+    
+    # Streaming audio (WebSocket)
+    stream_window_seconds: float = 6.0
+    stream_hop_seconds: float = 1.0
+    stream_max_pending_windows: int = 4
+    stream_window_timeout_seconds: float = 2.0
+    stream_max_session_seconds: int = 3600
+    
+    # Known-clip fingerprint index (robocalls, cloned voices)
+    fingerprint_index_dir: Path = Path("/app/models/fingerprints")
+    
+    @property
+    def cors_origins_list(self) -> List[str]:
+        """Parse CORS origins from comma-separated string."""
+        return [origin.strip() for origin in self.cors_origins.split(",")]
+    
+    @property
+    def job_callback_allowed_hosts_list(self) -> List[str]:
+        """Parse allowed callback hosts from comma-separated string."""
+        return [host.strip().lower() for host in self.job_callback_allowed_hosts.split(",") if host.strip()]
+    
+    class Config:
+        env_file = ".env"
+        env_file_encoding = "utf-8"
+
+
+# Global settings instance
+settings = Settings()
+
+# Ensure upload directory exists
+settings.upload_dir.mkdir(parents=True, exist_ok=True)
@@ -1,89 +1,99 @@
-"""
-Sentinel AI - FastAPI Main Application
-Entry point for the backend API.
-"""
-import asyncio
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-
-from app.config import settings
-from app.api.routes import text, audio, image, video
-from app.utils.file_handler import cleanup_old_files
-
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """
-    Application lifespan handler.
-    Handles startup and shutdown events.
-    """
-    # Startup: Initialize resources
-    print("🚀 Sentinel AI starting up...")
-    print(f"📁 Upload directory: {settings.upload_dir}")
-    
-    # Start background cleanup task
-    cleanup_task = asyncio.create_task(periodic_cleanup())
-    
-    yield
-    
-    # Shutdown: Cleanup resources
-    print("👋 Sentinel AI shutting down...")
-    cleanup_task.cancel()
-    try:
-        await cleanup_task
-    except asyncio.CancelledError:
-        pass
-
-
-async def periodic_cleanup():
-    """Periodically clean up old uploaded files."""
-    while True:
-        await asyncio.sleep(60)  # Run every minute
-        cleanup_old_files()
-
-
-# Create FastAPI application
-app = FastAPI(
-    title="Sentinel AI",
-    description="AI-powered content analysis for detecting deepfakes and scams",
-    version="1.0.0",
-    lifespan=lifespan
-)
-
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins_list,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-# Register API routes
-app.include_router(text.router, prefix="/analyze", tags=["Analysis"])
-app.include_router(audio.router, prefix="/analyze", tags=["Analysis"])
-app.include_router(image.router, prefix="/analyze", tags=["Analysis"])
-app.include_router(video.router, prefix="/analyze", tags=["Analysis"])
-
-
-@app.get("/health")
-async def health_check():
-    """Health check endpoint for Docker."""
-    return {"status": "healthy", "service": "sentinel-ai"}
-
-
-@app.get("/")
-async def root():
-    """Root endpoint with API info."""
-    return {
-        "name": "Sentinel AI",
-        "version": "1.0.0",
-        "description": "Check if content is AI-generated or a scam",
-        "endpoints": {
-            "text": "POST /analyze/text",
-            "audio": "POST /analyze/audio",
-            "image": "POST /analyze/image",
-            "video": "POST /analyze/video"
-        }
-    }
+"""
+Sentinel AI - FastAPI Main Application
+Entry point for the backend API.
+"""
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from app.config import settings
+from app.api.routes import text, audio, image, video, stream, metrics, jobs, uploads
+from app.models.inference_pool import start_inference_pool, stop_inference_pool
+from app.utils.janitor import get_janitor
+from app.utils.upload_guard import UploadGuardMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan handler.
+    Handles startup and shutdown events.
+    """
+    # Startup: Initialize resources
+    print("🚀 Sentinel AI starting up...")
+    print(f"📁 Upload directory: {settings.upload_dir}")
+    
+    # Start inference processes (falls back to in-process analysis)
+    try:
+        start_inference_pool()
+    except Exception as e:
+        print(f"Inference pool failed to start, analyzing in-process: {e}")
+    
+    # Start deleting expired uploads (scans the upload directory once)
+    get_janitor().start()
+    
+    yield
+    
+    # Shutdown: Cleanup resources
+    print("👋 Sentinel AI shutting down...")
+    get_janitor().stop()
+    stop_inference_pool()
+
+
+# Create FastAPI application
+app = FastAPI(
+    title="Sentinel AI",
+    description="AI-powered content analysis for detecting deepfakes and scams",
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+# Reject oversized or mislabeled uploads before their bodies are read
+# (added first so CORS headers still wrap its responses)
+app.add_middleware(UploadGuardMiddleware)
+
+# Configure CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.cors_origins_list,
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Register API routes
+app.include_router(text.router, prefix="/analyze", tags=["Analysis"])
+app.include_router(audio.router, prefix="/analyze", tags=["Analysis"])
+app.include_router(image.router, prefix="/analyze", tags=["Analysis"])
+app.include_router(video.router, prefix="/analyze", tags=["Analysis"])
+app.include_router(stream.router, prefix="/analyze", tags=["Streaming"])
+app.include_router(jobs.router, prefix="/jobs", tags=["Jobs"])
+app.include_router(uploads.router, prefix="/uploads", tags=["Uploads"])
+app.include_router(metrics.router, prefix="/metrics", tags=["Metrics"])
+
+
+@app.get("/health")
+async def health_check():
+    """Health check endpoint for Docker."""
+    return {"status": "healthy", "service": "sentinel-ai"}
+
+
+@app.get("/")
+async def root():
+    """Root endpoint with API info."""
+    return {
+        "name": "Sentinel AI",
+        "version": "1.0.0",
+        "description": "Check if content is AI-generated or a scam",
+        "endpoints": {
+            "text": "POST /analyze/text",
+            "audio": "POST /analyze/audio",
+            "image": "POST /analyze/image",
+            "video": "POST /analyze/video",
+            "video_segments": "POST /analyze/video/segments",
+            "audio_stream": "WS /analyze/audio/stream",
+            "jobs": "POST /jobs/{audio|video}, POST /jobs/{audio|video}/object, GET /jobs/{job_id}",
+            "uploads": "POST /uploads, PATCH/HEAD /uploads/{upload_id}, POST /uploads/{upload_id}/finalize",
+            "presigned_uploads": "POST /uploads/presigned"
+        }
+    }
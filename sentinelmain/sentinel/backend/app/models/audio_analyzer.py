@@ -1,117 +1,395 @@
-"""
-Sentinel AI - Audio Analyzer
-Voice spoof detection for identifying TTS and voice cloning.
-Uses mock inference for demonstration - replace with trained model.
-"""
-import random
-from pathlib import Path
-from typing import Dict, Optional
-
-
-class AudioAnalyzer:
-    """
-    Audio analysis model for detecting voice spoofing.
-    
-    In production, this would use wav2vec2 features + CNN classifier.
-    Currently uses placeholder logic for demonstration.
-    """
-    
-    def __init__(self):
-        """Initialize the audio analyzer."""
-        self.loaded = True
-        self.sample_rate = 16000  # Expected sample rate
-    
-    def _get_audio_duration(self, file_path: Path) -> float:
-        """
-        Get audio duration in seconds.
-        
-        Args:
-            file_path: Path to audio file
-            
-        Returns:
-            Duration in seconds
-        """
-        try:
-            import librosa
-            duration = librosa.get_duration(path=str(file_path))
-            return duration
-        except Exception:
-            # Fallback: estimate from file size
-            size = file_path.stat().st_size
-            # Rough estimate: ~150KB per second for compressed audio
-            return size / (150 * 1024)
-    
-    def _extract_features(self, file_path: Path) -> Optional[Dict]:
-        """
-        Extract audio features for analysis.
-        
-        In production, this would use wav2vec2 for feature extraction.
-        """
-        try:
-            import librosa
-            import numpy as np
-            
-            # Load audio
-            y, sr = librosa.load(str(file_path), sr=self.sample_rate)
-            
-            # Extract basic features
-            features = {
-                "duration": len(y) / sr,
-                "rms_energy": float(np.sqrt(np.mean(y ** 2))),
-                "zero_crossing_rate": float(np.mean(librosa.feature.zero_crossing_rate(y))),
-                "spectral_centroid": float(np.mean(librosa.feature.spectral_centroid(y=y, sr=sr))),
-            }
-            
-            return features
-        except Exception as e:
-            print(f"Feature extraction failed: {e}")
-            return None
-    
-    def analyze(self, file_path: Path) -> Dict:
-        """
-        Analyze audio for voice spoofing.
-        
-        Args:
-            file_path: Path to audio file
-            
-        Returns:
-            Dict with analysis results
-        """
-        duration = self._get_audio_duration(file_path)
-        features = self._extract_features(file_path)
-        
-        # Mock inference with some variance based on features
-        base_human = 0.7
-        base_tts = 0.2
-        base_clone = 0.1
-        
-        if features:
-            # Adjust based on audio characteristics
-            # TTS tends to have more consistent energy
-            if features.get("rms_energy", 0) > 0.1:
-                base_human += 0.1
-            
-            # Add controlled randomness for demonstration
-            noise = random.uniform(-0.15, 0.15)
-            base_human = max(0.1, min(0.95, base_human + noise))
-            base_tts = max(0.05, min(0.9, 1 - base_human - 0.1 + random.uniform(-0.1, 0.1)))
-            base_clone = max(0.0, 1 - base_human - base_tts)
-        
-        return {
-            "human_voice": base_human,
-            "tts_likelihood": base_tts,
-            "voice_cloning": base_clone,
-            "duration_seconds": duration
-        }
-
-
-# Singleton instance
-_analyzer = None
-
-
-def get_audio_analyzer() -> AudioAnalyzer:
-    """Get or create the audio analyzer instance."""
-    global _analyzer
-    if _analyzer is None:
-        _analyzer = AudioAnalyzer()
-    return _analyzer
+"""
+Sentinel AI - Audio Analyzer
+Voice spoof detection for identifying TTS and voice cloning.
+Uses mock inference for demonstration - replace with trained model.
+"""
+import random
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple, Union
+
+from app.config import settings
+from app.models.audio_fingerprint import KNOWN_CLIP_LABELS, MATCH_VERSION, get_fingerprint_index
+from app.models.onnx_audio import get_onnx_audio_backend
+from app.utils.upload_store import content_digest
+from app.utils.result_cache import array_digest, seeded_random
+
+
+class AudioAnalyzer:
+    """
+    Audio analysis model for detecting voice spoofing.
+    
+    Uses the exported wav2vec2 features + CNN classifier through the
+    batched ONNX backend when a model is deployed, and placeholder logic
+    for demonstration otherwise.
+    
+    Known robocall and cloned-voice clips are matched by fingerprint
+    first. Otherwise a voice activity detection (VAD) stage runs so that
+    silence, hold music and line noise never reach the feature and model
+    stages.
+    """
+    
+    def __init__(self):
+        """Initialize the audio analyzer."""
+        self.loaded = True
+        self.sample_rate = 16000  # Expected sample rate
+        
+        # Voice activity detection (25 ms frames, 10 ms hop at 16 kHz)
+        self.vad_frame_length = 400
+        self.vad_hop_length = 160
+        self.vad_energy_floor_db = -35.0  # Relative to the loudest frame
+        self.vad_max_flatness = 0.45  # Flatter spectra are noise, not speech
+        self.vad_hangover_frames = 15  # Keep ~150 ms around voiced frames
+    
+    @property
+    def model_version(self) -> str:
+        """
+        Version of the scoring model, part of the result cache key.
+        
+        Also covers the VAD parameters, the padding buckets and the number
+        of known clips enrolled, all of which change scores.
+        """
+        backend = get_onnx_audio_backend()
+        if backend is not None:
+            buckets = ",".join(f"{b:g}" for b in backend.bucket_seconds)
+            version = f"onnx-{backend.model_path.name}-pad{buckets}"
+        else:
+            version = "mock-1"
+        vad = (
+            f"vad{self.vad_frame_length}_{self.vad_hop_length}_{self.vad_energy_floor_db:g}"
+            f"_{self.vad_max_flatness:g}_{self.vad_hangover_frames}"
+        )
+        return f"{version}-{vad}-known{len(get_fingerprint_index())}v{MATCH_VERSION}"
+    
+    def _get_audio_duration(self, file_path: Union[Path, BinaryIO]) -> float:
+        """
+        Get audio duration in seconds.
+        
+        Args:
+            file_path: Path to audio file, or an in-memory upload
+            
+        Returns:
+            Duration in seconds
+        """
+        try:
+            import librosa
+            if not isinstance(file_path, (str, Path)):
+                raise TypeError("not a path")
+            duration = librosa.get_duration(path=str(file_path))
+            return duration
+        except Exception:
+            # Fallback: estimate from file size
+            if isinstance(file_path, (str, Path)):
+                size = Path(file_path).stat().st_size
+            else:
+                size = file_path.seek(0, 2)
+            # Rough estimate: ~150KB per second for compressed audio
+            return size / (150 * 1024)
+    
+    def _load_audio(self, file_path: Union[Path, BinaryIO]):
+        """
+        Decode audio to mono float samples at the model sample rate.
+        
+        Args:
+            file_path: Path to audio file, or an in-memory upload
+        
+        Returns:
+            Sample array or None if decoding failed
+        """
+        try:
+            import librosa
+            
+            if not isinstance(file_path, (str, Path)):
+                return self._load_audio_buffer(file_path)
+            
+            y, _ = librosa.load(str(file_path), sr=self.sample_rate)
+            return y
+        except Exception as e:
+            print(f"Audio loading failed: {e}")
+            return None
+    
+    def _load_audio_buffer(self, buffer: BinaryIO):
+        """
+        Decode an in-memory upload without writing it to disk.
+        
+        soundfile decodes WAV, FLAC, OGG and MP3 straight from the buffer.
+        Containers it cannot read from a stream (M4A) are spilled to a
+        temporary file for librosa's audioread fallback.
+        
+        Returns:
+            Mono float samples at the model sample rate
+        """
+        import librosa
+        import soundfile as sf
+        
+        try:
+            data, sr = sf.read(buffer, dtype="float32", always_2d=True)
+        except Exception:
+            import shutil
+            import tempfile
+            
+            buffer.seek(0)
+            with tempfile.NamedTemporaryFile(dir=settings.upload_dir) as spill:
+                shutil.copyfileobj(buffer, spill)
+                spill.flush()
+                y, _ = librosa.load(spill.name, sr=self.sample_rate)
+            return y
+        
+        y = data.mean(axis=1)
+        if sr != self.sample_rate:
+            y = librosa.resample(y, orig_sr=sr, target_sr=self.sample_rate)
+        return y
+    
+    def _frame_power(self, y):
+        """
+        Split audio into overlapping frames and compute their power spectra.
+        
+        The power spectra are shared by every VAD statistic: frame energy is
+        their sum (Parseval) and spectral flatness is their geometric over
+        arithmetic mean, so the signal is transformed exactly once.
+        
+        Returns:
+            Array of shape (n_bins, n_frames)
+        """
+        import numpy as np
+        
+        frame_length = self.vad_frame_length
+        hop = self.vad_hop_length
+        
+        if len(y) < frame_length:
+            y = np.pad(y, (0, frame_length - len(y)))
+        
+        n_frames = 1 + (len(y) - frame_length) // hop
+        frames = np.lib.stride_tricks.as_strided(
+            y,
+            shape=(frame_length, n_frames),
+            strides=(y.strides[0], y.strides[0] * hop),
+            writeable=False
+        )
+        window = np.hanning(frame_length).astype(y.dtype)[:, None]
+        spectrum = np.fft.rfft(frames * window, axis=0)
+        return spectrum.real ** 2 + spectrum.imag ** 2
+    
+    def _detect_voice_activity(self, y) -> Tuple:
+        """
+        Find voiced regions using frame energy and spectral flatness.
+        
+        Args:
+            y: Mono audio samples
+            
+        Returns:
+            Tuple of (voiced_samples, voiced_frame_energies, speech_ratio)
+        """
+        import numpy as np
+        
+        eps = 1e-10
+        power = self._frame_power(y)
+        
+        energy = power.sum(axis=0)
+        energy_db = 10 * np.log10(energy + eps)
+        flatness = np.exp(np.mean(np.log(power + eps), axis=0)) / (power.mean(axis=0) + eps)
+        
+        active = (energy_db > energy_db.max() + self.vad_energy_floor_db) & \
+                 (flatness < self.vad_max_flatness)
+        
+        # Hangover: extend each voiced frame so word edges are not clipped
+        if active.any() and self.vad_hangover_frames > 0:
+            # Centre of the full convolution; mode="same" breaks on clips shorter than the kernel
+            hangover = self.vad_hangover_frames
+            kernel = np.ones(2 * hangover + 1)
+            active = np.convolve(active.astype(float), kernel)[hangover:hangover + len(active)] > 0
+        
+        # Mean squared amplitude per frame (one-sided spectrum, Hann window)
+        window_power = np.sum(np.hanning(self.vad_frame_length) ** 2)
+        mean_square = 2 * energy / (self.vad_frame_length * window_power)
+        
+        speech_ratio = float(active.mean())
+        if not active.any():
+            return y[:0], mean_square[:0], 0.0
+        
+        # Convert frame runs into sample ranges and gather them in one pass
+        edges = np.diff(np.concatenate(([0], active.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1) * self.vad_hop_length
+        ends = np.minimum(
+            (np.flatnonzero(edges == -1) - 1) * self.vad_hop_length + self.vad_frame_length,
+            len(y)
+        )
+        voiced = np.concatenate([y[s:e] for s, e in zip(starts, ends)])
+        
+        return voiced, mean_square[active], speech_ratio
+    
+    def _extract_features(self, y, frame_energies) -> Optional[Dict]:
+        """
+        Extract audio features for analysis.
+        
+        Only voiced samples are passed in. In production, this would use
+        wav2vec2 for feature extraction.
+        """
+        try:
+            import librosa
+            import numpy as np
+            
+            sr = self.sample_rate
+            
+            # Extract basic features
+            features = {
+                "duration": len(y) / sr,
+                "rms_energy": float(np.sqrt(np.mean(frame_energies))),
+                "zero_crossing_rate": float(np.mean(librosa.feature.zero_crossing_rate(y))),
+                "spectral_centroid": float(np.mean(librosa.feature.spectral_centroid(y=y, sr=sr))),
+            }
+            
+            return features
+        except Exception as e:
+            print(f"Feature extraction failed: {e}")
+            return None
+    
+    def _infer(self, features: Optional[Dict], rng: Optional[random.Random] = None) -> Dict:
+        """
+        Score extracted features.
+        
+        Args:
+            features: Extracted features, or None to score without them
+            rng: Random generator for the mock scores
+        
+        Returns:
+            Dict with human_voice, tts_likelihood and voice_cloning scores
+        """
+        # Mock inference with some variance based on features
+        base_human = 0.7
+        base_tts = 0.2
+        base_clone = 0.1
+        
+        rng = rng or random
+        
+        if features:
+            # Adjust based on audio characteristics
+            # TTS tends to have more consistent energy
+            if features.get("rms_energy", 0) > 0.1:
+                base_human += 0.1
+            
+            # Add controlled randomness for demonstration
+            noise = rng.uniform(-0.15, 0.15)
+            base_human = max(0.1, min(0.95, base_human + noise))
+            base_tts = max(0.05, min(0.9, 1 - base_human - 0.1 + rng.uniform(-0.1, 0.1)))
+            base_clone = max(0.0, 1 - base_human - base_tts)
+        
+        return {
+            "human_voice": base_human,
+            "tts_likelihood": base_tts,
+            "voice_cloning": base_clone
+        }
+    
+    def _known_clip_result(self, match: Dict) -> Dict:
+        """Build scores for a fingerprint match against a known clip."""
+        confidence = match["confidence"]
+        result = {
+            "human_voice": 1 - confidence,
+            "tts_likelihood": 0.0,
+            "voice_cloning": 0.0
+        }
+        result[KNOWN_CLIP_LABELS[match["label"]]] = confidence
+        return result
+    
+    def lookup_known_clip(self, y) -> Optional[Dict]:
+        """
+        Look up audio in the known-clip fingerprint index.
+        
+        Returns:
+            Match dict or None
+        """
+        try:
+            return get_fingerprint_index().lookup(y)
+        except Exception as e:
+            print(f"Fingerprint lookup failed: {e}")
+            return None
+    
+    def analyze_samples(self, y, check_known: bool = True, cache_key: Optional[str] = None) -> Dict:
+        """
+        Analyze decoded audio samples for voice spoofing.
+        
+        Args:
+            y: Mono float samples at ``self.sample_rate``
+            check_known: Look up the known-clip index first
+            cache_key: Content digest seeding the mock scores (defaults to
+                a digest of the samples)
+            
+        Returns:
+            Dict with analysis results
+        """
+        total_samples = len(y)
+        
+        # Known clip: answer from the index, skip features and inference
+        match = self.lookup_known_clip(y) if check_known else None
+        
+        if match:
+            result = self._known_clip_result(match)
+            result.update({
+                "duration_seconds": total_samples / self.sample_rate,
+                "speech_ratio": None,
+                "compute_saved": None,
+                "known_clip": match["clip"]
+            })
+            return result
+        
+        voiced, frame_energies, speech_ratio = self._detect_voice_activity(y)
+        backend = get_onnx_audio_backend()
+        
+        if len(voiced) == 0:
+            result = self._infer(None)
+        elif backend is not None:
+            # The exported model computes its own wav2vec2 features
+            result = backend.infer(voiced)
+        else:
+            rng = seeded_random(cache_key or array_digest(y))
+            result = self._infer(self._extract_features(voiced, frame_energies), rng)
+        result.update({
+            "duration_seconds": total_samples / self.sample_rate,
+            "speech_ratio": speech_ratio,
+            "compute_saved": 1 - len(voiced) / total_samples if total_samples else 0.0,
+            "known_clip": None
+        })
+        return result
+    
+    def analyze(self, file_path: Union[Path, BinaryIO], cache_key: Optional[str] = None) -> Dict:
+        """
+        Analyze audio for voice spoofing.
+        
+        Args:
+            file_path: Path to audio file, or an in-memory upload
+            cache_key: Content digest of the upload (derived from stored
+                uploads when omitted)
+            
+        Returns:
+            Dict with analysis results
+        """
+        if isinstance(file_path, (str, Path)):
+            cache_key = cache_key or content_digest(file_path)
+        
+        y = self._load_audio(file_path)
+        
+        if y is None:
+            # Could not decode: score without features
+            result = self._infer(None)
+            result.update({
+                "duration_seconds": self._get_audio_duration(file_path),
+                "speech_ratio": None,
+                "compute_saved": None,
+                "known_clip": None
+            })
+        else:
+            result = self.analyze_samples(y, cache_key=cache_key)
+        
+        result["cache_key"] = cache_key
+        return result
+
+
+# Singleton instance
+_analyzer = None
+
+
+def get_audio_analyzer() -> AudioAnalyzer:
+    """Get or create the audio analyzer instance."""
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = AudioAnalyzer()
+    return _analyzer
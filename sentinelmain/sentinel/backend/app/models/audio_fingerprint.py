@@ -0,0 +1,369 @@
+"""
+Sentinel AI - Audio Fingerprint Index
+Spectral-peak fingerprints of known robocall and cloned-voice clips.
+Re-encoded copies of a known clip are matched without running the model.
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.config import settings
+
+
+# Bumped whenever hashing or match scoring changes; part of the audio model version
+MATCH_VERSION = 2
+
+# Labels a known clip can carry, mapped to the audio score they flag
+KNOWN_CLIP_LABELS = {
+    "tts": "tts_likelihood",
+    "voice_clone": "voice_cloning"
+}
+
+
+class AudioFingerprinter:
+    """
+    Landmark fingerprinter in the style of constellation-map matching.
+    
+    Spectrogram peaks are paired with the next few peaks in time and each
+    pair is packed into a 32-bit hash of (anchor bin, target bin, time delta).
+    The hashes survive re-encoding, resampling and moderate noise.
+    """
+    
+    def __init__(self, sample_rate: int = 16000):
+        """Initialize the fingerprinter."""
+        self.sample_rate = sample_rate
+        self.n_fft = 1024
+        self.hop_length = 256  # 16 ms at 16 kHz
+        self.max_bin = 256  # Keep 0-4 kHz, where telephone audio lives
+        self.neighborhood = (15, 11)  # (freq bins, frames) for local maxima
+        self.peaks_per_second = 12
+        self.fan_out = 4
+        self.max_delta = 63  # Frames, fits 8 bits
+    
+    def _find_peaks(self, y):
+        """
+        Find spectrogram peaks.
+        
+        Returns:
+            Tuple of (frames, bins) arrays sorted by frame
+        """
+        import numpy as np
+        from scipy.ndimage import maximum_filter
+        
+        if len(y) < self.n_fft:
+            y = np.pad(y, (0, self.n_fft - len(y)))
+        
+        n_frames = 1 + (len(y) - self.n_fft) // self.hop_length
+        frames = np.lib.stride_tricks.as_strided(
+            y,
+            shape=(self.n_fft, n_frames),
+            strides=(y.strides[0], y.strides[0] * self.hop_length),
+            writeable=False
+        )
+        window = np.hanning(self.n_fft).astype(y.dtype)[:, None]
+        spectrum = np.abs(np.fft.rfft(frames * window, axis=0))[:self.max_bin]
+        log_spec = np.log(spectrum + 1e-6)
+        
+        # Local maxima; the onset test drops plateau frames of steady tones
+        onset = np.ones_like(log_spec, dtype=bool)
+        onset[:, 1:] = log_spec[:, 1:] > log_spec[:, :-1]
+        is_peak = (log_spec == maximum_filter(log_spec, size=self.neighborhood)) & \
+                  (log_spec > log_spec.mean()) & onset
+        bins, times = np.nonzero(is_peak)
+        
+        # Keep the strongest peaks in each one-second block so hash density
+        # is even over time and independent of loudness
+        frames_per_block = max(1, self.sample_rate // self.hop_length)
+        blocks = times // frames_per_block
+        order = np.lexsort((-log_spec[bins, times], blocks))
+        bins, times, blocks = bins[order], times[order], blocks[order]
+        block_start = np.searchsorted(blocks, blocks, side="left")
+        keep = (np.arange(len(blocks)) - block_start) < self.peaks_per_second
+        bins, times = bins[keep], times[keep]
+        
+        order = np.lexsort((bins, times))
+        return times[order], bins[order]
+    
+    def fingerprint(self, y):
+        """
+        Compute landmark hashes for an audio signal.
+        
+        Args:
+            y: Mono float samples at ``self.sample_rate``
+        
+        Returns:
+            Tuple of (hashes, anchor_frames) as uint32 arrays
+        """
+        import numpy as np
+        
+        times, bins = self._find_peaks(y)
+        hashes = []
+        anchors = []
+        
+        # Pair every peak with the next ``fan_out`` peaks, one shift at a time
+        for k in range(1, self.fan_out + 1):
+            if len(times) <= k:
+                break
+            delta = times[k:] - times[:-k]
+            valid = (delta > 0) & (delta <= self.max_delta)
+            f1 = bins[:-k][valid].astype(np.uint32)
+            f2 = bins[k:][valid].astype(np.uint32)
+            hashes.append((f1 << 16) | (f2 << 8) | delta[valid].astype(np.uint32))
+            anchors.append(times[:-k][valid].astype(np.uint32))
+        
+        if not hashes:
+            return np.empty(0, np.uint32), np.empty(0, np.uint32)
+        return np.concatenate(hashes), np.concatenate(anchors)
+
+
+class FingerprintIndex:
+    """
+    Inverted hash index of known-scam clips.
+    
+    Postings are kept as three parallel arrays sorted by hash, so a lookup
+    is a binary search per query hash. The arrays are persisted as ``.npy``
+    files and memory-mapped on load, which keeps resident memory flat and
+    lets every worker process share the same page cache as the index grows
+    to hundreds of thousands of clips. New clips are buffered and merged in
+    on ``save``.
+    """
+    
+    def __init__(self, index_dir: Path, sample_rate: int = 16000):
+        """Initialize the index, loading it from disk if present."""
+        import numpy as np
+        
+        self.index_dir = Path(index_dir)
+        self.fingerprinter = AudioFingerprinter(sample_rate)
+        self.min_aligned_hashes = 8  # Votes a match needs above the chance level
+        self.offset_tolerance = 2  # Frames of offset jitter counted as the same alignment
+        self.max_postings = 2000  # Ignore hashes that are too common to help
+        
+        self._lock = threading.Lock()
+        self._clips: List[Dict] = []
+        self._hashes = np.empty(0, np.uint32)
+        self._clip_ids = np.empty(0, np.uint32)
+        self._offsets = np.empty(0, np.uint32)
+        self._pending: List = []
+        
+        self.load()
+    
+    def __len__(self) -> int:
+        return len(self._clips)
+    
+    def load(self):
+        """Load a persisted index, memory-mapping the posting arrays."""
+        import numpy as np
+        
+        clips_path = self.index_dir / "clips.json"
+        if not clips_path.exists():
+            return
+        
+        try:
+            with open(clips_path, "r", encoding="utf-8") as f:
+                clips = json.load(f)
+            hashes = np.load(self.index_dir / "hashes.npy", mmap_mode="r")
+            clip_ids = np.load(self.index_dir / "clip_ids.npy", mmap_mode="r")
+            offsets = np.load(self.index_dir / "offsets.npy", mmap_mode="r")
+        except Exception as e:
+            print(f"Fingerprint index loading failed: {e}")
+            return
+        
+        with self._lock:
+            self._clips = clips
+            self._hashes, self._clip_ids, self._offsets = hashes, clip_ids, offsets
+            self._pending = []
+        print(f"🔎 Loaded {len(clips)} known audio clips")
+    
+    def add_clip(self, name: str, label: str, y) -> int:
+        """
+        Add a known clip to the index.
+        
+        Args:
+            name: Clip identifier reported on match
+            label: One of ``KNOWN_CLIP_LABELS``
+            y: Mono float samples
+        
+        Returns:
+            Number of hashes added
+        """
+        import numpy as np
+        
+        if label not in KNOWN_CLIP_LABELS:
+            raise ValueError(f"Unknown clip label: {label}")
+        
+        hashes, anchors = self.fingerprinter.fingerprint(y)
+        with self._lock:
+            clip_id = len(self._clips)
+            self._clips.append({"name": name, "label": label})
+            self._pending.append((hashes, np.full(len(hashes), clip_id, np.uint32), anchors))
+        return len(hashes)
+    
+    def _merge_pending(self):
+        """Merge buffered clips into the sorted posting arrays. Caller holds the lock."""
+        import numpy as np
+        
+        if not self._pending:
+            return
+        
+        hashes = np.concatenate([self._hashes] + [p[0] for p in self._pending])
+        clip_ids = np.concatenate([self._clip_ids] + [p[1] for p in self._pending])
+        offsets = np.concatenate([self._offsets] + [p[2] for p in self._pending])
+        order = np.argsort(hashes, kind="stable")
+        
+        self._hashes = hashes[order]
+        self._clip_ids = clip_ids[order]
+        self._offsets = offsets[order]
+        self._pending = []
+    
+    def save(self):
+        """Merge pending clips and persist the index atomically."""
+        import numpy as np
+        
+        with self._lock:
+            self._merge_pending()
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            
+            arrays = {
+                "hashes.npy": self._hashes,
+                "clip_ids.npy": self._clip_ids,
+                "offsets.npy": self._offsets
+            }
+            for filename, array in arrays.items():
+                tmp_path = self.index_dir / f".{filename}.tmp"
+                with open(tmp_path, "wb") as f:
+                    np.save(f, np.ascontiguousarray(array))
+                os.replace(tmp_path, self.index_dir / filename)
+            
+            # Metadata last: a crash mid-save never points at missing postings
+            tmp_path = self.index_dir / ".clips.json.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._clips, f)
+            os.replace(tmp_path, self.index_dir / "clips.json")
+        
+        self.load()
+    
+    def lookup(self, y) -> Optional[Dict]:
+        """
+        Match audio against the known clips.
+        
+        Args:
+            y: Mono float samples
+        
+        Returns:
+            Dict with clip name, label and confidence, or None if no match
+        """
+        if not self._clips:
+            return None
+        
+        query_hashes, query_offsets = self.fingerprinter.fingerprint(y)
+        return self.best_match(self.match_keys(query_hashes, query_offsets))
+    
+    def match_keys(self, query_hashes, query_offsets):
+        """
+        Find the postings of query hashes.
+        
+        Args:
+            query_hashes: Hashes from ``AudioFingerprinter.fingerprint``
+            query_offsets: Their anchor frames
+        
+        Returns:
+            int64 array with one (clip id, time offset) key per posting hit
+        """
+        import numpy as np
+        
+        with self._lock:
+            self._merge_pending()
+            index_hashes, index_clips, index_offsets = self._hashes, self._clip_ids, self._offsets
+        
+        if len(query_hashes) == 0 or len(index_hashes) == 0:
+            return np.empty(0, np.int64)
+        
+        lo = np.searchsorted(index_hashes, query_hashes, side="left")
+        hi = np.searchsorted(index_hashes, query_hashes, side="right")
+        counts = hi - lo
+        usable = (counts > 0) & (counts <= self.max_postings)
+        if not usable.any():
+            return np.empty(0, np.int64)
+        
+        # Expand every [lo, hi) range into posting positions without a Python loop
+        lo, counts, query_offsets = lo[usable], counts[usable], query_offsets[usable]
+        starts = np.repeat(lo - np.cumsum(counts) + counts, counts)
+        positions = starts + np.arange(counts.sum())
+        
+        clip_ids = np.asarray(index_clips[positions], dtype=np.int64)
+        deltas = np.asarray(index_offsets[positions], dtype=np.int64) - \
+            np.repeat(np.asarray(query_offsets, dtype=np.int64), counts)
+        return (clip_ids << 32) | (deltas & 0xFFFFFFFF)
+    
+    def best_match(self, keys) -> Optional[Dict]:
+        """
+        Pick the clip most query hashes agree on.
+        
+        Hashes of unrelated audio still hit the index and pile up on some
+        (clip, offset) pairs by chance, more so as the index grows. The
+        best pair away from the winner measures that chance level for this
+        query and index. A match must beat it by ``min_aligned_hashes``
+        votes, and every further ``min_aligned_hashes`` votes above it cut
+        the odds that the match is chance by a factor of e.
+        
+        Args:
+            keys: Keys from ``match_keys``, possibly pooled over several calls
+        
+        Returns:
+            Dict with clip name, label and confidence, or None if no match
+        """
+        import math
+        import numpy as np
+        
+        if len(keys) == 0:
+            return None
+        
+        # A true match has many hashes agreeing on one clip and one time offset
+        unique_keys, votes = np.unique(keys, return_counts=True)
+        best = int(np.argmax(votes))
+        
+        # Offsets next to the winner's are its own timing jitter, not chance
+        clip_ids = unique_keys >> 32
+        offsets = (unique_keys & 0xFFFFFFFF).astype(np.uint32).view(np.int32).astype(np.int64)
+        own = (clip_ids == clip_ids[best]) & (np.abs(offsets - offsets[best]) <= self.offset_tolerance)
+        aligned = int(votes[own].sum())
+        chance = int(votes[~own].max()) if not own.all() else 0
+        
+        excess = aligned - chance
+        if excess < self.min_aligned_hashes:
+            return None
+        
+        clip = self._clips[int(clip_ids[best])]
+        return {
+            "clip": clip["name"],
+            "label": clip["label"],
+            "confidence": min(0.99, 1 - math.exp(-excess / self.min_aligned_hashes))
+        }
+
+
+# Singleton instance
+_index = None
+
+
+def get_fingerprint_index() -> FingerprintIndex:
+    """Get or create the fingerprint index instance."""
+    global _index
+    if _index is None:
+        _index = FingerprintIndex(settings.fingerprint_index_dir)
+    return _index
+
+
+if __name__ == "__main__":
+    # Enroll known clips: python -m app.models.audio_fingerprint tts call1.wav call2.mp3
+    import sys
+    import librosa
+    
+    label, paths = sys.argv[1], sys.argv[2:]
+    index = get_fingerprint_index()
+    for path in paths:
+        y, _ = librosa.load(path, sr=index.fingerprinter.sample_rate)
+        added = index.add_clip(Path(path).name, label, y)
+        print(f"Added {path} ({added} hashes)")
+    index.save()
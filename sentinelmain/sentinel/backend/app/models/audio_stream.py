@@ -0,0 +1,216 @@
+"""
+Sentinel AI - Streaming Audio Session
+Rolling-window voice spoof scoring for live calls.
+"""
+from collections import deque
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.models.audio_analyzer import AudioAnalyzer
+from app.models.audio_fingerprint import get_fingerprint_index
+
+
+class AudioStreamSession:
+    """
+    Per-connection state for streaming audio analysis.
+    
+    Audio arrives in arbitrary-sized PCM chunks and is cut into fixed hops.
+    Each new hop is scored once (with a little left context) and the hop
+    scores are pooled over a rolling window, so the cost of an update does
+    not grow with the window length. Known-clip lookups work the same way:
+    only audio not fingerprinted yet is hashed and matched, and the matches
+    of the window's hops are pooled.
+    """
+    
+    def __init__(self, analyzer: AudioAnalyzer, input_rate: int = 16000):
+        """
+        Initialize a streaming session.
+        
+        Args:
+            analyzer: Shared audio analyzer
+            input_rate: Sample rate of the incoming PCM
+        """
+        import numpy as np
+        
+        self.analyzer = analyzer
+        self.input_rate = input_rate
+        self.sample_rate = analyzer.sample_rate
+        
+        self.input_hop_samples = int(settings.stream_hop_seconds * input_rate)
+        self.hop_samples = int(settings.stream_hop_seconds * self.sample_rate)
+        self.context_samples = int(0.25 * self.sample_rate)
+        self.window_hops = max(1, round(settings.stream_window_seconds / settings.stream_hop_seconds))
+        
+        self._pcm = bytearray()
+        self._ring = np.zeros(self.window_hops * self.hop_samples + self.context_samples, np.float32)
+        self._filled = 0
+        self._pushed = 0  # Samples pushed since the stream started
+        self._hop_scores = deque(maxlen=self.window_hops)
+        
+        self._fingerprinted = 0  # Stream position up to which peaks are final
+        self._clip_matches = deque(maxlen=self.window_hops)  # Posting keys per hop
+        
+        self.hops_scored = 0
+        self.seconds_received = 0.0
+        self.known_clip: Optional[Dict] = None
+    
+    def feed_pcm(self, data: bytes) -> List:
+        """
+        Append 16-bit little-endian mono PCM and cut complete hops.
+        
+        Args:
+            data: Raw PCM bytes, any length
+        
+        Returns:
+            List of float hop arrays at the input sample rate
+        """
+        import numpy as np
+        
+        self._pcm.extend(data)
+        self.seconds_received += len(data) / 2 / self.input_rate
+        
+        hop_bytes = self.input_hop_samples * 2
+        n_hops = len(self._pcm) // hop_bytes
+        if n_hops == 0:
+            return []
+        
+        samples = np.frombuffer(self._pcm, dtype="<i2", count=n_hops * self.input_hop_samples)
+        samples = samples.astype(np.float32) / 32768.0
+        del self._pcm[:n_hops * hop_bytes]
+        return list(samples.reshape(n_hops, self.input_hop_samples))
+    
+    def flush(self) -> List:
+        """
+        Return the trailing partial hop, if it is long enough to score.
+        
+        Returns:
+            List with zero or one hop array
+        """
+        import numpy as np
+        
+        min_bytes = self.input_rate // 2  # 0.25 s of 16-bit audio
+        if len(self._pcm) < min_bytes:
+            return []
+        
+        usable = len(self._pcm) - len(self._pcm) % 2
+        samples = np.frombuffer(self._pcm[:usable], dtype="<i2").astype(np.float32) / 32768.0
+        self._pcm.clear()
+        return [samples]
+    
+    def _push(self, y):
+        """Shift new samples into the ring buffer."""
+        n = min(len(y), len(self._ring))
+        self._ring[:-n] = self._ring[n:]
+        self._ring[-n:] = y[-n:]
+        self._filled = min(len(self._ring), self._filled + n)
+        self._pushed += len(y)
+    
+    def score_hop(self, hop) -> Dict:
+        """
+        Score one new hop and return the pooled window scores.
+        
+        Blocking; run it off the event loop. Calls for one session must
+        not overlap.
+        
+        Args:
+            hop: Float samples at the input sample rate
+        
+        Returns:
+            Dict with pooled window scores
+        """
+        if self.input_rate != self.sample_rate:
+            import librosa
+            hop = librosa.resample(hop, orig_sr=self.input_rate, target_sr=self.sample_rate)
+        
+        self._push(hop)
+        
+        # Only the new hop (plus left context) goes through features and model
+        segment = self._ring[-min(self._filled, len(hop) + self.context_samples):]
+        result = self.analyzer.analyze_samples(segment, check_known=False)
+        self._hop_scores.append(result)
+        self.hops_scored += 1
+        
+        if self.known_clip is None:
+            try:
+                self.known_clip = self._lookup_new_audio()
+            except Exception as e:
+                print(f"Fingerprint lookup failed: {e}")
+        
+        return self.window_scores()
+    
+    def _lookup_new_audio(self) -> Optional[Dict]:
+        """
+        Match the audio received since the last lookup against known clips.
+        
+        The new audio is fingerprinted with just enough of the ring before
+        it to pair its peaks with earlier ones, and only hashes whose later
+        peak is new are kept, so every peak pair is matched once. Peaks in
+        the last few frames may still change with more audio; they are left
+        for the next hop.
+        
+        Returns:
+            Match dict or None
+        """
+        import numpy as np
+        
+        index = get_fingerprint_index()
+        if not len(index):
+            return None
+        
+        fingerprinter = index.fingerprinter
+        step = fingerprinter.hop_length
+        reach = fingerprinter.neighborhood[1] // 2
+        context = (fingerprinter.max_delta + 2 * reach) * step
+        
+        # Stream positions, aligned to fingerprint frames so offsets agree across hops
+        start = max(self._fingerprinted - context, self._pushed - self._filled)
+        start = -(-start // step) * step
+        segment = self._ring[len(self._ring) - (self._pushed - start):]
+        if len(segment) < fingerprinter.n_fft:
+            return None
+        
+        first_new = (self._fingerprinted - start) // step
+        settled = 1 + (len(segment) - fingerprinter.n_fft) // step - reach
+        if settled <= first_new:
+            return None
+        
+        hashes, anchors = fingerprinter.fingerprint(segment)
+        targets = anchors + (hashes & 0xFF)
+        new = (targets >= first_new) & (targets < settled)
+        keys = index.match_keys(hashes[new], anchors[new] + start // step)
+        self._clip_matches.append(keys)
+        self._fingerprinted = start + settled * step
+        
+        return index.best_match(np.concatenate(self._clip_matches))
+    
+    def window_scores(self) -> Dict:
+        """
+        Pool hop scores over the rolling window.
+        
+        Hops are weighted by their speech ratio so silent stretches of a
+        call do not dilute the verdict.
+        
+        Returns:
+            Dict with human_voice, tts_likelihood, voice_cloning,
+            speech_ratio and known_clip
+        """
+        if self.known_clip:
+            result = self.analyzer._known_clip_result(self.known_clip)
+            result.update({"speech_ratio": None, "known_clip": self.known_clip["clip"]})
+            return result
+        
+        hops = list(self._hop_scores)
+        if not hops:
+            result = self.analyzer._infer(None)
+            result.update({"speech_ratio": 0.0, "known_clip": None})
+            return result
+        
+        weights = [max(h["speech_ratio"] or 0.0, 1e-3) for h in hops]
+        total = sum(weights)
+        pooled = {
+            key: sum(w * h[key] for w, h in zip(weights, hops)) / total
+            for key in ("human_voice", "tts_likelihood", "voice_cloning")
+        }
+        pooled["speech_ratio"] = sum(h["speech_ratio"] or 0.0 for h in hops) / len(hops)
+        pooled["known_clip"] = None
+        return pooled
@@ -0,0 +1,134 @@
+"""
+Sentinel AI - Face ROI Tracker
+Crops sampled video frames to the face at model resolution.
+"""
+import threading
+from typing import Optional, Tuple
+
+
+# Haar cascade shared by all trackers (loading it costs tens of milliseconds)
+_cascade = None
+_cascade_lock = threading.Lock()
+
+
+def get_face_cascade():
+    """Get the bundled frontal-face Haar cascade, or None if unavailable."""
+    global _cascade
+    if _cascade is None:
+        with _cascade_lock:
+            if _cascade is None:
+                try:
+                    import cv2
+                    
+                    cascade = cv2.CascadeClassifier(
+                        cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+                    )
+                    _cascade = cascade if not cascade.empty() else False
+                except Exception as e:
+                    print(f"Face detector unavailable, face ROI disabled: {e}")
+                    _cascade = False
+    return _cascade or None
+
+
+class FaceTracker:
+    """
+    Detect-once, track-cheaply face cropper for a sequence of frames.
+    
+    The face is found with OpenCV's bundled Haar cascade on the first frame
+    (on a downscaled grayscale copy) and then followed by normalised
+    template matching inside a search window around the last box. The
+    detector only runs again when the match score drops, so its cost is
+    paid once per shot rather than once per frame.
+    
+    Create one tracker per video; it keeps state between frames.
+    """
+    
+    def __init__(self, output_size: Tuple[int, int] = (224, 224)):
+        """Initialize the tracker."""
+        self.output_size = output_size
+        self.detect_width = 320  # Detection runs at this width
+        self.margin = 1.4  # Crop this much wider than the detected face
+        self.search_scale = 2.0  # Search window size relative to the face box
+        self.min_match = 0.55  # Below this, re-run the detector
+        
+        self._cascade = get_face_cascade()
+        self._box: Optional[Tuple[int, int, int, int]] = None
+        self._template = None
+        
+        self.detections = 0
+        self.face_crops = 0
+    
+    def _detect(self, gray) -> Optional[Tuple[int, int, int, int]]:
+        """Find the largest face. Returns (x, y, w, h) in frame pixels."""
+        import cv2
+        
+        scale = min(1.0, self.detect_width / gray.shape[1])
+        small = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA) if scale < 1 else gray
+        self.detections += 1
+        
+        faces = self._cascade.detectMultiScale(small, scaleFactor=1.1, minNeighbors=5, minSize=(24, 24))
+        if len(faces) == 0:
+            return None
+        
+        x, y, w, h = max(faces, key=lambda f: f[2] * f[3])
+        return int(x / scale), int(y / scale), int(w / scale), int(h / scale)
+    
+    def _track(self, gray) -> Optional[Tuple[int, int, int, int]]:
+        """Follow the previous face box by template matching."""
+        import cv2
+        
+        x, y, w, h = self._box
+        pad_x = int(w * (self.search_scale - 1) / 2)
+        pad_y = int(h * (self.search_scale - 1) / 2)
+        x0, y0 = max(0, x - pad_x), max(0, y - pad_y)
+        x1, y1 = min(gray.shape[1], x + w + pad_x), min(gray.shape[0], y + h + pad_y)
+        
+        window = gray[y0:y1, x0:x1]
+        if window.shape[0] < h or window.shape[1] < w:
+            return None
+        
+        scores = cv2.matchTemplate(window, self._template, cv2.TM_CCOEFF_NORMED)
+        _, best, _, (bx, by) = cv2.minMaxLoc(scores)
+        if best < self.min_match:
+            return None
+        return x0 + bx, y0 + by, w, h
+    
+    def _crop(self, frame, box):
+        """Square crop around the box with margin, resized to the output size."""
+        import cv2
+        
+        x, y, w, h = box
+        side = int(max(w, h) * self.margin)
+        cx, cy = x + w // 2, y + h // 2
+        frame_h, frame_w = frame.shape[:2]
+        side = min(side, frame_w, frame_h)
+        
+        x0 = min(max(0, cx - side // 2), frame_w - side)
+        y0 = min(max(0, cy - side // 2), frame_h - side)
+        crop = frame[y0:y0 + side, x0:x0 + side]
+        return cv2.resize(crop, self.output_size, interpolation=cv2.INTER_AREA)
+    
+    def process(self, frame):
+        """
+        Crop one RGB uint8 frame to the tracked face.
+        
+        Falls back to the whole frame resized to the output size when no
+        face can be found.
+        """
+        import cv2
+        
+        gray = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+        
+        box = self._track(gray) if self._box is not None else None
+        if box is None:
+            box = self._detect(gray)
+        
+        if box is None:
+            self._box, self._template = None, None
+            return cv2.resize(frame, self.output_size, interpolation=cv2.INTER_AREA)
+        
+        x, y, w, h = box
+        self._box = box
+        self._template = gray[y:y + h, x:x + w].copy()
+        self.face_crops += 1
+        return self._crop(frame, box)
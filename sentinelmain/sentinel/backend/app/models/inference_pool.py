@@ -0,0 +1,405 @@
+"""
+Sentinel AI - Inference Process Pool
+Preprocessing and inference in worker processes, fed through shared memory.
+"""
+import itertools
+import multiprocessing
+import threading
+from concurrent.futures import Future
+from multiprocessing import connection, shared_memory
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple, Union
+
+from app.config import settings
+
+
+def _score_image(data) -> Dict:
+    """Decode and analyze an encoded image held in shared memory."""
+    import io
+    
+    from app.models.image_analyzer import get_image_analyzer
+    from app.utils.result_cache import array_digest
+    
+    # The slot holds the whole upload, so this is the upload's digest
+    return get_image_analyzer().analyze_local(io.BytesIO(data), array_digest(data))
+
+
+def _score_video_frame(frame) -> Dict:
+    """Normalize and score one uint8 RGB frame held in shared memory."""
+    import numpy as np
+    
+    from app.models.video_analyzer import get_video_analyzer
+    
+    return get_video_analyzer()._analyze_frame(frame.astype(np.float32) / 255.0)
+
+
+# Work the pool can run, by kind
+HANDLERS = {
+    "image": _score_image,
+    "video_frame": _score_video_frame
+}
+
+
+def _worker_main(shm_name: str, conn):
+    """
+    Worker process loop.
+    
+    Attaches to the shared ring once, then maps each task's bytes as a
+    NumPy view (no copy), runs the handler and sends back only the small
+    result dict over its own pipe.
+    """
+    import numpy as np
+    
+    ring = shared_memory.SharedMemory(name=shm_name)
+    try:
+        while (task := conn.recv()) is not None:
+            request_id, kind, offset, shape, dtype = task
+            view = None
+            try:
+                view = np.ndarray(shape, dtype=dtype, buffer=ring.buf, offset=offset)
+                conn.send((request_id, True, HANDLERS[kind](view)))
+            except Exception as e:
+                conn.send((request_id, False, f"{type(e).__name__}: {e}"))
+            finally:
+                view = None  # Release the buffer export before the ring closes
+    except EOFError:
+        pass  # The API process went away
+    finally:
+        ring.close()
+
+
+class _Worker:
+    """One worker process and the pipe its tasks and results travel on."""
+    
+    def __init__(self, context, shm_name: str, index: int):
+        """Start the process."""
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(shm_name, child_conn),
+            name=f"inference-{index}",
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        
+        self.index = index
+        self.in_flight = set()
+        self.send_lock = threading.Lock()
+        self.alive = True  # Cleared once its death is handled
+
+
+class InferencePool:
+    """
+    Pool of inference processes sharing a ring of memory with the API.
+    
+    One ``SharedMemory`` block is split into ``block_bytes`` blocks. The
+    API process writes an array (or an upload's bytes, read straight from
+    the file) into as many contiguous free blocks as it needs and sends
+    only the offset, shape and dtype to the least busy worker. The worker
+    maps the bytes in place, preprocesses and scores them, and returns a
+    small result dict; the blocks are then reused. When the ring is full,
+    submitters wait, which bounds memory and applies backpressure.
+    
+    Each worker process loads its own analyzers and runs outside the API
+    process's GIL, so preprocessing and inference scale across cores.
+    
+    Every worker has its own pipe, so a crashed worker cannot leave a
+    shared queue locked. The dispatcher thread watches the processes:
+    when one dies, the requests it held fail, their blocks are freed and
+    a replacement is started.
+    """
+    
+    def __init__(self, processes: int, ring_bytes: int, max_input_bytes: int, block_bytes: int):
+        """
+        Create the shared ring and start the workers.
+        
+        Args:
+            processes: Number of worker processes
+            ring_bytes: Size of the shared ring (inputs in flight)
+            max_input_bytes: Largest input accepted
+            block_bytes: Allocation unit of the ring
+        """
+        self.processes = processes
+        self.max_input_bytes = max_input_bytes
+        self.block_bytes = block_bytes
+        
+        blocks = max(1, ring_bytes // block_bytes)
+        self._ring = shared_memory.SharedMemory(create=True, size=blocks * block_bytes)
+        self._used = [False] * blocks
+        self._space = threading.Condition()
+        
+        # spawn: the API process runs threads, which fork does not copy safely
+        self._context = multiprocessing.get_context("spawn")
+        self._workers = [_Worker(self._context, self._ring.name, i) for i in range(processes)]
+        
+        self._ids = itertools.count()
+        self._pending: Dict[int, tuple] = {}
+        self._lock = threading.Lock()
+        self._closing = False
+        self._stats = {"restarts": 0}
+        self._dispatcher = threading.Thread(target=self._dispatch, name="inference-results", daemon=True)
+        self._dispatcher.start()
+    
+    def fits(self, nbytes: int) -> bool:
+        """Whether an input of ``nbytes`` is accepted."""
+        return nbytes <= self.max_input_bytes
+    
+    def _find_blocks(self, count: int) -> Optional[int]:
+        """First run of ``count`` free blocks, or None."""
+        run = 0
+        for i, used in enumerate(self._used):
+            run = 0 if used else run + 1
+            if run == count:
+                return i - count + 1
+        return None
+    
+    def _acquire(self, nbytes: int) -> Tuple[int, int]:
+        """
+        Wait for enough contiguous free blocks for ``nbytes``.
+        
+        Returns:
+            Tuple of (first block, block count)
+        """
+        count = max(1, -(-nbytes // self.block_bytes))
+        if count > len(self._used):
+            raise ValueError(f"Input of {nbytes} bytes does not fit in the ring")
+        
+        with self._space:
+            if not self._space.wait_for(
+                lambda: self._find_blocks(count) is not None,
+                timeout=settings.inference_timeout_seconds
+            ):
+                raise TimeoutError("No free inference memory")
+            first = self._find_blocks(count)
+            self._used[first:first + count] = [True] * count
+        return first, count
+    
+    def _release(self, blocks: Tuple[int, int]):
+        """Return blocks to the ring."""
+        first, count = blocks
+        with self._space:
+            self._used[first:first + count] = [False] * count
+            self._space.notify_all()
+    
+    def _view(self, blocks: Tuple[int, int], shape, dtype):
+        """Writable NumPy view of an allocation."""
+        import numpy as np
+        
+        return np.ndarray(shape, dtype=dtype, buffer=self._ring.buf, offset=blocks[0] * self.block_bytes)
+    
+    def _queue(self, kind: str, blocks: Tuple[int, int], shape, dtype) -> Future:
+        """Hand a filled allocation to the least busy worker."""
+        future = Future()
+        request_id = next(self._ids)
+        with self._lock:
+            # A dead worker stays listed until its replacement has started
+            workers = [w for w in self._workers if w.alive]
+            worker = min(workers, key=lambda w: len(w.in_flight)) if workers else None
+            if worker is not None:
+                worker.in_flight.add(request_id)
+                self._pending[request_id] = (future, blocks)
+        if worker is None:
+            self._release(blocks)
+            future.set_exception(RuntimeError("No inference process running"))
+            return future
+        try:
+            with worker.send_lock:
+                worker.conn.send((request_id, kind, blocks[0] * self.block_bytes, tuple(shape), dtype))
+        except OSError:
+            pass  # The worker died; the dispatcher fails the request
+        return future
+    
+    def submit(self, kind: str, array) -> Future:
+        """
+        Copy an array into the ring and queue it.
+        
+        Args:
+            kind: Handler name (see ``HANDLERS``)
+            array: NumPy array of at most ``max_input_bytes``
+        
+        Returns:
+            Future resolving to the handler's result dict
+        """
+        if not self.fits(array.nbytes):
+            raise ValueError(f"Input of {array.nbytes} bytes is over the inference limit")
+        
+        blocks = self._acquire(array.nbytes)
+        try:
+            self._view(blocks, array.shape, array.dtype)[...] = array
+        except Exception:
+            self._release(blocks)
+            raise
+        return self._queue(kind, blocks, array.shape, array.dtype.str)
+    
+    def submit_file(self, kind: str, file_path: Union[Path, BinaryIO]) -> Future:
+        """
+        Read a file straight into the ring and queue it as a uint8 array.
+        
+        Args:
+            kind: Handler name (see ``HANDLERS``)
+            file_path: Path, or a seekable binary file object such as an
+                in-memory upload
+        
+        Returns:
+            Future resolving to the handler's result dict
+        """
+        if isinstance(file_path, (str, Path)):
+            with open(file_path, "rb") as f:
+                return self.submit_file(kind, f)
+        
+        size = file_path.seek(0, 2)
+        file_path.seek(0)
+        if not self.fits(size):
+            raise ValueError(f"File of {size} bytes is over the inference limit")
+        
+        blocks = self._acquire(size)
+        try:
+            offset = blocks[0] * self.block_bytes
+            view = self._ring.buf[offset:offset + size]
+            filled = 0
+            while filled < size and (n := file_path.readinto(view[filled:])):
+                filled += n
+            view.release()
+        except Exception:
+            self._release(blocks)
+            raise
+        return self._queue(kind, blocks, (filled,), "|u1")
+    
+    def _resolve(self, worker: _Worker, item: tuple):
+        """Complete one request and recycle its blocks."""
+        request_id, ok, value = item
+        with self._lock:
+            worker.in_flight.discard(request_id)
+            entry = self._pending.pop(request_id, None)
+        if entry is None:
+            return
+        future, blocks = entry
+        self._release(blocks)
+        if ok:
+            future.set_result(value)
+        else:
+            future.set_exception(RuntimeError(value))
+    
+    def _replace(self, worker: _Worker):
+        """Fail a dead worker's requests, free their blocks and start a new one."""
+        # Results it sent before dying are still valid
+        try:
+            while worker.conn.poll():
+                self._resolve(worker, worker.conn.recv())
+        except (EOFError, OSError):
+            pass
+        worker.conn.close()
+        worker.process.join(timeout=1)
+        
+        exitcode = worker.process.exitcode
+        with self._lock:
+            worker.alive = False
+            lost = [self._pending.pop(request_id) for request_id in worker.in_flight if request_id in self._pending]
+            worker.in_flight.clear()
+        for future, blocks in lost:
+            self._release(blocks)
+            future.set_exception(RuntimeError(f"Inference process exited with code {exitcode}"))
+        if self._closing:
+            return
+        
+        # Spawning takes a while; the other workers keep taking requests meanwhile
+        replacement = _Worker(self._context, self._ring.name, worker.index)
+        with self._lock:
+            if not self._closing:
+                self._workers[worker.index] = replacement
+                self._stats["restarts"] += 1
+                replacement = None
+        if replacement is not None:
+            replacement.process.terminate()
+            replacement.conn.close()
+            return
+        print(f"Inference process {worker.index} exited with code {exitcode}; restarted it")
+    
+    def _dispatch(self):
+        """Resolve futures as results come back and replace dead workers."""
+        while not self._closing:
+            with self._lock:
+                workers = list(self._workers)
+            ready = set(connection.wait(
+                [w.conn for w in workers] + [w.process.sentinel for w in workers],
+                timeout=1.0
+            ))
+            for worker in workers:
+                dead = worker.process.sentinel in ready
+                if worker.conn in ready and not dead:
+                    try:
+                        self._resolve(worker, worker.conn.recv())
+                    except (EOFError, OSError):
+                        dead = True
+                if dead and not self._closing:
+                    self._replace(worker)
+    
+    def stats(self) -> Dict:
+        """Worker restarts, requests in flight and ring usage."""
+        with self._space:
+            used = sum(self._used)
+        return {
+            **self._stats,
+            "in_flight": len(self._pending),
+            "blocks_used": used,
+            "blocks": len(self._used),
+            "block_bytes": self.block_bytes
+        }
+    
+    def shutdown(self):
+        """Stop the workers and free the shared ring."""
+        self._closing = True
+        self._dispatcher.join(timeout=5)
+        for worker in self._workers:
+            try:
+                with worker.send_lock:
+                    worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in self._workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.conn.close()
+        
+        with self._lock:
+            for future, _ in self._pending.values():
+                future.set_exception(RuntimeError("Inference pool shut down"))
+            self._pending.clear()
+        
+        self._ring.close()
+        self._ring.unlink()
+
+
+# Singleton instance, started by the API process
+_pool: Optional[InferencePool] = None
+
+
+def start_inference_pool() -> Optional[InferencePool]:
+    """Start the inference pool if ``inference_processes`` is set."""
+    global _pool
+    if _pool is None and settings.inference_processes > 0:
+        max_input_bytes = settings.inference_slot_mb * 1024 * 1024
+        slots = settings.inference_slots or settings.inference_processes * 2
+        _pool = InferencePool(
+            processes=settings.inference_processes,
+            ring_bytes=slots * max_input_bytes,
+            max_input_bytes=max_input_bytes,
+            block_bytes=settings.inference_block_kb * 1024
+        )
+        print(f"🧮 Started {settings.inference_processes} inference processes")
+    return _pool
+
+
+def stop_inference_pool():
+    """Shut the inference pool down."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+def get_inference_pool() -> Optional[InferencePool]:
+    """Get the running inference pool, or None to analyze in-process."""
+    return _pool
@@ -0,0 +1,270 @@
+"""
+Sentinel AI - ONNX Audio Backend
+Batched wav2vec2 + CNN inference with ONNX Runtime.
+"""
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.config import settings
+
+
+# Output order of the exported classifier head
+AUDIO_CLASSES = ("human_voice", "tts_likelihood", "voice_cloning")
+
+
+class _Request:
+    """A clip waiting to be batched."""
+    
+    __slots__ = ("samples", "future", "queued_at")
+    
+    def __init__(self, samples):
+        self.samples = samples
+        self.future = Future()
+        self.queued_at = time.monotonic()
+
+
+class OnnxAudioBackend:
+    """
+    Micro-batching inference server for the exported audio model.
+    
+    Clips are routed to the smallest length bucket that fits them and
+    padded only to that bucket, so a batch of 2 s clips never pays for
+    30 s of padding. A single worker thread drains the buckets: a batch
+    runs when it is full or when its oldest clip has waited ``max_wait_ms``.
+    Every caller in the process (API handlers, streaming sessions and the
+    Celery audio task) shares the same session and queue.
+    
+    The model takes ``input_values`` (batch, samples) float32 and, if
+    declared, ``attention_mask`` (batch, samples) int64, and returns
+    logits of shape (batch, 3) in ``AUDIO_CLASSES`` order.
+    """
+    
+    def __init__(self, model_path: Path, sample_rate: int = 16000):
+        """
+        Load the model and start the batching thread.
+        
+        Args:
+            model_path: Path to the ONNX model
+            sample_rate: Sample rate the model expects
+        """
+        import onnxruntime as ort
+        
+        self.model_path = Path(model_path)
+        self.sample_rate = sample_rate
+        self.bucket_seconds = sorted(settings.audio_bucket_seconds)
+        self.max_batch = settings.audio_max_batch_size
+        self.max_wait = settings.audio_max_batch_wait_ms / 1000
+        
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if settings.audio_intra_op_threads > 0:
+            options.intra_op_num_threads = settings.audio_intra_op_threads
+        self.session = ort.InferenceSession(
+            str(self.model_path),
+            sess_options=options,
+            providers=ort.get_available_providers()
+        )
+        
+        inputs = {i.name for i in self.session.get_inputs()}
+        self.has_attention_mask = "attention_mask" in inputs
+        self.output_name = self.session.get_outputs()[0].name
+        
+        self._queues: Dict[float, List[_Request]] = {b: [] for b in self.bucket_seconds}
+        self._cond = threading.Condition()
+        self._stats = {
+            b: {"clips": 0, "batches": 0, "audio_seconds": 0.0,
+                "padded_seconds": 0.0, "inference_seconds": 0.0}
+            for b in self.bucket_seconds
+        }
+        
+        self._worker = threading.Thread(target=self._run, name="onnx-audio-batcher", daemon=True)
+        self._worker.start()
+    
+    def _bucket_for(self, n_samples: int) -> float:
+        """Pick the smallest bucket that holds the clip."""
+        seconds = n_samples / self.sample_rate
+        for bucket in self.bucket_seconds:
+            if seconds <= bucket:
+                return bucket
+        return self.bucket_seconds[-1]
+    
+    def submit(self, samples) -> Future:
+        """
+        Queue a clip for batched inference.
+        
+        Args:
+            samples: Mono float samples at ``self.sample_rate``
+        
+        Returns:
+            Future resolving to a dict of class probabilities
+        """
+        request = _Request(samples)
+        with self._cond:
+            self._queues[self._bucket_for(len(samples))].append(request)
+            self._cond.notify()
+        return request.future
+    
+    def infer(self, samples) -> Dict[str, float]:
+        """Run inference on one clip, blocking until its batch completes."""
+        return self.submit(samples).result(timeout=settings.audio_inference_timeout_seconds)
+    
+    def _next_batch(self):
+        """
+        Wait for a batch that is full or has waited long enough.
+        
+        Returns:
+            Tuple of (bucket_seconds, requests)
+        """
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                deadline = None
+                
+                for bucket, queue in self._queues.items():
+                    if not queue:
+                        continue
+                    due = queue[0].queued_at + self.max_wait
+                    if len(queue) >= self.max_batch or due <= now:
+                        batch = queue[:self.max_batch]
+                        del queue[:self.max_batch]
+                        return bucket, batch
+                    deadline = due if deadline is None else min(deadline, due)
+                
+                self._cond.wait(None if deadline is None else deadline - now)
+    
+    def _run_batch(self, bucket: float, requests: List[_Request]):
+        """Pad a batch to its bucket length, run it and resolve the futures."""
+        import numpy as np
+        
+        length = int(bucket * self.sample_rate)
+        values = np.zeros((len(requests), length), np.float32)
+        mask = np.zeros((len(requests), length), np.int64)
+        audio_samples = 0
+        
+        for row, request in enumerate(requests):
+            clip = np.asarray(request.samples, np.float32)[:length]
+            # wav2vec2 expects zero-mean, unit-variance input
+            clip = (clip - clip.mean()) / (clip.std() + 1e-7)
+            values[row, :len(clip)] = clip
+            mask[row, :len(clip)] = 1
+            audio_samples += len(clip)
+        
+        feeds = {"input_values": values}
+        if self.has_attention_mask:
+            feeds["attention_mask"] = mask
+        
+        started = time.monotonic()
+        logits = self.session.run([self.output_name], feeds)[0]
+        elapsed = time.monotonic() - started
+        
+        logits = logits - logits.max(axis=1, keepdims=True)
+        probs = np.exp(logits)
+        probs /= probs.sum(axis=1, keepdims=True)
+        
+        for request, row in zip(requests, probs):
+            request.future.set_result({name: float(p) for name, p in zip(AUDIO_CLASSES, row)})
+        
+        stats = self._stats[bucket]
+        stats["clips"] += len(requests)
+        stats["batches"] += 1
+        stats["audio_seconds"] += audio_samples / self.sample_rate
+        stats["padded_seconds"] += values.size / self.sample_rate
+        stats["inference_seconds"] += elapsed
+    
+    def _run(self):
+        """Batching loop."""
+        while True:
+            bucket, requests = self._next_batch()
+            try:
+                self._run_batch(bucket, requests)
+            except Exception as e:
+                for request in requests:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+    
+    def stats(self) -> Dict:
+        """
+        Report per-bucket throughput.
+        
+        Returns:
+            Dict with model info and one entry per length bucket
+        """
+        buckets = {}
+        for bucket, s in self._stats.items():
+            busy = s["inference_seconds"]
+            buckets[f"{bucket:g}s"] = {
+                "clips": s["clips"],
+                "batches": s["batches"],
+                "mean_batch_size": s["clips"] / s["batches"] if s["batches"] else 0.0,
+                "queued": len(self._queues[bucket]),
+                "padding_ratio": 1 - s["audio_seconds"] / s["padded_seconds"] if s["padded_seconds"] else 0.0,
+                "clips_per_second": s["clips"] / busy if busy else 0.0,
+                "audio_seconds_per_second": s["audio_seconds"] / busy if busy else 0.0
+            }
+        return {
+            "backend": "onnxruntime",
+            "model": self.model_path.name,
+            "providers": self.session.get_providers(),
+            "buckets": buckets
+        }
+
+
+def resolve_audio_model_path() -> Optional[Path]:
+    """
+    Choose the model file to load.
+    
+    The INT8 export is preferred when enabled and present; it should only be
+    shipped after it has been validated against the FP32 model.
+    """
+    if settings.audio_model_use_int8 and settings.audio_model_int8_path.exists():
+        return settings.audio_model_int8_path
+    if settings.audio_model_path.exists():
+        return settings.audio_model_path
+    return None
+
+
+def quantize_audio_model(source: Path, target: Path):
+    """
+    Write a dynamically quantized INT8 copy of the audio model.
+    
+    Args:
+        source: FP32 ONNX model
+        target: Output path for the INT8 model
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    
+    quantize_dynamic(str(source), str(target), weight_type=QuantType.QInt8)
+
+
+# Singleton instance
+_backend = None
+_backend_checked = False
+_backend_lock = threading.Lock()
+
+
+def get_onnx_audio_backend() -> Optional[OnnxAudioBackend]:
+    """Get the ONNX audio backend, or None if no model is deployed."""
+    global _backend, _backend_checked
+    if _backend_checked:
+        return _backend
+    
+    with _backend_lock:
+        if not _backend_checked:
+            model_path = resolve_audio_model_path()
+            if model_path is not None:
+                try:
+                    _backend = OnnxAudioBackend(model_path)
+                    print(f"🎙️ Loaded audio model {model_path.name}")
+                except Exception as e:
+                    print(f"Audio model loading failed, using mock inference: {e}")
+            _backend_checked = True
+    return _backend
+
+
+if __name__ == "__main__":
+    # Quantize the deployed model: python -m app.models.onnx_audio
+    quantize_audio_model(settings.audio_model_path, settings.audio_model_int8_path)
+    print(f"Wrote {settings.audio_model_int8_path}")
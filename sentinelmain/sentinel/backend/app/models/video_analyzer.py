@@ -1,154 +1,898 @@
-"""
-Sentinel AI - Video Analyzer
-Deepfake video detection with frame sampling.
-Uses mock inference for demonstration - replace with trained model.
-"""
-import random
-from pathlib import Path
-from typing import Dict, List, Optional
-
-
-class VideoAnalyzer:
-    """
-    Video analysis model for detecting deepfake videos.
-    
-    In production, this would use CNN + temporal pooling.
-    Samples 1 frame per second, max 8 frames.
-    """
-    
-    def __init__(self):
-        """Initialize the video analyzer."""
-        self.loaded = True
-        self.target_size = (224, 224)
-        self.max_frames = 8
-        self.fps_sample = 1  # Sample 1 frame per second
-    
-    def _get_video_info(self, file_path: Path) -> Dict:
-        """
-        Get video metadata.
-        
-        Returns:
-            Dict with duration, fps, frame_count
-        """
-        try:
-            import cv2
-            
-            cap = cv2.VideoCapture(str(file_path))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-            duration = frame_count / fps if fps > 0 else 0
-            cap.release()
-            
-            return {
-                "duration": duration,
-                "fps": fps,
-                "frame_count": frame_count
-            }
-        except Exception as e:
-            print(f"Video info extraction failed: {e}")
-            return {"duration": 0, "fps": 30, "frame_count": 0}
-    
-    def _sample_frames(self, file_path: Path) -> List:
-        """
-        Sample frames from video at 1 fps.
-        
-        Returns:
-            List of frame arrays
-        """
-        try:
-            import cv2
-            import numpy as np
-            
-            cap = cv2.VideoCapture(str(file_path))
-            fps = cap.get(cv2.CAP_PROP_FPS)
-            
-            frames = []
-            frame_interval = int(fps) if fps > 0 else 30  # Frames per second
-            
-            current_frame = 0
-            while len(frames) < self.max_frames:
-                cap.set(cv2.CAP_PROP_POS_FRAMES, current_frame)
-                ret, frame = cap.read()
-                
-                if not ret:
-                    break
-                
-                # Resize and convert
-                frame = cv2.resize(frame, self.target_size)
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame = frame / 255.0
-                
-                frames.append(frame)
-                current_frame += frame_interval
-            
-            cap.release()
-            return frames
-        except Exception as e:
-            print(f"Frame sampling failed: {e}")
-            return []
-    
-    def _analyze_frame(self, frame) -> Dict:
-        """
-        Analyze a single frame.
-        
-        Returns:
-            Dict with frame analysis scores
-        """
-        import numpy as np
-        
-        # Placeholder analysis
-        return {
-            "real_score": 0.7 + random.uniform(-0.2, 0.2),
-            "fake_score": 0.3 + random.uniform(-0.2, 0.2)
-        }
-    
-    def analyze(self, file_path: Path) -> Dict:
-        """
-        Analyze video for deepfake content.
-        
-        Args:
-            file_path: Path to video file
-            
-        Returns:
-            Dict with analysis results
-        """
-        video_info = self._get_video_info(file_path)
-        frames = self._sample_frames(file_path)
-        
-        if not frames:
-            # Return uncertain results on error
-            return {
-                "real_probability": 0.5,
-                "deepfake_likelihood": 0.5,
-                "frames_analyzed": 0,
-                "duration_seconds": video_info.get("duration", 0)
-            }
-        
-        # Analyze each frame
-        frame_results = [self._analyze_frame(f) for f in frames]
-        
-        # Aggregate results (temporal pooling - mean for now)
-        avg_real = sum(r["real_score"] for r in frame_results) / len(frame_results)
-        avg_fake = sum(r["fake_score"] for r in frame_results) / len(frame_results)
-        
-        # Normalize
-        total = avg_real + avg_fake
-        
-        return {
-            "real_probability": avg_real / total,
-            "deepfake_likelihood": avg_fake / total,
-            "frames_analyzed": len(frames),
-            "duration_seconds": video_info.get("duration", 0)
-        }
-
-
-# Singleton instance
-_analyzer = None
-
-
-def get_video_analyzer() -> VideoAnalyzer:
-    """Get or create the video analyzer instance."""
-    global _analyzer
-    if _analyzer is None:
-        _analyzer = VideoAnalyzer()
-    return _analyzer
+"""
+Sentinel AI - Video Analyzer
+Deepfake video detection with frame sampling.
+Uses mock inference for demonstration - replace with trained model.
+"""
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from app.config import settings
+from app.models.audio_analyzer import get_audio_analyzer
+from app.models.face_roi import FaceTracker, get_face_cascade
+from app.models.inference_pool import get_inference_pool
+from app.utils.upload_store import content_digest
+from app.utils.result_cache import array_digest, seeded_random
+from app.utils.video_decode import FfmpegFrameReader, extract_audio, ffmpeg_available, probe_video
+
+
+# Runs one analysis stage: stage(name, compute) -> result
+StageRunner = Callable[[str, Callable[[], Any]], Any]
+
+
+def _run_stage(name: str, compute: Callable[[], Any]) -> Any:
+    """Default stage runner: always compute."""
+    return compute()
+
+
+class VideoAnalyzer:
+    """
+    Video analysis model for detecting deepfake videos.
+    
+    In production, this would use CNN + temporal pooling.
+    Spends a budget of ``frame_budget`` frames per video: either 1 frame
+    per second (uniform) or, by default, where the content changes most
+    (adaptive). Scoring can stop early once the evidence is conclusive.
+    With face ROI enabled, frames are decoded at a larger working size and
+    only the tracked face crop, at model resolution, is scored. The audio
+    track is scored by the audio analyzer on a thread of this process
+    while frames are analyzed, and a suspicious voice raises the video's
+    score.
+    """
+    
+    def __init__(self):
+        """Initialize the video analyzer."""
+        self.loaded = True
+        self.target_size = (224, 224)
+        self.frame_budget = settings.video_frame_budget
+        self.sampling_mode = settings.video_sampling_mode
+        self.fps_sample = 1  # Uniform mode: sample 1 frame per second
+        self.candidate_fps = settings.video_candidate_fps
+        self.max_candidates = settings.video_max_candidates
+        self.signal_size = (32, 32)  # Low-res grid for change detection
+        
+        # Early exit: sequential probability ratio test over frame scores
+        self.early_exit = settings.video_early_exit
+        self.sprt_alpha = settings.video_sprt_alpha  # False "fake" rate
+        self.sprt_beta = settings.video_sprt_beta  # False "real" rate
+        self.sprt_min_frames = settings.video_sprt_min_frames
+        self.sprt_max_step = 1.5  # Max log-odds a single frame can add
+        
+        # Face ROI: decode larger, then crop to the face at target_size
+        self.face_roi = settings.video_face_roi and get_face_cascade() is not None
+        self.roi_working_size = settings.video_roi_working_size
+        
+        # Segmented mode for long videos
+        self.segment_seconds = settings.video_segment_seconds
+        
+        # Audio track: demuxed and scored on a thread pool in this process, concurrently with frames
+        self.audio_track = settings.video_audio_track
+        self.audio_weight = settings.video_audio_weight
+        self._audio_pool = ThreadPoolExecutor(
+            max_workers=settings.video_audio_workers,
+            thread_name_prefix="video-audio"
+        )
+    
+    @property
+    def model_version(self) -> str:
+        """
+        Version of the scoring models, part of the result cache key.
+        
+        Covers every setting that changes which frames are scored or how
+        their scores are pooled, so changing any of them never serves
+        results computed under the old ones.
+        """
+        parts = [f"mock-1-{self.sampling_mode}-{self.frame_budget}"]
+        if self.sampling_mode == "adaptive":
+            parts.append(f"cand{self.candidate_fps:g}x{self.max_candidates}{'inc' if self.early_exit else ''}")
+        parts.append(self._decode_backend())
+        if self.early_exit:
+            parts.append(
+                f"sprt{self.sprt_alpha:g}_{self.sprt_beta:g}_{self.sprt_min_frames}_{self.sprt_max_step:g}"
+            )
+        if self.face_roi:
+            parts.append(f"roi{self.roi_working_size}")
+        parts.append(f"range{settings.video_fanout_range_seconds:g}")
+        
+        version = "-".join(parts)
+        if self.audio_track:
+            version += f"+audio{self.audio_weight:g}-{get_audio_analyzer().model_version}"
+        return version
+    
+    def _decode_backend(self) -> str:
+        """Decoder in use: ffmpeg if configured and installed, OpenCV otherwise."""
+        if settings.video_decode_backend == "ffmpeg" and ffmpeg_available():
+            return "ffmpeg"
+        return "opencv"
+    
+    def _get_video_info(self, cap) -> Dict:
+        """
+        Get video metadata from an open capture.
+        
+        Returns:
+            Dict with duration, fps, frame_count, width, height
+        """
+        import cv2
+        
+        fps = cap.get(cv2.CAP_PROP_FPS)
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        duration = frame_count / fps if fps > 0 else 0
+        
+        return {
+            "duration": duration,
+            "fps": fps,
+            "frame_count": frame_count,
+            "width": int(cap.get(cv2.CAP_PROP_FRAME_WIDTH)),
+            "height": int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        }
+    
+    def _decode_size(self, video_info: Dict) -> Tuple[int, int]:
+        """
+        Pick the (width, height) frames are decoded at.
+        
+        Without face ROI this is the model resolution. With it, frames keep
+        their aspect ratio and are scaled so the longest side is
+        ``roi_working_size`` (never upscaled), leaving enough pixels for a
+        face crop to reach model resolution.
+        """
+        width, height = video_info.get("width", 0), video_info.get("height", 0)
+        if not self.face_roi or width <= 0 or height <= 0:
+            return self.target_size
+        
+        scale = min(1.0, self.roi_working_size / max(width, height))
+        # Even dimensions keep ffmpeg's scaler happy for any pixel format
+        return max(2, int(width * scale) // 2 * 2), max(2, int(height * scale) // 2 * 2)
+    
+    def probe(self, file_path: Path) -> Dict:
+        """Read video metadata with ffprobe, or OpenCV if it is missing."""
+        if ffmpeg_available():
+            return probe_video(file_path)
+        
+        import cv2
+        
+        cap = cv2.VideoCapture(str(file_path))
+        try:
+            return self._get_video_info(cap)
+        finally:
+            cap.release()
+    
+    def _target_frame_indices(
+        self,
+        video_info: Dict,
+        sample_fps: float,
+        max_frames: int,
+        start: Optional[float] = None,
+        duration: Optional[float] = None
+    ) -> List[int]:
+        """
+        Pick the frame numbers to decode at ``sample_fps``.
+        
+        Returns:
+            Sorted list of frame indices
+        """
+        fps = video_info["fps"]
+        frame_interval = max(1, int(fps / sample_fps)) if fps > 0 else 30
+        first = int((start or 0) * fps) if fps > 0 else 0
+        
+        end = video_info["frame_count"]
+        if duration and fps > 0:
+            end = min(end, first + int(duration * fps)) if end > 0 else first + int(duration * fps)
+        
+        targets = [first + i * frame_interval for i in range(max_frames)]
+        if end > 0:
+            targets = [t for t in targets if t < end] or [first]
+        return targets
+    
+    def _decode_frames_ffmpeg(
+        self,
+        file_path: Path,
+        sample_fps: float,
+        max_frames: int,
+        start: Optional[float] = None,
+        duration: Optional[float] = None,
+        video_info: Optional[Dict] = None
+    ) -> Tuple[Dict, Iterator]:
+        """
+        Decode frames at ``sample_fps`` through an ffmpeg pipe.
+        
+        ffmpeg selects the frames, scales them to the decode size and
+        converts to RGB inside the decoder, writing straight into a
+        preallocated buffer, so high-resolution uploads are never held at
+        full size.
+        
+        Returns:
+            Tuple of (video_info, lazy iterator of uint8 RGB frames)
+        """
+        video_info = video_info or probe_video(file_path)
+        size = self._decode_size(video_info)
+        
+        def frames():
+            with FfmpegFrameReader(
+                file_path,
+                size=size,
+                fps=sample_fps,
+                max_frames=max_frames,
+                start=start,
+                duration=duration
+            ) as reader:
+                yield from reader
+        
+        return video_info, frames()
+    
+    def _decode_frames_opencv(
+        self,
+        file_path: Path,
+        sample_fps: float,
+        max_frames: int,
+        start: Optional[float] = None,
+        duration: Optional[float] = None,
+        video_info: Optional[Dict] = None
+    ) -> Tuple[Dict, Iterator]:
+        """
+        Decode frames at ``sample_fps`` in a single sequential pass.
+        
+        The container is opened once. Frames between targets are only
+        ``grab()``-ed (demuxed and decoded, no colour conversion or copy)
+        and target frames are ``retrieve()``-d, so sampling never seeks:
+        per-frame seeks restart decoding from the previous keyframe for
+        most codecs. A time range costs one seek to its first frame.
+        
+        Returns:
+            Tuple of (video_info, lazy iterator of uint8 RGB frames)
+        """
+        import cv2
+        
+        cap = cv2.VideoCapture(str(file_path))
+        video_info = video_info or self._get_video_info(cap)
+        targets = self._target_frame_indices(video_info, sample_fps, max_frames, start, duration)
+        size = self._decode_size(video_info)
+        
+        def frames():
+            try:
+                next_target = 0
+                current_frame = targets[0]
+                last_target = targets[-1]
+                if current_frame > 0:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, current_frame)
+                
+                while current_frame <= last_target:
+                    if not cap.grab():
+                        break
+                    
+                    if current_frame == targets[next_target]:
+                        ret, frame = cap.retrieve()
+                        if not ret:
+                            break
+                        frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+                        yield cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                        next_target += 1
+                    
+                    current_frame += 1
+            finally:
+                cap.release()
+        
+        return video_info, frames()
+    
+    def _decode_frames(
+        self,
+        file_path: Path,
+        sample_fps: float,
+        max_frames: int,
+        start: Optional[float] = None,
+        duration: Optional[float] = None,
+        video_info: Optional[Dict] = None
+    ) -> Tuple[Dict, Iterator]:
+        """
+        Decode frames with the configured backend.
+        
+        Decoding happens as the iterator is consumed; closing it early
+        stops the decoder. ``start``/``duration`` restrict decoding to a
+        time range. Passing ``video_info`` from an earlier ``probe`` skips
+        probing the file again.
+        """
+        if duration:
+            max_frames = min(max_frames, max(1, int(duration * sample_fps + 0.5)))
+        
+        if self._decode_backend() == "ffmpeg":
+            return self._decode_frames_ffmpeg(file_path, sample_fps, max_frames, start, duration, video_info)
+        return self._decode_frames_opencv(file_path, sample_fps, max_frames, start, duration, video_info)
+    
+    def _change_signal(self, frame):
+        """Tiny grayscale grid and colour histogram used to measure change."""
+        import cv2
+        import numpy as np
+        
+        small = cv2.resize(frame, self.signal_size, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_RGB2GRAY).astype(np.float32)
+        hist = cv2.calcHist([small], [0, 1, 2], None, [8, 8, 8], [0, 256] * 3)
+        return gray, cv2.normalize(hist, hist).flatten()
+    
+    def _change(self, prev, signal) -> float:
+        """Change between two ``_change_signal`` results."""
+        import cv2
+        import numpy as np
+        
+        motion = float(np.mean(np.abs(signal[0] - prev[0]))) / 255.0
+        cut = float(cv2.compareHist(prev[1], signal[1], cv2.HISTCMP_BHATTACHARYYA))
+        return motion + cut
+    
+    def _change_scores(self, frames) -> List[float]:
+        """
+        Score how much each frame differs from the one before it.
+        
+        Combines mean absolute difference on a tiny grayscale grid (motion,
+        including moving faces) with a colour-histogram distance (cuts and
+        lighting changes). Both are computed on downscaled copies, so the
+        cost is negligible next to decoding.
+        
+        Returns:
+            One score per frame; the first frame scores 0
+        """
+        scores = [0.0]
+        prev = None
+        
+        for frame in frames:
+            signal = self._change_signal(frame)
+            if prev is not None:
+                scores.append(self._change(prev, signal))
+            prev = signal
+        
+        return scores
+    
+    def _select_adaptive(self, change_scores: List[float], budget: int) -> List[int]:
+        """
+        Spend the frame budget where content changes.
+        
+        Frames are picked at equal steps of cumulative change. A floor of
+        the mean change is added to every frame so a static clip falls back
+        to even coverage instead of clustering on noise.
+        
+        Returns:
+            Sorted candidate indices, at most ``budget``
+        """
+        import numpy as np
+        
+        n = len(change_scores)
+        if n <= budget:
+            return list(range(n))
+        
+        scores = np.asarray(change_scores, np.float64)
+        weights = scores + max(scores.mean(), 1e-6)
+        cumulative = np.cumsum(weights)
+        quantiles = (np.arange(budget) + 0.5) / budget * cumulative[-1]
+        picks = set(np.searchsorted(cumulative, quantiles).tolist())
+        
+        # Quantiles can land on the same frame; top up with the next biggest changes
+        for index in np.argsort(-scores):
+            if len(picks) >= budget:
+                break
+            picks.add(int(index))
+        
+        return sorted(picks)
+    
+    def _select_incremental(self, candidates, expected: int, budget: int) -> Iterator:
+        """
+        Keep the most-changed candidate of each of ``budget`` equal stretches.
+        
+        Each stretch's pick is yielded as soon as the stretch has been
+        decoded, so an early exit stops decoding as well, at the cost of
+        a fixed share of the budget per stretch instead of following the
+        change over the whole clip.
+        
+        Args:
+            candidates: Candidate frames in order
+            expected: Number of candidates the decoder will produce
+            budget: Frames to keep
+        
+        Yields:
+            Kept frames in order
+        """
+        stretches = min(budget, max(expected, 1))
+        index, stretch = 0, 0
+        prev, best, best_score = None, None, -1.0
+        
+        for frame in candidates:
+            signal = self._change_signal(frame)
+            score = self._change(prev, signal) if prev is not None else 0.0
+            prev = signal
+            if score > best_score:
+                best, best_score = frame, score
+            
+            index += 1
+            if index * stretches >= (stretch + 1) * expected:
+                yield best
+                stretch += 1
+                best, best_score = None, -1.0
+        
+        if best is not None:
+            yield best
+    
+    def _candidate_fps(self, span: float) -> float:
+        """
+        Candidate rate for adaptive sampling of ``span`` seconds.
+        
+        Up to ``max_candidates / candidate_fps`` seconds this is
+        ``candidate_fps``; longer clips get a lower rate, so the
+        ``max_candidates`` candidates always cover the whole clip instead
+        of its first seconds.
+        """
+        if span <= 0:
+            return self.candidate_fps
+        return min(self.candidate_fps, self.max_candidates / span)
+    
+    def _sample_frames(
+        self,
+        file_path: Path,
+        tracker: Optional[FaceTracker] = None,
+        start: Optional[float] = None,
+        duration: Optional[float] = None,
+        video_info: Optional[Dict] = None
+    ) -> Tuple[Dict, Iterator]:
+        """
+        Sample up to ``frame_budget`` frames for analysis.
+        
+        Uniform mode decodes 1 frame per second, lazily, so an early exit
+        also stops decoding. Adaptive mode decodes low-cost candidates in
+        the same sequential pass, evenly spread over the clip or range
+        (see ``_candidate_fps``), scores the change between consecutive
+        candidates and keeps the budget's worth of frames where content
+        changes most. With early exit enabled the candidates are selected
+        stretch by stretch (see ``_select_incremental``), so they are
+        decoded lazily too.
+        
+        Args:
+            file_path: Path to video file
+            tracker: Optional face tracker; each kept frame is cropped to
+                the face at ``target_size``
+            start: Start of the time range to sample, in seconds
+            duration: Length of the time range, in seconds
+            video_info: Metadata from ``probe``, if already known
+        
+        Returns:
+            Tuple of (video_info, iterator of uint8 RGB frames at ``target_size``)
+        """
+        if self.sampling_mode == "adaptive":
+            if video_info is None:
+                video_info = self.probe(file_path)
+            span = duration or max(0.0, video_info["duration"] - (start or 0))
+            video_info, candidates = self._decode_frames(
+                file_path, self._candidate_fps(span), self.max_candidates, start, duration, video_info
+            )
+            if self.early_exit:
+                expected = min(self.max_candidates, max(1, int(span * self._candidate_fps(span) + 0.5)))
+                frames = self._select_incremental(candidates, expected, self.frame_budget)
+            else:
+                candidates = list(candidates)
+                keep = self._select_adaptive(self._change_scores(candidates), self.frame_budget)
+                frames = iter([candidates[i] for i in keep])
+        else:
+            video_info, frames = self._decode_frames(
+                file_path, self.fps_sample, self.frame_budget, start, duration, video_info
+            )
+        
+        def prepared():
+            try:
+                for frame in frames:
+                    if tracker is not None:
+                        frame = tracker.process(frame)
+                    yield frame
+            finally:
+                close = getattr(frames, "close", None)
+                if close:
+                    close()
+        
+        return video_info, prepared()
+    
+    def _frame_scores(self, frames) -> Iterator[Dict]:
+        """
+        Score uint8 frames in order.
+        
+        With the inference pool running, frames are copied into shared
+        memory and normalized and scored in worker processes, with up to
+        one frame per process in flight ahead of the consumer. A single
+        video is then scored in parallel while early exit still sees the
+        scores in order.
+        
+        Yields:
+            Frame analysis dicts
+        """
+        import numpy as np
+        
+        pool = get_inference_pool()
+        if pool is None:
+            for frame in frames:
+                yield self._analyze_frame(frame.astype(np.float32) / 255.0)
+            return
+        
+        pending = deque()
+        for frame in frames:
+            pending.append(pool.submit("video_frame", frame))
+            if len(pending) >= pool.processes:
+                yield pending.popleft().result(timeout=settings.inference_timeout_seconds)
+        while pending:
+            yield pending.popleft().result(timeout=settings.inference_timeout_seconds)
+    
+    def _analyze_frame(self, frame) -> Dict:
+        """
+        Analyze a single frame.
+        
+        Returns:
+            Dict with frame analysis scores
+        """
+        import numpy as np
+        
+        # Placeholder analysis, seeded by the frame so repeats score the same
+        rng = seeded_random(array_digest(frame))
+        return {
+            "real_score": 0.7 + rng.uniform(-0.2, 0.2),
+            "fake_score": 0.3 + rng.uniform(-0.2, 0.2)
+        }
+    
+    def _sprt_step(self, llr: float, frame_result: Dict) -> Tuple[float, Optional[str]]:
+        """
+        Add one frame's evidence to a sequential probability ratio test.
+        
+        Each frame contributes the log-odds of its fake score, clipped so a
+        single frame cannot decide on its own. The test stops once the sum
+        crosses Wald's bounds for the configured error rates.
+        
+        Returns:
+            Tuple of (updated log-likelihood ratio, "fake"/"real" or None)
+        """
+        import math
+        
+        total = frame_result["real_score"] + frame_result["fake_score"]
+        p_fake = min(max(frame_result["fake_score"] / total, 1e-3), 1 - 1e-3)
+        step = math.log(p_fake / (1 - p_fake))
+        llr += max(-self.sprt_max_step, min(self.sprt_max_step, step))
+        
+        alpha, beta = self.sprt_alpha, self.sprt_beta
+        if llr >= math.log((1 - beta) / alpha):
+            return llr, "fake"
+        if llr <= math.log(beta / (1 - alpha)):
+            return llr, "real"
+        return llr, None
+    
+    def _score_frames(
+        self,
+        file_path: Path,
+        start: Optional[float] = None,
+        duration: Optional[float] = None,
+        video_info: Optional[Dict] = None
+    ) -> Tuple[Dict, List[Dict], bool, Optional[int]]:
+        """
+        Score sampled frames, optionally within a time range.
+        
+        With early exit enabled, frames are scored in order and the video
+        stops being decoded and scored as soon as the sequential test is
+        confident either way.
+        
+        Returns:
+            Tuple of (video_info, per-frame scores, early_exit, face_crops)
+        """
+        known_info = video_info
+        video_info = video_info or {"duration": 0, "fps": 30, "frame_count": 0}
+        frame_results = []
+        early_exit = False
+        tracker = None
+        
+        try:
+            if self.face_roi:
+                tracker = FaceTracker(self.target_size)
+            video_info, frames = self._sample_frames(file_path, tracker, start, duration, known_info)
+            scores = self._frame_scores(frames)
+            llr = 0.0
+            try:
+                for frame_result in scores:
+                    frame_results.append(frame_result)
+                    
+                    if self.early_exit:
+                        llr, decision = self._sprt_step(llr, frame_results[-1])
+                        if decision and len(frame_results) >= self.sprt_min_frames:
+                            early_exit = True
+                            break
+            finally:
+                scores.close()
+                frames.close()
+        except Exception as e:
+            print(f"Frame sampling failed: {e}")
+        
+        return video_info, frame_results, early_exit, tracker.face_crops if tracker else None
+    
+    def _pool_frames(self, frame_results: List[Dict]) -> Tuple[float, float]:
+        """
+        Temporal pooling of per-frame scores (mean for now).
+        
+        Returns:
+            Tuple of (real_probability, deepfake_likelihood); 0.5 each when
+            there are no frames
+        """
+        if not frame_results:
+            return 0.5, 0.5
+        
+        avg_real = sum(r["real_score"] for r in frame_results) / len(frame_results)
+        avg_fake = sum(r["fake_score"] for r in frame_results) / len(frame_results)
+        
+        # Normalize
+        total = avg_real + avg_fake
+        return avg_real / total, avg_fake / total
+    
+    def _analyze_frames(
+        self,
+        file_path: Path,
+        video_info: Optional[Dict] = None,
+        stage: StageRunner = _run_stage
+    ) -> Dict:
+        """
+        Score sampled frames and pool them over time.
+        
+        The frame scores are computed as the "frames" stage.
+        
+        Returns:
+            Dict with frame analysis results
+        """
+        def score():
+            info, frame_results, early_exit, face_crops = self._score_frames(file_path, video_info=video_info)
+            return {
+                "duration": info.get("duration", 0),
+                "frame_results": frame_results,
+                "early_exit": early_exit,
+                "face_crops": face_crops
+            }
+        
+        scored = stage("frames", score)
+        frame_results = scored["frame_results"]
+        real_probability, deepfake_likelihood = self._pool_frames(frame_results)
+        
+        return {
+            "real_probability": real_probability,
+            "deepfake_likelihood": deepfake_likelihood,
+            "frames_analyzed": len(frame_results),
+            "frame_budget": self.frame_budget,
+            "sampling_mode": self.sampling_mode,
+            "early_exit": scored["early_exit"],
+            "face_crops": scored["face_crops"],
+            "duration_seconds": scored["duration"]
+        }
+    
+    def analyze_audio_track(self, file_path: Path) -> Optional[Dict]:
+        """
+        Demux the audio track and score it with the audio analyzer.
+        
+        Returns:
+            Audio analysis dict, or None if there is no usable audio
+        """
+        analyzer = get_audio_analyzer()
+        try:
+            samples = extract_audio(
+                file_path,
+                sample_rate=analyzer.sample_rate,
+                max_seconds=settings.max_audio_duration_seconds
+            )
+        except Exception as e:
+            print(f"Audio track extraction failed: {e}")
+            return None
+        
+        # Less than half a second of sound carries no useful evidence
+        if samples is None or len(samples) < analyzer.sample_rate // 2:
+            return None
+        return analyzer.analyze_samples(samples)
+    
+    def _fuse_audio(self, visual_fake: float, audio_result: Optional[Dict]) -> Tuple[float, Optional[float]]:
+        """
+        Combine the frame and audio-track scores.
+        
+        A cloned voice over a genuine face is still a deepfake, so the audio
+        can only raise the score: it pulls the visual score towards the
+        audio's fake likelihood, weighted by how much of the track is speech.
+        
+        Returns:
+            Tuple of (fused deepfake likelihood, audio fake likelihood or None)
+        """
+        if audio_result is None:
+            return visual_fake, None
+        
+        audio_fake = max(audio_result["tts_likelihood"], audio_result["voice_cloning"])
+        speech_ratio = audio_result.get("speech_ratio")
+        weight = self.audio_weight * (1.0 if speech_ratio is None else speech_ratio)
+        
+        fused = visual_fake + weight * max(0.0, audio_fake - visual_fake)
+        return fused, audio_fake
+    
+    def analyze(
+        self,
+        file_path: Path,
+        cache_key: Optional[str] = None,
+        video_info: Optional[Dict] = None,
+        stage: StageRunner = _run_stage
+    ) -> Dict:
+        """
+        Analyze video for deepfake content.
+        
+        The audio track is scored on the audio thread pool while frames
+        are analyzed on the calling thread, so latency follows the slower
+        of the two rather than their sum. Once frames are scored the
+        audio gets ``video_audio_timeout_seconds`` more; after that the
+        video is scored on its frames alone.
+        
+        Args:
+            file_path: Path to video file
+            cache_key: Content digest of the upload (derived from stored
+                uploads when omitted)
+            video_info: Metadata from ``probe``, if already known
+            stage: Runs the "frames" and "audio" stages; a runner that
+                returns stored results (see ``checkpointed``) lets a retry
+                skip the stages that finished
+            
+        Returns:
+            Dict with analysis results
+        """
+        audio_future = None
+        if self.audio_track:
+            audio_future = self._audio_pool.submit(
+                lambda: stage("audio", lambda: {"audio": self.analyze_audio_track(file_path)})["audio"]
+            )
+        
+        result = self._analyze_frames(file_path, video_info, stage)
+        
+        audio_result = None
+        if audio_future is not None:
+            try:
+                audio_result = audio_future.result(timeout=settings.video_audio_timeout_seconds)
+            except TimeoutError:
+                audio_future.cancel()  # Only stops it if it has not started
+                print(f"Audio track analysis timed out after {settings.video_audio_timeout_seconds}s")
+            except Exception as e:
+                print(f"Audio track analysis failed: {e}")
+        
+        visual_fake = result["deepfake_likelihood"]
+        fused, audio_fake = self._fuse_audio(visual_fake, audio_result)
+        result.update({
+            "real_probability": 1 - fused,
+            "deepfake_likelihood": fused,
+            "visual_deepfake_likelihood": visual_fake,
+            "audio_fake_likelihood": audio_fake,
+            "cache_key": cache_key or content_digest(file_path)
+        })
+        return result
+    
+    def segment_ranges(self, duration: float, step: Optional[float] = None) -> List[Tuple[float, float]]:
+        """
+        Split a video into time ranges of ``step`` (default
+        ``segment_seconds``) seconds.
+        
+        A short tail is merged into the previous range rather than scored
+        on its own.
+        
+        Returns:
+            List of (start, end) in seconds
+        """
+        step = step or self.segment_seconds
+        ranges = []
+        start = 0.0
+        while start < duration:
+            end = min(duration, start + step)
+            if ranges and end - start < step / 4:
+                ranges[-1] = (ranges[-1][0], end)
+            else:
+                ranges.append((start, end))
+            start = end
+        return ranges or [(0.0, duration)]
+    
+    def analyze_segments(self, file_path: Path, video_info: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Analyze a long video segment by segment.
+        
+        Each time range is decoded and scored on its own with the usual
+        frame budget, sampling and early exit, so memory stays bounded by
+        one segment regardless of length. Results are yielded as each
+        segment finishes, followed by a summary pooled over every scored
+        frame. The video is probed once, not per segment.
+        
+        Args:
+            file_path: Path to video file
+            video_info: Metadata from ``probe``, if already known
+        
+        Yields:
+            Dicts with ``type`` "segment" (one per range) then "summary"
+        """
+        video_info = video_info or self.probe(file_path)
+        duration = video_info["duration"]
+        if duration > settings.max_segmented_video_duration_seconds:
+            raise ValueError(
+                f"Video too long. Maximum duration: {settings.max_segmented_video_duration_seconds} seconds"
+            )
+        
+        all_frames = []
+        most_suspicious = None
+        
+        for index, (start, end) in enumerate(self.segment_ranges(duration)):
+            _, frame_results, early_exit, face_crops = self._score_frames(file_path, start, end - start, video_info)
+            real_probability, deepfake_likelihood = self._pool_frames(frame_results)
+            all_frames.extend(frame_results)
+            
+            segment = {
+                "type": "segment",
+                "index": index,
+                "start_seconds": round(start, 3),
+                "end_seconds": round(end, 3),
+                "real_probability": real_probability,
+                "deepfake_likelihood": deepfake_likelihood,
+                "frames_analyzed": len(frame_results),
+                "early_exit": early_exit,
+                "face_crops": face_crops
+            }
+            if frame_results and (most_suspicious is None or deepfake_likelihood > most_suspicious["deepfake_likelihood"]):
+                most_suspicious = segment
+            yield segment
+        
+        real_probability, deepfake_likelihood = self._pool_frames(all_frames)
+        yield {
+            "type": "summary",
+            "real_probability": real_probability,
+            "deepfake_likelihood": deepfake_likelihood,
+            "frames_analyzed": len(all_frames),
+            "segments": index + 1,
+            "most_suspicious_segment": most_suspicious["index"] if most_suspicious else None,
+            "duration_seconds": duration
+        }
+    
+    def score_range(self, file_path: Path, start: float, duration: float) -> Dict:
+        """
+        Score one time range of a video (the map step of distributed analysis).
+        
+        Returns:
+            JSON-serializable dict with the range start, per-frame scores,
+            early_exit and face_crops
+        """
+        _, frame_results, early_exit, face_crops = self._score_frames(file_path, start, duration)
+        return {
+            "start_seconds": start,
+            "frame_results": frame_results,
+            "early_exit": early_exit,
+            "face_crops": face_crops
+        }
+    
+    def combine_ranges(self, range_results: List[Dict], audio_result: Optional[Dict], duration: float) -> Dict:
+        """
+        Pool scored ranges into one video result (the reduce step).
+        
+        Frames are put back in time order and go through the same temporal
+        pooling and audio fusion as ``analyze``, so the result has the same
+        shape.
+        
+        Returns:
+            Dict with analysis results
+        """
+        range_results = sorted(range_results, key=lambda r: r["start_seconds"])
+        frame_results = [f for r in range_results for f in r["frame_results"]]
+        
+        _, visual_fake = self._pool_frames(frame_results)
+        fused, audio_fake = self._fuse_audio(visual_fake, audio_result)
+        face_crops = [r["face_crops"] for r in range_results if r["face_crops"] is not None]
+        
+        return {
+            "real_probability": 1 - fused,
+            "deepfake_likelihood": fused,
+            "frames_analyzed": len(frame_results),
+            "frame_budget": self.frame_budget * len(range_results),
+            "sampling_mode": self.sampling_mode,
+            "early_exit": any(r["early_exit"] for r in range_results),
+            "face_crops": sum(face_crops) if face_crops else None,
+            "duration_seconds": duration,
+            "visual_deepfake_likelihood": visual_fake,
+            "audio_fake_likelihood": audio_fake
+        }
+
+
+# Singleton instance
+_analyzer = None
+
+
+def get_video_analyzer() -> VideoAnalyzer:
+    """Get or create the video analyzer instance."""
+    global _analyzer
+    if _analyzer is None:
+        _analyzer = VideoAnalyzer()
+    return _analyzer
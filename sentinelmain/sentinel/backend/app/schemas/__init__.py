@@ -1 +1 @@
-# Schemas package
+# Schemas package
@@ -1,133 +1,189 @@
-"""
-Sentinel AI - Response Schemas
-Pydantic models for API responses.
-"""
-from pydantic import BaseModel, Field
-from typing import List, Literal
-from enum import Enum
-
-
-class Verdict(str, Enum):
-    """Possible verdicts for content analysis."""
-    SAFE = "Safe"
-    POSSIBLY_AI = "Possibly AI"
-    HIGH_RISK = "High Risk"
-
-
-class AnalysisResult(BaseModel):
-    """Standard analysis result returned by all endpoints."""
-    
-    risk_score: int = Field(
-        ..., 
-        ge=0, 
-        le=100, 
-        description="Risk score from 0 (safe) to 100 (high risk)"
-    )
-    verdict: Verdict = Field(
-        ..., 
-        description="Human-readable verdict"
-    )
-    explanations: List[str] = Field(
-        ..., 
-        min_length=1,
-        max_length=3,
-        description="2-3 simple explanations for the verdict"
-    )
-    action: str = Field(
-        ..., 
-        description="Single clear action recommendation"
-    )
-    content_type: Literal["text", "audio", "image", "video"] = Field(
-        ..., 
-        description="Type of content analyzed"
-    )
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "risk_score": 75,
-                "verdict": "Possibly AI",
-                "explanations": [
-                    "The text uses urgent language asking for immediate action",
-                    "Contains requests for personal financial information",
-                    "Writing style appears computer-generated"
-                ],
-                "action": "Do not click any links or share personal information",
-                "content_type": "text"
-            }
-        }
-
-
-class TextAnalysisRequest(BaseModel):
-    """Request body for text analysis."""
-    text: str = Field(
-        ..., 
-        min_length=1, 
-        max_length=10000,
-        description="Text content to analyze"
-    )
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "text": "Congratulations! You've won $1,000,000. Click here to claim your prize now!"
-            }
-        }
-
-
-class TextAnalysisDetails(BaseModel):
-    """Detailed classification results for text analysis."""
-    ai_likelihood: float = Field(..., ge=0, le=1, description="Probability text is AI-generated")
-    scam_intent: float = Field(..., ge=0, le=1, description="Probability of scam intent")
-    urgency_level: float = Field(..., ge=0, le=1, description="Level of artificial urgency")
-    financial_request: float = Field(..., ge=0, le=1, description="Presence of financial requests")
-    impersonation: float = Field(..., ge=0, le=1, description="Signs of impersonation")
-
-
-class TextAnalysisResult(AnalysisResult):
-    """Extended result for text analysis with detailed scores."""
-    details: TextAnalysisDetails
-
-
-class AudioAnalysisDetails(BaseModel):
-    """Detailed classification results for audio analysis."""
-    human_voice: float = Field(..., ge=0, le=1, description="Probability of real human voice")
-    tts_likelihood: float = Field(..., ge=0, le=1, description="Probability of text-to-speech")
-    voice_cloning: float = Field(..., ge=0, le=1, description="Probability of voice cloning")
-
-
-class AudioAnalysisResult(AnalysisResult):
-    """Extended result for audio analysis with detailed scores."""
-    details: AudioAnalysisDetails
-    duration_seconds: float = Field(..., description="Duration of analyzed audio")
-
-
-class ImageAnalysisDetails(BaseModel):
-    """Detailed classification results for image analysis."""
-    real_probability: float = Field(..., ge=0, le=1, description="Probability image is authentic")
-    ai_generated: float = Field(..., ge=0, le=1, description="Probability image is AI-generated")
-    manipulated: float = Field(..., ge=0, le=1, description="Probability image is manipulated")
-
-
-class ImageAnalysisResult(AnalysisResult):
-    """Extended result for image analysis with detailed scores."""
-    details: ImageAnalysisDetails
-
-
-class VideoAnalysisDetails(BaseModel):
-    """Detailed classification results for video analysis."""
-    real_probability: float = Field(..., ge=0, le=1, description="Probability video is authentic")
-    deepfake_likelihood: float = Field(..., ge=0, le=1, description="Probability of deepfake")
-    frames_analyzed: int = Field(..., description="Number of frames analyzed")
-
-
-class VideoAnalysisResult(AnalysisResult):
-    """Extended result for video analysis with detailed scores."""
-    details: VideoAnalysisDetails
-    duration_seconds: float = Field(..., description="Duration of analyzed video")
-
-
-class ErrorResponse(BaseModel):
-    """Error response model."""
-    error: str = Field(..., description="Error message")
-    detail: str = Field(None, description="Additional error details")
+"""
+Sentinel AI - Response Schemas
+Pydantic models for API responses.
+"""
+from pydantic import BaseModel, Field
+from typing import Dict, List, Literal, Optional, Union
+from enum import Enum
+
+
+class Verdict(str, Enum):
+    """Possible verdicts for content analysis."""
+    SAFE = "Safe"
+    POSSIBLY_AI = "Possibly AI"
+    HIGH_RISK = "High Risk"
+
+
+class AnalysisResult(BaseModel):
+    """Standard analysis result returned by all endpoints."""
+    
+    risk_score: int = Field(
+        ..., 
+        ge=0, 
+        le=100, 
+        description="Risk score from 0 (safe) to 100 (high risk)"
+    )
+    verdict: Verdict = Field(
+        ..., 
+        description="Human-readable verdict"
+    )
+    explanations: List[str] = Field(
+        ..., 
+        min_length=1,
+        max_length=3,
+        description="2-3 simple explanations for the verdict"
+    )
+    action: str = Field(
+        ..., 
+        description="Single clear action recommendation"
+    )
+    content_type: Literal["text", "audio", "image", "video"] = Field(
+        ..., 
+        description="Type of content analyzed"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "risk_score": 75,
+                "verdict": "Possibly AI",
+                "explanations": [
+                    "The text uses urgent language asking for immediate action",
+                    "Contains requests for personal financial information",
+                    "Writing style appears computer-generated"
+                ],
+                "action": "Do not click any links or share personal information",
+                "content_type": "text"
+            }
+        }
+
+
+class TextAnalysisRequest(BaseModel):
+    """Request body for text analysis."""
+    text: str = Field(
+        ..., 
+        min_length=1, 
+        max_length=10000,
+        description="Text content to analyze"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "text": "Congratulations! You've won $1,000,000. Click here to claim your prize now!"
+            }
+        }
+
+
+class TextAnalysisDetails(BaseModel):
+    """Detailed classification results for text analysis."""
+    ai_likelihood: float = Field(..., ge=0, le=1, description="Probability text is AI-generated")
+    scam_intent: float = Field(..., ge=0, le=1, description="Probability of scam intent")
+    urgency_level: float = Field(..., ge=0, le=1, description="Level of artificial urgency")
+    financial_request: float = Field(..., ge=0, le=1, description="Presence of financial requests")
+    impersonation: float = Field(..., ge=0, le=1, description="Signs of impersonation")
+
+
+class TextAnalysisResult(AnalysisResult):
+    """Extended result for text analysis with detailed scores."""
+    details: TextAnalysisDetails
+
+
+class AudioAnalysisDetails(BaseModel):
+    """Detailed classification results for audio analysis."""
+    human_voice: float = Field(..., ge=0, le=1, description="Probability of real human voice")
+    tts_likelihood: float = Field(..., ge=0, le=1, description="Probability of text-to-speech")
+    voice_cloning: float = Field(..., ge=0, le=1, description="Probability of voice cloning")
+    speech_ratio: Optional[float] = Field(None, ge=0, le=1, description="Fraction of the audio detected as speech")
+    compute_saved: Optional[float] = Field(None, ge=0, le=1, description="Fraction of samples skipped as silence or noise")
+    known_clip: Optional[str] = Field(None, description="Known scam clip this audio matched, if any")
+
+
+class AudioAnalysisResult(AnalysisResult):
+    """Extended result for audio analysis with detailed scores."""
+    details: AudioAnalysisDetails
+    duration_seconds: float = Field(..., description="Duration of analyzed audio")
+
+
+class ImageAnalysisDetails(BaseModel):
+    """Detailed classification results for image analysis."""
+    real_probability: float = Field(..., ge=0, le=1, description="Probability image is authentic")
+    ai_generated: float = Field(..., ge=0, le=1, description="Probability image is AI-generated")
+    manipulated: float = Field(..., ge=0, le=1, description="Probability image is manipulated")
+
+
+class ImageAnalysisResult(AnalysisResult):
+    """Extended result for image analysis with detailed scores."""
+    details: ImageAnalysisDetails
+
+
+class VideoAnalysisDetails(BaseModel):
+    """Detailed classification results for video analysis."""
+    real_probability: float = Field(..., ge=0, le=1, description="Probability video is authentic")
+    deepfake_likelihood: float = Field(..., ge=0, le=1, description="Probability of deepfake")
+    frames_analyzed: int = Field(..., description="Number of frames analyzed")
+    frame_budget: Optional[int] = Field(None, description="Maximum number of frames the analyzer could spend")
+    sampling_mode: Optional[str] = Field(None, description="Frame sampling strategy: adaptive or uniform")
+    early_exit: Optional[bool] = Field(None, description="Whether analysis stopped early on conclusive evidence")
+    face_crops: Optional[int] = Field(None, description="Frames scored as face crops (None when face ROI is off)")
+    visual_deepfake_likelihood: Optional[float] = Field(None, ge=0, le=1, description="Deepfake likelihood from frames alone")
+    audio_fake_likelihood: Optional[float] = Field(None, ge=0, le=1, description="Synthetic or cloned voice likelihood of the audio track (None without audio)")
+
+
+class VideoAnalysisResult(AnalysisResult):
+    """Extended result for video analysis with detailed scores."""
+    details: VideoAnalysisDetails
+    duration_seconds: float = Field(..., description="Duration of analyzed video")
+
+
+# Priority lane of a queued job: interactive checks run ahead of bulk work
+JobPriority = Literal["interactive", "bulk"]
+
+
+class JobStatus(BaseModel):
+    """Status of an asynchronous analysis job."""
+    job_id: str = Field(..., description="Job identifier")
+    status: Literal["queued", "running", "succeeded", "failed"] = Field(..., description="Job state")
+    content_type: Literal["audio", "video"] = Field(..., description="Type of content being analyzed")
+    result: Optional[Union[AudioAnalysisResult, VideoAnalysisResult]] = Field(
+        None, description="Analysis result once the job has succeeded"
+    )
+    error: Optional[str] = Field(None, description="Failure reason once the job has failed")
+
+
+class UploadCreateRequest(BaseModel):
+    """Request to start a resumable upload."""
+    filename: str = Field(..., description="Original file name (its extension must be allowed)")
+    content_type: Literal["audio", "video"] = Field(..., description="Type of content being uploaded")
+    size: int = Field(..., gt=0, description="Total size in bytes")
+
+
+class UploadStatus(BaseModel):
+    """State of a resumable upload."""
+    upload_id: str = Field(..., description="Upload identifier")
+    content_type: Literal["audio", "video"] = Field(..., description="Type of content being uploaded")
+    size: int = Field(..., description="Total size in bytes")
+    offset: int = Field(..., description="Bytes received so far; the next PATCH starts here")
+    expires_at: float = Field(..., description="Unix time after which an unfinished upload is discarded")
+
+
+class PresignedUpload(BaseModel):
+    """URL a client uploads a media file to directly."""
+    object_key: str = Field(..., description="Key to queue analysis with once the upload is done")
+    upload_url: str = Field(..., description="Presigned object storage URL")
+    method: Literal["PUT"] = Field(..., description="HTTP method to upload with")
+    headers: Dict[str, str] = Field(..., description="Headers the upload request must carry")
+    expires_at: float = Field(..., description="Unix time after which the URL is no longer accepted")
+
+
+class ObjectJobRequest(BaseModel):
+    """Request to analyze a file uploaded to object storage."""
+    object_key: str = Field(..., description="Key from POST /uploads/presigned")
+    callback_url: Optional[str] = Field(None, description="URL to POST the final job status to")
+    priority: Optional[JobPriority] = Field(None, description="Priority lane (default interactive); use bulk for batch reprocessing")
+
+
+class ErrorResponse(BaseModel):
+    """Error response model."""
+    error: str = Field(..., description="Error message")
+    detail: str = Field(None, description="Additional error details")
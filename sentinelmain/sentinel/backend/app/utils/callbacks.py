@@ -0,0 +1,71 @@
+"""
+Sentinel AI - Job Callbacks
+Checks job callback URLs so workers cannot be pointed at internal services.
+"""
+import asyncio
+import ipaddress
+import socket
+from typing import Optional
+from urllib.parse import urlsplit
+
+from fastapi import HTTPException
+
+from app.config import settings
+
+
+def check_callback_url(url: str):
+    """
+    Refuse callback URLs the workers must not POST to.
+    
+    With ``job_callback_allowed_hosts`` set, only those hosts are
+    accepted. Otherwise every address the host resolves to must be
+    public: loopback, private, link-local (including cloud metadata
+    endpoints), multicast and reserved addresses are refused. Resolves
+    the host, so this blocks; the workers check again before delivering,
+    in case the name has been re-pointed since the job was queued.
+    
+    Args:
+        url: Callback URL from the client
+    
+    Raises:
+        ValueError: If the URL is refused
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError("callback_url must be an http(s) URL")
+    host = parts.hostname
+    
+    allowed = settings.job_callback_allowed_hosts_list
+    if allowed:
+        if host not in allowed:
+            raise ValueError(f"callback_url host is not allowed: {host}")
+        return
+    
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except (socket.gaierror, UnicodeError) as e:
+        raise ValueError(f"callback_url host does not resolve: {host}") from e
+    
+    for *_, sockaddr in addresses:
+        address = ipaddress.ip_address(sockaddr[0].split("%", 1)[0])
+        if address.version == 6 and address.ipv4_mapped:
+            address = address.ipv4_mapped
+        if not address.is_global or address.is_multicast:
+            raise ValueError(f"callback_url must resolve to a public address: {host}")
+
+
+async def validate_callback_url(callback_url: Optional[str]):
+    """
+    Check a job's callback URL before queueing it, if one was given.
+    
+    Raises:
+        HTTPException: 400 if the URL is refused
+    """
+    if not callback_url:
+        return
+    try:
+        # DNS lookups are blocking; keep them off the event loop
+        await asyncio.to_thread(check_callback_url, callback_url)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
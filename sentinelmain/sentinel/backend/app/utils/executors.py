@@ -0,0 +1,253 @@
+"""
+Sentinel AI - Analysis Executors
+Bounded per-modality worker pools that keep analysis off the event loop.
+"""
+import asyncio
+import math
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Dict, Iterator, Optional
+
+from fastapi import HTTPException
+
+from app.config import settings
+
+
+class ExecutorSaturated(Exception):
+    """Raised when an executor's queue is full."""
+    
+    def __init__(self, name: str, retry_after: int):
+        super().__init__(f"{name} analysis queue is full")
+        self.retry_after = retry_after
+
+
+class BoundedExecutor:
+    """
+    Thread pool with admission control for one modality.
+    
+    At most ``max_workers`` analyses run at once and at most ``max_queued``
+    more wait for a thread; beyond that, work is refused immediately rather
+    than piling up behind a slow backlog. A slot is held until the work
+    actually finishes, even if the caller gave up waiting, so timed-out
+    requests still count against capacity.
+    
+    Threads rather than processes: librosa, OpenCV, ffmpeg and ONNX Runtime
+    release the GIL in their heavy loops, and workers share the loaded
+    models and the audio micro-batcher.
+    """
+    
+    def __init__(self, name: str, max_workers: int, max_queued: int, timeout: float):
+        """
+        Create the pool.
+        
+        Args:
+            name: Modality name, used for thread names and errors
+            max_workers: Concurrent analyses
+            max_queued: Analyses allowed to wait for a free worker
+            timeout: Seconds a request waits for its result
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.capacity = max_workers + max_queued
+        self.timeout = timeout
+        
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"analyze-{name}")
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._stats = {"completed": 0, "rejected": 0, "timed_out": 0, "busy_seconds": 0.0}
+    
+    def retry_after(self) -> int:
+        """Estimate seconds until a slot frees up, from the mean service time."""
+        completed = self._stats["completed"]
+        mean = self._stats["busy_seconds"] / completed if completed else 1.0
+        return max(1, math.ceil(mean * self._in_flight / self.max_workers))
+    
+    def submit(self, fn: Callable, *args) -> Future:
+        """
+        Queue work if there is room.
+        
+        Raises:
+            ExecutorSaturated: If running plus queued work is at capacity
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._stats["rejected"] += 1
+                raise ExecutorSaturated(self.name, self.retry_after())
+            self._in_flight += 1
+        
+        def timed():
+            started = time.monotonic()
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._stats["busy_seconds"] += time.monotonic() - started
+                    self._stats["completed"] += 1
+        
+        future = self._pool.submit(timed)
+        future.add_done_callback(self._release)
+        return future
+    
+    def _release(self, future: Future):
+        """Free the slot once the work is finished (or cancelled before it started)."""
+        with self._lock:
+            self._in_flight -= 1
+    
+    def _admit(self, fn: Callable, *args, cleanup: Optional[Callable[[], None]] = None) -> Future:
+        """
+        Submit work for a request, refusing it with a 503 when saturated.
+        
+        ``cleanup`` is called once the work has finished, or at once if
+        the work is refused.
+        """
+        try:
+            future = self.submit(fn, *args)
+        except ExecutorSaturated as e:
+            if cleanup is not None:
+                cleanup()
+            raise HTTPException(
+                status_code=503,
+                detail=f"Server busy analyzing {self.name}. Please retry shortly.",
+                headers={"Retry-After": str(e.retry_after)}
+            )
+        if cleanup is not None:
+            future.add_done_callback(lambda _: cleanup())
+        return future
+    
+    async def run(self, fn: Callable, *args, cleanup: Optional[Callable[[], None]] = None):
+        """
+        Run work in the pool and await its result.
+        
+        Args:
+            fn: Work to run
+            *args: Its arguments
+            cleanup: Called once the work has finished, even if this call
+                timed out first (e.g. to close a file the work reads), or
+                at once if the work is refused
+        
+        Raises:
+            HTTPException: 503 with Retry-After when saturated, 504 on timeout
+        """
+        future = self._admit(fn, *args, cleanup=cleanup)
+        
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            # Drops it if still queued; running work finishes and frees its slot
+            future.cancel()
+            with self._lock:
+                self._stats["timed_out"] += 1
+            raise HTTPException(
+                status_code=504,
+                detail=f"{self.name.capitalize()} analysis timed out"
+            )
+    
+    def iterate(
+        self,
+        fn: Callable[..., Iterator],
+        *args,
+        cleanup: Optional[Callable[[], None]] = None
+    ) -> AsyncIterator:
+        """
+        Run a generator in the pool and stream its items to the event loop.
+        
+        Admission happens here rather than on the first item, so a
+        saturated pool refuses the request with a 503 before a streaming
+        response has started. The generator holds one slot until it is
+        exhausted, fails, or the consumer stops iterating. There is no
+        overall timeout: streaming long work is what this is for.
+        
+        Args:
+            fn: Generator function
+            *args: Its arguments
+            cleanup: As for ``run``
+        
+        Returns:
+            Async iterator of the generator's items; an exception in the
+            generator is raised from it
+        
+        Raises:
+            HTTPException: 503 with Retry-After when saturated
+        """
+        loop = asyncio.get_running_loop()
+        items: asyncio.Queue = asyncio.Queue()
+        stopped = threading.Event()
+        
+        def produce():
+            generator = fn(*args)
+            try:
+                for item in generator:
+                    if stopped.is_set():
+                        return
+                    loop.call_soon_threadsafe(items.put_nowait, (True, item))
+            except Exception as e:
+                loop.call_soon_threadsafe(items.put_nowait, (False, e))
+            else:
+                loop.call_soon_threadsafe(items.put_nowait, (False, None))
+            finally:
+                generator.close()
+        
+        self._admit(produce, cleanup=cleanup)
+        
+        async def consume():
+            try:
+                while True:
+                    is_item, value = await items.get()
+                    if is_item:
+                        yield value
+                    elif value is not None:
+                        raise value
+                    else:
+                        return
+            finally:
+                # The client went away: stop the work after its current item
+                stopped.set()
+        
+        return consume()
+    
+    def stats(self) -> Dict:
+        """Report queue depth and throughput."""
+        with self._lock:
+            completed = self._stats["completed"]
+            return {
+                "workers": self.max_workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "queued": max(0, self._in_flight - self.max_workers),
+                "completed": completed,
+                "rejected": self._stats["rejected"],
+                "timed_out": self._stats["timed_out"],
+                "mean_seconds": self._stats["busy_seconds"] / completed if completed else 0.0
+            }
+
+
+# Singleton instances, one per modality
+_executors: Dict[str, BoundedExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_executor(modality: str) -> BoundedExecutor:
+    """Get or create the bounded executor for a modality (text, image, audio, video)."""
+    executor = _executors.get(modality)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(modality)
+            if executor is None:
+                workers = settings.analysis_workers or os.cpu_count() or 1
+                if modality == "video":
+                    workers = settings.video_analysis_workers
+                executor = BoundedExecutor(
+                    modality,
+                    max_workers=workers,
+                    max_queued=settings.analysis_max_queued,
+                    timeout=settings.analysis_timeout_seconds
+                )
+                _executors[modality] = executor
+    return executor
+
+
+def executor_stats() -> Dict[str, Dict]:
+    """Stats for every executor created so far."""
+    return {name: executor.stats() for name, executor in _executors.items()}
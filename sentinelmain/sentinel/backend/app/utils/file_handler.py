@@ -1,170 +1,405 @@
-"""
-Sentinel AI - File Handler Utility
-Handles file uploads, validation, and cleanup.
-"""
-import os
-import time
-import uuid
-import aiofiles
-from pathlib import Path
-from typing import Tuple, Optional
-from fastapi import UploadFile, HTTPException
-
-from app.config import settings
-
-
-# Allowed file extensions by type
-ALLOWED_EXTENSIONS = {
-    "image": {".jpg", ".jpeg", ".png"},
-    "audio": {".mp3", ".wav", ".m4a", ".ogg"},
-    "video": {".mp4", ".mov", ".avi", ".webm"}
-}
-
-# MIME type mappings
-MIME_TYPES = {
-    "image": {"image/jpeg", "image/png"},
-    "audio": {"audio/mpeg", "audio/wav", "audio/x-wav", "audio/mp4", "audio/ogg"},
-    "video": {"video/mp4", "video/quicktime", "video/x-msvideo", "video/webm"}
-}
-
-
-def validate_file_type(file: UploadFile, expected_type: str) -> bool:
-    """
-    Validate that a file matches the expected type.
-    
-    Args:
-        file: The uploaded file
-        expected_type: One of 'image', 'audio', 'video'
-        
-    Returns:
-        True if valid, raises HTTPException otherwise
-    """
-    # Check extension
-    ext = Path(file.filename).suffix.lower()
-    if ext not in ALLOWED_EXTENSIONS.get(expected_type, set()):
-        allowed = ", ".join(ALLOWED_EXTENSIONS[expected_type])
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file type. Allowed extensions for {expected_type}: {allowed}"
-        )
-    
-    # Check MIME type if available
-    if file.content_type:
-        valid_mimes = MIME_TYPES.get(expected_type, set())
-        if file.content_type not in valid_mimes:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid content type for {expected_type}: {file.content_type}"
-            )
-    
-    return True
-
-
-async def save_upload(file: UploadFile, file_type: str) -> Tuple[Path, str]:
-    """
-    Save an uploaded file to disk.
-    
-    Args:
-        file: The uploaded file
-        file_type: Type of file (image, audio, video)
-        
-    Returns:
-        Tuple of (file_path, file_id)
-    """
-    # Validate file type
-    validate_file_type(file, file_type)
-    
-    # Generate unique filename
-    file_id = str(uuid.uuid4())
-    ext = Path(file.filename).suffix.lower()
-    filename = f"{file_id}{ext}"
-    file_path = settings.upload_dir / filename
-    
-    # Check file size while saving
-    total_size = 0
-    max_size = settings.max_upload_size_mb * 1024 * 1024  # Convert to bytes
-    
-    async with aiofiles.open(file_path, "wb") as f:
-        while chunk := await file.read(1024 * 1024):  # 1MB chunks
-            total_size += len(chunk)
-            if total_size > max_size:
-                # Clean up partial file
-                await f.close()
-                file_path.unlink(missing_ok=True)
-                raise HTTPException(
-                    status_code=413,
-                    detail=f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
-                )
-            await f.write(chunk)
-    
-    return file_path, file_id
-
-
-def delete_file(file_path: Path) -> bool:
-    """
-    Delete a file from disk.
-    
-    Args:
-        file_path: Path to the file
-        
-    Returns:
-        True if deleted, False if not found
-    """
-    try:
-        if file_path.exists():
-            file_path.unlink()
-            return True
-        return False
-    except Exception as e:
-        print(f"Error deleting file {file_path}: {e}")
-        return False
-
-
-def cleanup_old_files() -> int:
-    """
-    Clean up files older than the retention period.
-    
-    Returns:
-        Number of files deleted
-    """
-    deleted = 0
-    current_time = time.time()
-    retention = settings.file_retention_seconds
-    
-    if not settings.upload_dir.exists():
-        return 0
-    
-    for file_path in settings.upload_dir.iterdir():
-        if file_path.is_file():
-            file_age = current_time - file_path.stat().st_mtime
-            if file_age > retention:
-                if delete_file(file_path):
-                    deleted += 1
-    
-    if deleted > 0:
-        print(f"🧹 Cleaned up {deleted} old files")
-    
-    return deleted
-
-
-def get_file_info(file_path: Path) -> Optional[dict]:
-    """
-    Get information about a file.
-    
-    Args:
-        file_path: Path to the file
-        
-    Returns:
-        Dict with file info or None if not found
-    """
-    if not file_path.exists():
-        return None
-    
-    stat = file_path.stat()
-    return {
-        "path": str(file_path),
-        "size_bytes": stat.st_size,
-        "size_mb": round(stat.st_size / (1024 * 1024), 2),
-        "created": stat.st_ctime,
-        "modified": stat.st_mtime
-    }
+"""
+Sentinel AI - File Handler Utility
+Handles file uploads, validation, and cleanup.
+"""
+import asyncio
+import hashlib
+import uuid
+import aiofiles
+from pathlib import Path
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, BinaryIO, Tuple, Optional
+from fastapi import HTTPException, Request, UploadFile
+from starlette.datastructures import Headers
+
+from app.config import settings
+from app.utils.upload_store import DIGEST_ALGORITHM, content_digest, store_upload
+
+
+# Allowed file extensions by type
+ALLOWED_EXTENSIONS = {
+    "image": {".jpg", ".jpeg", ".png"},
+    "audio": {".mp3", ".wav", ".m4a", ".ogg"},
+    "video": {".mp4", ".mov", ".avi", ".webm"}
+}
+
+# MIME type mappings
+MIME_TYPES = {
+    "image": {"image/jpeg", "image/png"},
+    "audio": {"audio/mpeg", "audio/wav", "audio/x-wav", "audio/mp4", "audio/ogg"},
+    "video": {"video/mp4", "video/quicktime", "video/x-msvideo", "video/webm"}
+}
+
+# Container formats accepted by type, identified from magic bytes
+ALLOWED_FORMATS = {
+    "image": {"jpeg", "png"},
+    "audio": {"wav", "mp3", "mp4", "ogg"},
+    "video": {"mp4", "webm", "avi"}
+}
+
+# Bytes needed to identify any of the formats above
+SNIFF_BYTES = 12
+
+# Top-level atoms a QuickTime/MP4 file can start with
+MP4_ATOMS = {b"ftyp", b"moov", b"mdat", b"wide", b"free", b"skip"}
+
+
+def sniff_format(head: bytes) -> Optional[str]:
+    """
+    Identify a container format from the first bytes of a file.
+    
+    Args:
+        head: At least ``SNIFF_BYTES`` bytes (fewer only for tiny files)
+        
+    Returns:
+        Format name, or None if unrecognized
+    """
+    if head.startswith(b"\xff\xd8\xff"):
+        return "jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "png"
+    if head.startswith(b"RIFF"):
+        return {b"WAVE": "wav", b"AVI ": "avi"}.get(head[8:12])
+    if head.startswith(b"ID3") or (len(head) > 1 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0):
+        return "mp3"
+    if head[4:8] in MP4_ATOMS:
+        return "mp4"
+    if head.startswith(b"\x1a\x45\xdf\xa3"):
+        return "webm"
+    if head.startswith(b"OggS"):
+        return "ogg"
+    return None
+
+
+def validate_magic(head: bytes, expected_type: str) -> bool:
+    """
+    Validate that a file's contents match the expected type.
+    
+    Args:
+        head: First bytes of the file
+        expected_type: One of 'image', 'audio', 'video'
+        
+    Returns:
+        True if valid, raises HTTPException otherwise
+    """
+    if sniff_format(head) not in ALLOWED_FORMATS.get(expected_type, set()):
+        raise HTTPException(
+            status_code=400,
+            detail=f"File contents are not a supported {expected_type} format"
+        )
+    return True
+
+
+def validate_file_type(file: UploadFile, expected_type: str) -> bool:
+    """
+    Validate that a file matches the expected type.
+    
+    Args:
+        file: The uploaded file
+        expected_type: One of 'image', 'audio', 'video'
+        
+    Returns:
+        True if valid, raises HTTPException otherwise
+    """
+    # Check extension
+    ext = Path(file.filename).suffix.lower()
+    if ext not in ALLOWED_EXTENSIONS.get(expected_type, set()):
+        allowed = ", ".join(ALLOWED_EXTENSIONS[expected_type])
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type. Allowed extensions for {expected_type}: {allowed}"
+        )
+    
+    # Check MIME type if available
+    if file.content_type:
+        valid_mimes = MIME_TYPES.get(expected_type, set())
+        if file.content_type not in valid_mimes:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid content type for {expected_type}: {file.content_type}"
+            )
+    
+    return True
+
+
+async def _read_chunks(file: UploadFile) -> AsyncIterator[bytes]:
+    """Read an upload in 1MB chunks."""
+    while chunk := await file.read(1024 * 1024):
+        yield chunk
+
+
+async def write_chunks(
+    chunks: AsyncIterator[bytes],
+    f,
+    hasher=None,
+    written: int = 0,
+    max_size: Optional[int] = None
+) -> int:
+    """
+    Append chunks to an open file, hashing them and enforcing the size limit.
+    
+    Args:
+        chunks: Async iterator of byte chunks
+        f: File opened with aiofiles for writing
+        hasher: Optional hashlib object updated with every chunk
+        written: Bytes already in the file
+        max_size: Limit on the total size (default ``max_upload_size_mb``)
+        
+    Returns:
+        Total bytes in the file
+    """
+    if max_size is None:
+        max_size = settings.max_upload_size_mb * 1024 * 1024
+    
+    async for chunk in chunks:
+        written += len(chunk)
+        if written > max_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size: {max_size // (1024 * 1024)}MB"
+            )
+        if hasher is not None:
+            hasher.update(chunk)
+        await f.write(chunk)
+    return written
+
+
+async def save_upload(
+    file: UploadFile,
+    file_type: str,
+    retention: Optional[float] = None
+) -> Tuple[Path, str]:
+    """
+    Save an uploaded file to the content-addressed store.
+    
+    The digest is computed chunk by chunk as the file is written, so
+    identical uploads are detected without reading the data twice and
+    are stored only once. The file is deleted by the janitor after
+    ``retention`` seconds unless its request deletes it first.
+    
+    Args:
+        file: The uploaded file
+        file_type: Type of file (image, audio, video)
+        retention: Seconds to keep the file (default ``file_retention_seconds``)
+        
+    Returns:
+        Tuple of (file_path, content_digest)
+    """
+    # Validate file type
+    validate_file_type(file, file_type)
+    
+    # Write to a private partial file first
+    ext = Path(file.filename).suffix.lower()
+    partial = settings.upload_dir / f".{uuid.uuid4()}.part"
+    hasher = hashlib.new(DIGEST_ALGORITHM)
+    
+    # Check the contents before anything is written
+    validate_magic(await file.read(SNIFF_BYTES), file_type)
+    await file.seek(0)
+    
+    # Hash and check file size while saving
+    try:
+        async with aiofiles.open(partial, "wb") as f:
+            await write_chunks(_read_chunks(file), f, hasher)
+    except BaseException:
+        # Clean up partial file (too large, or the client went away)
+        partial.unlink(missing_ok=True)
+        raise
+    
+    digest = hasher.hexdigest()
+    return store_upload(partial, digest, ext, retention), digest
+
+
+def upload_request_body(description: str) -> dict:
+    """OpenAPI request body for a route that takes ``memory_upload``."""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["file"],
+                        "properties": {"file": {"type": "string", "format": "binary", "description": description}}
+                    }
+                }
+            }
+        }
+    }
+
+
+async def memory_upload(request: Request) -> AsyncIterator[UploadFile]:
+    """
+    Parse a multipart request's ``file`` field, in memory where it fits.
+    
+    ``File(...)`` parameters go through Starlette's form parser, which
+    spools every file over 1MB to disk. Image and audio routes take their
+    upload through this dependency instead: the part is streamed into a
+    ``SpooledTemporaryFile`` that stays in memory up to
+    ``upload_memory_threshold_mb``, so ``read_upload`` can hand it to the
+    decoder without touching disk. Uploads over ``max_upload_size_mb``
+    are refused while they are still streaming. Other form fields are
+    ignored.
+    
+    Yields:
+        The upload; its file is closed when the request ends
+    """
+    try:
+        from python_multipart.multipart import MultipartParser, parse_options_header
+    except ImportError:  # python-multipart < 0.0.13
+        from multipart.multipart import MultipartParser, parse_options_header
+    
+    content_type, options = parse_options_header(request.headers.get("content-type", ""))
+    boundary = options.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data upload")
+    
+    max_size = settings.max_upload_size_mb * 1024 * 1024
+    part = {"field": b"", "value": b"", "headers": {}}
+    upload = {"file": None, "target": None, "size": 0, "filename": None, "content_type": None}
+    
+    def on_part_begin():
+        part["headers"] = {}
+    
+    def on_header_field(data, start, end):
+        part["field"] += data[start:end]
+    
+    def on_header_value(data, start, end):
+        part["value"] += data[start:end]
+    
+    def on_header_end():
+        part["headers"][part["field"].lower()] = part["value"]
+        part["field"], part["value"] = b"", b""
+    
+    def on_headers_finished():
+        _, disposition = parse_options_header(part["headers"].get(b"content-disposition", b""))
+        if disposition.get(b"name") != b"file" or b"filename" not in disposition or upload["file"]:
+            return
+        upload["file"] = upload["target"] = SpooledTemporaryFile(
+            max_size=settings.upload_memory_threshold_mb * 1024 * 1024
+        )
+        upload["filename"] = disposition[b"filename"].decode("utf-8", "replace")
+        upload["content_type"] = part["headers"].get(b"content-type", b"").decode("latin-1")
+    
+    def on_part_data(data, start, end):
+        if upload["target"] is not None:
+            upload["target"].write(data[start:end])
+            upload["size"] += end - start
+    
+    def on_part_end():
+        upload["target"] = None
+    
+    parser = MultipartParser(boundary, callbacks={
+        "on_part_begin": on_part_begin,
+        "on_header_field": on_header_field,
+        "on_header_value": on_header_value,
+        "on_header_end": on_header_end,
+        "on_headers_finished": on_headers_finished,
+        "on_part_data": on_part_data,
+        "on_part_end": on_part_end
+    })
+    
+    try:
+        async for chunk in request.stream():
+            parser.write(chunk)
+            if upload["size"] > max_size:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
+                )
+        parser.finalize()
+        if upload["file"] is None:
+            raise HTTPException(status_code=400, detail="No file uploaded in the 'file' field")
+    except BaseException:
+        if upload["file"] is not None:
+            upload["file"].close()
+        raise
+    
+    upload["file"].seek(0)
+    file = UploadFile(
+        upload["file"],
+        size=upload["size"],
+        filename=upload["filename"],
+        headers=Headers({"content-type": upload["content_type"]} if upload["content_type"] else {})
+    )
+    try:
+        yield file
+    finally:
+        # After read_upload this is only the empty placeholder
+        file.file.close()
+
+
+def _hash_file(f: BinaryIO) -> Tuple[int, str]:
+    """Size and content digest of a file object, read from the start."""
+    hasher = hashlib.new(DIGEST_ALGORITHM)
+    size = 0
+    f.seek(0)
+    while chunk := f.read(1024 * 1024):
+        size += len(chunk)
+        hasher.update(chunk)
+    return size, hasher.hexdigest()
+
+
+async def read_upload(file: UploadFile, file_type: str) -> Tuple[BinaryIO, str]:
+    """
+    Take over an upload's spooled file for direct decoding.
+    
+    Nothing is written to ``upload_dir`` and nothing is copied: the
+    parsed file is used as is. Uploads from ``memory_upload`` are held
+    in memory up to ``upload_memory_threshold_mb`` and larger ones in an
+    anonymous temporary file. The file is detached from the request, which would
+    otherwise close it when it ends, while an analysis that timed out
+    may still be reading it; the caller must close it.
+    
+    Args:
+        file: The uploaded file
+        file_type: Type of file (image, audio)
+        
+    Returns:
+        Tuple of (file positioned at the start, content_digest)
+    """
+    # Validate file type and contents
+    validate_file_type(file, file_type)
+    validate_magic(await file.read(SNIFF_BYTES), file_type)
+    
+    buffer = file.file
+    file.file = SpooledTemporaryFile()
+    
+    try:
+        # Reading a spilled upload blocks; keep it off the event loop
+        size, digest = await asyncio.to_thread(_hash_file, buffer)
+        if size > settings.max_upload_size_mb * 1024 * 1024:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
+            )
+    except BaseException:
+        buffer.close()
+        raise
+    
+    buffer.seek(0)
+    return buffer, digest
+
+
+def get_file_info(file_path: Path) -> Optional[dict]:
+    """
+    Get information about a file.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Dict with file info or None if not found
+    """
+    if not file_path.exists():
+        return None
+    
+    stat = file_path.stat()
+    return {
+        "path": str(file_path),
+        "digest": content_digest(file_path),
+        "size_bytes": stat.st_size,
+        "size_mb": round(stat.st_size / (1024 * 1024), 2),
+        "created": stat.st_ctime,
+        "modified": stat.st_mtime
+    }
@@ -0,0 +1,168 @@
+"""
+Sentinel AI - Upload Janitor
+Deletes expired uploads from an in-memory expiry index on a background thread.
+"""
+import heapq
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+
+
+# Files deleted per wake-up, so a burst of expiries never holds the lock long
+BATCH_SIZE = 256
+
+
+class UploadJanitor:
+    """
+    Expiry index for uploaded files.
+    
+    ``save_upload`` records each file's deadline in a min-heap; a
+    background thread sleeps until the earliest deadline and deletes
+    expired files in batches. Nothing scans the upload directory while
+    serving, so cleanup cost follows the number of expiring files, not
+    the number on disk, and never runs on the event loop.
+    
+    Files already deleted by their request or task are simply skipped
+    when their deadline comes. A full directory scan runs once, at
+    startup, to pick up files left behind by a previous process.
+    """
+    
+    def __init__(self):
+        """Create an empty index; call ``start`` to begin deleting."""
+        self._heap: List[Tuple[float, str]] = []
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"scheduled": 0, "deleted": 0, "recovered": 0}
+    
+    def schedule(self, file_path: Path, retention: Optional[float] = None):
+        """
+        Delete a file once its retention period has passed.
+        
+        Args:
+            file_path: File to delete
+            retention: Seconds to keep it (default ``file_retention_seconds``)
+        """
+        if self._thread is None:
+            # Not running in this process (a Celery worker): the task deletes
+            # its file, and the API's startup scan catches anything left over
+            return
+        if retention is None:
+            retention = settings.file_retention_seconds
+        self._push(time.time() + retention, file_path)
+    
+    def _push(self, deadline: float, file_path: Path):
+        """Add an entry, waking the thread if it is now the earliest."""
+        with self._cond:
+            heapq.heappush(self._heap, (deadline, str(file_path)))
+            self._stats["scheduled"] += 1
+            if self._heap[0][0] == deadline:
+                self._cond.notify()
+    
+    def _next_batch(self) -> Optional[List[str]]:
+        """Wait for expired entries; None once stopped."""
+        with self._cond:
+            while not self._stopped:
+                now = time.time()
+                if self._heap and self._heap[0][0] <= now:
+                    batch = []
+                    while self._heap and self._heap[0][0] <= now and len(batch) < BATCH_SIZE:
+                        batch.append(heapq.heappop(self._heap)[1])
+                    return batch
+                self._cond.wait(self._heap[0][0] - now if self._heap else None)
+            return None
+    
+    def _recover(self):
+        """
+        Index files left by a previous process and delete expired ones.
+        
+        Their origin is unknown, so leftovers are kept for the longer of the
+        upload and job retention periods in case a worker still needs them.
+        """
+        from app.utils.upload_store import release_orphaned_blobs
+        
+        deleted = self._recover_dir(
+            settings.upload_dir,
+            max(settings.file_retention_seconds, settings.job_ttl_seconds)
+        )
+        deleted += self._recover_dir(
+            settings.upload_dir / "resumable",
+            settings.resumable_upload_ttl_seconds
+        )
+        deleted += release_orphaned_blobs(settings.file_retention_seconds)
+        self._stats["deleted"] += deleted
+        if deleted > 0:
+            print(f"🧹 Cleaned up {deleted} old files")
+    
+    def _recover_dir(self, directory: Path, retention: float) -> int:
+        """Index the files in one directory; returns how many were deleted."""
+        from app.utils.upload_store import delete_file
+        
+        if not directory.exists():
+            return 0
+        
+        now = time.time()
+        deleted = 0
+        for entry in directory.iterdir():
+            try:
+                if not entry.is_file():
+                    continue
+                deadline = entry.stat().st_mtime + retention
+            except FileNotFoundError:
+                continue
+            if deadline <= now:
+                deleted += delete_file(entry)
+            else:
+                self._push(deadline, entry)
+                self._stats["recovered"] += 1
+        return deleted
+    
+    def _run(self):
+        """Thread body: recover, then delete batches as they expire."""
+        from app.utils.upload_store import delete_file
+        
+        try:
+            self._recover()
+        except Exception as e:
+            print(f"Upload directory scan failed: {e}")
+        
+        while (batch := self._next_batch()) is not None:
+            deleted = sum(delete_file(Path(path)) for path in batch)
+            self._stats["deleted"] += deleted
+    
+    def start(self):
+        """Start the background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="upload-janitor", daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        """Stop the background thread; pending files are recovered on the next start."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+    
+    def stats(self) -> Dict:
+        """Index size and deletion counts."""
+        with self._cond:
+            return {**self._stats, "pending": len(self._heap)}
+
+
+# Singleton instance
+_janitor: Optional[UploadJanitor] = None
+_janitor_lock = threading.Lock()
+
+
+def get_janitor() -> UploadJanitor:
+    """Get or create the upload janitor."""
+    global _janitor
+    if _janitor is None:
+        with _janitor_lock:
+            if _janitor is None:
+                _janitor = UploadJanitor()
+    return _janitor
@@ -0,0 +1,366 @@
+"""
+Sentinel AI - Object Storage
+Presigned uploads to an S3-compatible store and ranged downloads for workers.
+"""
+import hashlib
+import hmac
+import re
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import quote, urlsplit
+
+import httpx
+from fastapi import HTTPException
+
+from app.config import settings
+from app.utils.file_handler import (
+    ALLOWED_EXTENSIONS,
+    SNIFF_BYTES,
+    validate_magic
+)
+from app.utils.results import JobRejected
+from app.utils.upload_store import DIGEST_ALGORITHM, store_upload
+
+
+# Keys are generated by the API, so jobs can only read what it handed out
+OBJECT_KEY_RE = re.compile(r"^(audio|video)/[0-9a-f]{32}\.[a-z0-9]+$")
+
+# Job sources in object storage are passed to tasks as "s3://<bucket>/<key>"
+OBJECT_SCHEME = "s3://"
+
+SIGNING_ALGORITHM = "AWS4-HMAC-SHA256"
+
+# Attempts per range before a download gives up
+RANGE_ATTEMPTS = 3
+
+
+def storage_enabled() -> bool:
+    """Whether an object store is configured."""
+    return bool(settings.object_storage_endpoint)
+
+
+def _require_storage():
+    """Refuse object storage requests when no store is configured."""
+    if not storage_enabled():
+        raise HTTPException(status_code=503, detail="Object storage is not configured")
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    """HMAC-SHA256 of a string."""
+    return hmac.new(key, message.encode("utf-8"), hashlib.sha256).digest()
+
+
+def _presign(
+    method: str,
+    host: str,
+    path: str,
+    expires_seconds: int,
+    signed_headers: Optional[Dict[str, str]] = None,
+    now: Optional[datetime] = None
+) -> str:
+    """
+    Build the query string of an AWS Signature Version 4 presigned request.
+    
+    Args:
+        method: HTTP method the URL is valid for
+        host: Host (and port) the request is sent to
+        path: Request path, already URI-encoded
+        expires_seconds: Lifetime of the URL
+        signed_headers: Headers the request must carry, besides Host
+        now: Signing time (default: the current time)
+    
+    Returns:
+        Query string including the signature
+    """
+    now = now or datetime.now(timezone.utc)
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    datestamp = now.strftime("%Y%m%d")
+    scope = f"{datestamp}/{settings.object_storage_region}/s3/aws4_request"
+    
+    headers = {"host": host}
+    for name, value in (signed_headers or {}).items():
+        headers[name.lower()] = str(value).strip()
+    header_names = ";".join(sorted(headers))
+    
+    params = {
+        "X-Amz-Algorithm": SIGNING_ALGORITHM,
+        "X-Amz-Credential": f"{settings.object_storage_key}/{scope}",
+        "X-Amz-Date": amz_date,
+        "X-Amz-Expires": str(expires_seconds),
+        "X-Amz-SignedHeaders": header_names
+    }
+    query = "&".join(
+        f"{quote(name, safe='-_.~')}={quote(value, safe='-_.~')}"
+        for name, value in sorted(params.items())
+    )
+    
+    canonical_request = "\n".join([
+        method,
+        path,
+        query,
+        "".join(f"{name}:{headers[name]}\n" for name in sorted(headers)),
+        header_names,
+        "UNSIGNED-PAYLOAD"
+    ])
+    string_to_sign = "\n".join([
+        SIGNING_ALGORITHM,
+        amz_date,
+        scope,
+        hashlib.sha256(canonical_request.encode("utf-8")).hexdigest()
+    ])
+    
+    key = _hmac(f"AWS4{settings.object_storage_secret}".encode("utf-8"), datestamp)
+    for part in (settings.object_storage_region, "s3", "aws4_request"):
+        key = _hmac(key, part)
+    signature = hmac.new(key, string_to_sign.encode("utf-8"), hashlib.sha256).hexdigest()
+    
+    return f"{query}&X-Amz-Signature={signature}"
+
+
+def presign_url(
+    method: str,
+    object_key: str,
+    expires_seconds: Optional[int] = None,
+    signed_headers: Optional[Dict[str, str]] = None,
+    public: bool = False
+) -> str:
+    """
+    Presign a request for one object (path-style addressing).
+    
+    Args:
+        method: HTTP method the URL is valid for
+        object_key: Key within ``object_storage_bucket``
+        expires_seconds: Lifetime of the URL (default ``object_storage_presign_seconds``)
+        signed_headers: Headers the request must carry, e.g. Content-Length
+        public: Sign for ``object_storage_public_endpoint`` (URLs handed to clients)
+    
+    Returns:
+        Presigned URL
+    """
+    endpoint = settings.object_storage_endpoint
+    if public and settings.object_storage_public_endpoint:
+        endpoint = settings.object_storage_public_endpoint
+    url = urlsplit(endpoint)
+    
+    path = quote(f"{url.path.rstrip('/')}/{settings.object_storage_bucket}/{object_key}", safe="/-_.~")
+    query = _presign(
+        method,
+        url.netloc,
+        path,
+        expires_seconds or settings.object_storage_presign_seconds,
+        signed_headers
+    )
+    return f"{url.scheme}://{url.netloc}{path}?{query}"
+
+
+def create_presigned_upload(filename: str, content_type: str, size: int) -> Dict:
+    """
+    Hand out a URL a client can PUT one media file to.
+    
+    The Content-Length is part of the signature, so the store only accepts
+    a body of exactly the declared (and size-checked) length.
+    
+    Args:
+        filename: Original file name (for the extension)
+        content_type: "audio" or "video"
+        size: Total size in bytes
+    
+    Returns:
+        Dict with the object key, URL, method, required headers and expiry
+    """
+    _require_storage()
+    
+    ext = Path(filename).suffix.lower()
+    if ext not in ALLOWED_EXTENSIONS[content_type]:
+        allowed = ", ".join(ALLOWED_EXTENSIONS[content_type])
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type. Allowed extensions for {content_type}: {allowed}"
+        )
+    if size > settings.max_upload_size_mb * 1024 * 1024:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
+        )
+    
+    object_key = f"{content_type}/{uuid.uuid4().hex}{ext}"
+    headers = {"Content-Length": str(size)}
+    expires_seconds = settings.object_storage_presign_seconds
+    return {
+        "object_key": object_key,
+        "upload_url": presign_url("PUT", object_key, expires_seconds, headers, public=True),
+        "method": "PUT",
+        "headers": headers,
+        "expires_at": time.time() + expires_seconds
+    }
+
+
+def validate_object_key(object_key: str, content_type: str):
+    """
+    Check that a key was handed out for this type of content.
+    
+    Args:
+        object_key: Key from ``create_presigned_upload``
+        content_type: "audio" or "video"
+    """
+    match = OBJECT_KEY_RE.match(object_key)
+    if (
+        match is None
+        or match.group(1) != content_type
+        or Path(object_key).suffix not in ALLOWED_EXTENSIONS[content_type]
+    ):
+        raise HTTPException(status_code=404, detail="Object not found")
+
+
+def _parse_total(content_range: Optional[str]) -> Optional[int]:
+    """Object size from a "bytes 0-11/12345" Content-Range header."""
+    if not content_range or "/" not in content_range:
+        return None
+    total = content_range.rsplit("/", 1)[1]
+    return int(total) if total.isdigit() else None
+
+
+def _get_range(client: httpx.Client, url: str, start: int, end: int) -> Tuple[bytes, Optional[int], bool]:
+    """
+    Fetch one byte range, retrying transient failures.
+    
+    A store that ignores Range answers 200 with the whole object; that
+    body is returned as is, flagged, so callers stop instead of fetching
+    the whole object again for every range.
+    
+    Returns:
+        Tuple of (bytes, object size, whether the bytes are the whole
+        object), or (b"", None, False) if there is no object
+    """
+    for attempt in range(RANGE_ATTEMPTS):
+        try:
+            response = client.get(url, headers={"Range": f"bytes={start}-{end}"})
+            if response.status_code == 404:
+                return b"", None, False
+            if response.status_code == 416:
+                return b"", 0, True  # Range past the end: an empty object
+            response.raise_for_status()
+            if response.status_code == 200:
+                # The store ignored the range and sent the whole object
+                return response.content, len(response.content), True
+            return response.content, _parse_total(response.headers.get("Content-Range")), False
+        except httpx.HTTPError as e:
+            if attempt == RANGE_ATTEMPTS - 1:
+                raise
+            print(f"Object range {start}-{end} failed, retrying: {e}")
+            time.sleep(2 ** attempt)
+
+
+def stat_object(object_key: str, content_type: str) -> int:
+    """
+    Check an uploaded object before a job is queued for it.
+    
+    Only the first bytes are read: enough for the size (from the
+    Content-Range) and the magic-byte check.
+    
+    Args:
+        object_key: Key from ``create_presigned_upload``
+        content_type: "audio" or "video"
+    
+    Returns:
+        Object size in bytes
+    """
+    _require_storage()
+    validate_object_key(object_key, content_type)
+    
+    url = presign_url("GET", object_key)
+    with httpx.Client(timeout=settings.object_storage_timeout_seconds) as client:
+        head, size, _ = _get_range(client, url, 0, SNIFF_BYTES - 1)
+    
+    if size is None:
+        raise HTTPException(status_code=404, detail="Object not found; upload it to the presigned URL first")
+    if size > settings.max_upload_size_mb * 1024 * 1024:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
+        )
+    validate_magic(head[:SNIFF_BYTES], content_type)
+    return size
+
+
+def object_source(object_key: str) -> str:
+    """Task argument naming an object in the configured bucket."""
+    return f"{OBJECT_SCHEME}{settings.object_storage_bucket}/{object_key}"
+
+
+def parse_object_source(source: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a task source into (bucket, key).
+    
+    Returns:
+        Tuple of (bucket, object_key), or None for a local file path
+    """
+    if not source.startswith(OBJECT_SCHEME):
+        return None
+    bucket, _, object_key = source[len(OBJECT_SCHEME):].partition("/")
+    return bucket, object_key
+
+
+def fetch_object(object_key: str, retention: Optional[float] = None) -> Path:
+    """
+    Download an object into the content-addressed upload store.
+    
+    The object is read in ``object_storage_range_mb`` ranges, each retried
+    on its own, so a dropped connection costs one range rather than the
+    whole file. It is hashed as it streams to disk and stored like any
+    other upload, so the analyzers and cache see the same digest.
+    
+    Args:
+        object_key: Key within ``object_storage_bucket``
+        retention: Seconds to keep the local copy (default ``file_retention_seconds``)
+    
+    Returns:
+        Path of the stored upload
+    
+    Raises:
+        JobRejected: If the object is too large or not a supported format,
+            which no retry can fix
+    """
+    max_size = settings.max_upload_size_mb * 1024 * 1024
+    range_size = settings.object_storage_range_mb * 1024 * 1024
+    content_type = object_key.split("/", 1)[0]
+    
+    partial = settings.upload_dir / f".{uuid.uuid4()}.part"
+    hasher = hashlib.new(DIGEST_ALGORITHM)
+    url = presign_url("GET", object_key)
+    
+    try:
+        with httpx.Client(timeout=settings.object_storage_timeout_seconds) as client, open(partial, "wb") as f:
+            offset = 0
+            size = None
+            while size is None or offset < size:
+                data, total, whole = _get_range(client, url, offset, offset + range_size - 1)
+                if total is None:
+                    raise FileNotFoundError(f"Object not found: {object_key}")
+                if total > max_size:
+                    raise JobRejected(f"Object too large. Maximum size: {settings.max_upload_size_mb}MB")
+                if whole and offset:
+                    # Ranges stopped being honoured mid-download: keep the full body
+                    f.seek(0)
+                    f.truncate()
+                    hasher = hashlib.new(DIGEST_ALGORITHM)
+                    offset = 0
+                if offset == 0:
+                    try:
+                        validate_magic(data[:SNIFF_BYTES], content_type)
+                    except HTTPException as e:
+                        raise JobRejected(e.detail) from e
+                if not data and offset < total:
+                    raise IOError(f"Object {object_key} ended at {offset} of {total} bytes")
+                size = total
+                hasher.update(data)
+                f.write(data)
+                offset += len(data)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+    
+    return store_upload(partial, hasher.hexdigest(), Path(object_key).suffix, retention)
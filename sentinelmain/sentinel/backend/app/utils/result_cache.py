@@ -0,0 +1,259 @@
+"""
+Sentinel AI - Result Cache
+Exact-match analysis results keyed by content digest and model version.
+"""
+import asyncio
+import hashlib
+import json
+import random
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.config import settings
+
+
+RESULT_KEY = "sentinel:result:{}:{}:{}:{}"
+
+# Seconds to skip the Redis tier after it fails
+REDIS_RETRY_SECONDS = 30.0
+
+
+def text_digest(text: str) -> str:
+    """Content digest of a text submission."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def array_digest(array) -> str:
+    """Content digest of a NumPy array's data."""
+    import numpy as np
+    
+    return hashlib.sha256(np.ascontiguousarray(array).data).hexdigest()
+
+
+def seeded_random(cache_key: Optional[str]) -> random.Random:
+    """
+    Random generator for the mock analyzers.
+    
+    Seeded from the content digest so the same content always gets the
+    same scores, which is what makes results safe to cache. Without a key
+    the generator is seeded from the OS as before.
+    """
+    return random.Random(cache_key)
+
+
+class ResultCache:
+    """
+    Two-tier cache of analysis results.
+    
+    The first tier is a bounded LRU in this process; the second is Redis,
+    shared by every API replica, with a TTL. Keys combine the modality,
+    ``result_cache_version``, the analyzer's model version and the content
+    digest, so deploying a new model never serves stale results.
+    
+    Concurrent misses for the same key are single-flighted: the first
+    request computes and the others await its result. The cache is used
+    from the event loop only; Redis calls run in a thread. Celery tasks
+    share the Redis tier through ``lookup`` and ``store``.
+    """
+    
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        """
+        Create the cache.
+        
+        Args:
+            max_entries: Results kept in the in-process tier
+            ttl_seconds: Lifetime of results in the Redis tier
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._redis = None
+        self._redis_retry_at = 0.0
+        self._stats = {"hits": 0, "redis_hits": 0, "misses": 0, "coalesced": 0, "redis_errors": 0}
+    
+    def key(self, modality: str, digest: str, model_version: str) -> str:
+        """Cache key for one piece of content under one model."""
+        return RESULT_KEY.format(modality, settings.result_cache_version, model_version, digest)
+    
+    def _local_get(self, key: str) -> Optional[Dict]:
+        """Look up the in-process tier, refreshing recency."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+    
+    def _local_put(self, key: str, value: Dict):
+        """Store in the in-process tier, evicting the least recently used."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _redis_client(self):
+        """Redis client, or None while backing off after an error."""
+        if time.monotonic() < self._redis_retry_at:
+            return None
+        if self._redis is None:
+            import redis
+            
+            self._redis = redis.Redis.from_url(
+                settings.redis_url,
+                decode_responses=True,
+                socket_timeout=0.5,
+                socket_connect_timeout=0.5
+            )
+        return self._redis
+    
+    def _redis_failed(self, e: Exception):
+        """Skip the Redis tier for a while instead of slowing every request."""
+        self._stats["redis_errors"] += 1
+        self._redis_retry_at = time.monotonic() + REDIS_RETRY_SECONDS
+        print(f"Result cache Redis tier unavailable, retrying in {REDIS_RETRY_SECONDS:.0f}s: {e}")
+    
+    def _redis_get(self, key: str) -> Optional[Dict]:
+        """Look up the shared tier (blocking)."""
+        import redis
+        
+        client = self._redis_client()
+        if client is None:
+            return None
+        try:
+            data = client.get(key)
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return None
+        return json.loads(data) if data else None
+    
+    def _redis_put(self, key: str, value: Dict):
+        """Store in the shared tier (blocking)."""
+        import redis
+        
+        client = self._redis_client()
+        if client is None:
+            return
+        # A result that cannot be serialized is a bug, not an outage
+        data = json.dumps(value)
+        try:
+            client.set(key, data, ex=self.ttl_seconds)
+        except redis.RedisError as e:
+            self._redis_failed(e)
+    
+    def lookup(self, modality: str, digest: str, model_version: str) -> Optional[Dict]:
+        """Look up a result in the shared tier (blocking; for Celery tasks)."""
+        return self._redis_get(self.key(modality, digest, model_version))
+    
+    def store(self, modality: str, digest: str, model_version: str, value: Dict):
+        """Store a result in the shared tier (blocking; for Celery tasks)."""
+        self._redis_put(self.key(modality, digest, model_version), value)
+    
+    async def get_or_compute(
+        self,
+        modality: str,
+        digest: str,
+        model_version: str,
+        compute: Callable[[], Awaitable[Dict]]
+    ) -> Dict:
+        """
+        Return the cached result for some content, computing it on a miss.
+        
+        Args:
+            modality: text, image, audio or video
+            digest: Content digest
+            model_version: Version of the analyzer producing the result
+            compute: Coroutine factory running the analysis
+        
+        Returns:
+            Analysis result dict (a copy callers may modify)
+        """
+        key = self.key(modality, digest, model_version)
+        
+        value = self._local_get(key)
+        if value is not None:
+            self._stats["hits"] += 1
+            return dict(value)
+        
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            self._stats["coalesced"] += 1
+            try:
+                return dict(await asyncio.shield(flight))
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+                # The computing request was cancelled; take over
+                return await self.get_or_compute(modality, digest, model_version, compute)
+        
+        flight = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = flight
+        try:
+            value = await asyncio.to_thread(self._redis_get, key)
+            if value is not None:
+                self._stats["redis_hits"] += 1
+            else:
+                self._stats["misses"] += 1
+                value = await compute()
+                await asyncio.to_thread(self._redis_put, key, value)
+            self._local_put(key, value)
+            flight.set_result(value)
+            return dict(value)
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            flight.exception()  # Retrieved here; waiters still receive it
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+    
+    def stats(self) -> Dict:
+        """Hit, miss and size statistics."""
+        lookups = self._stats["hits"] + self._stats["redis_hits"] + self._stats["misses"]
+        hits = self._stats["hits"] + self._stats["redis_hits"]
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hit_rate": round(hits / lookups, 4) if lookups else 0.0
+        }
+
+
+# Singleton instance
+_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """Get or create the result cache."""
+    global _cache
+    if _cache is None:
+        _cache = ResultCache(
+            max_entries=settings.result_cache_size,
+            ttl_seconds=settings.result_cache_ttl_seconds
+        )
+    return _cache
+
+
+async def cached_analysis(
+    modality: str,
+    digest: str,
+    model_version: str,
+    compute: Callable[[], Awaitable[Dict]]
+) -> Dict:
+    """
+    Run an analysis through the result cache, if enabled.
+    
+    Args:
+        modality: text, image, audio or video
+        digest: Content digest
+        model_version: Version of the analyzer producing the result
+        compute: Coroutine factory running the analysis
+    
+    Returns:
+        Analysis result dict
+    """
+    if not settings.result_cache_enabled:
+        return await compute()
+    return await get_result_cache().get_or_compute(modality, digest, model_version, compute)
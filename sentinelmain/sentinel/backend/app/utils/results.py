@@ -0,0 +1,187 @@
+"""
+Sentinel AI - Result Builders
+Turn analyzer output into API response models.
+Shared by the analysis routes, the job API and job webhooks.
+"""
+from pathlib import Path
+from typing import Any
+
+from app.config import settings
+from app.schemas.responses import (
+    AudioAnalysisResult,
+    AudioAnalysisDetails,
+    JobStatus,
+    VideoAnalysisResult,
+    VideoAnalysisDetails
+)
+from app.utils.explainer import explain_audio_analysis, explain_video_analysis, get_verdict
+
+
+class JobRejected(Exception):
+    """Raised when a job's media is refused before it is analyzed."""
+
+
+def build_audio_result(result: dict) -> AudioAnalysisResult:
+    """
+    Build the audio response from an ``AudioAnalyzer`` result dict.
+    
+    Args:
+        result: Analyzer output
+    
+    Returns:
+        AudioAnalysisResult with explanations and verdict
+    """
+    risk_score, explanations, action = explain_audio_analysis(
+        human_voice=result["human_voice"],
+        tts_likelihood=result["tts_likelihood"],
+        voice_cloning=result["voice_cloning"]
+    )
+    
+    return AudioAnalysisResult(
+        risk_score=risk_score,
+        verdict=get_verdict(risk_score),
+        explanations=explanations,
+        action=action,
+        content_type="audio",
+        details=AudioAnalysisDetails(
+            human_voice=result["human_voice"],
+            tts_likelihood=result["tts_likelihood"],
+            voice_cloning=result["voice_cloning"],
+            speech_ratio=result.get("speech_ratio"),
+            compute_saved=result.get("compute_saved"),
+            known_clip=result.get("known_clip")
+        ),
+        duration_seconds=result["duration_seconds"]
+    )
+
+
+def build_video_result(result: dict) -> VideoAnalysisResult:
+    """
+    Build the video response from a ``VideoAnalyzer`` result dict.
+    
+    Args:
+        result: Analyzer output
+    
+    Returns:
+        VideoAnalysisResult with explanations and verdict
+    """
+    risk_score, explanations, action = explain_video_analysis(
+        real_probability=result["real_probability"],
+        deepfake_likelihood=result["deepfake_likelihood"],
+        audio_fake_likelihood=result.get("audio_fake_likelihood")
+    )
+    
+    return VideoAnalysisResult(
+        risk_score=risk_score,
+        verdict=get_verdict(risk_score),
+        explanations=explanations,
+        action=action,
+        content_type="video",
+        details=VideoAnalysisDetails(
+            real_probability=result["real_probability"],
+            deepfake_likelihood=result["deepfake_likelihood"],
+            frames_analyzed=result["frames_analyzed"],
+            frame_budget=result.get("frame_budget"),
+            sampling_mode=result.get("sampling_mode"),
+            early_exit=result.get("early_exit"),
+            face_crops=result.get("face_crops"),
+            visual_deepfake_likelihood=result.get("visual_deepfake_likelihood"),
+            audio_fake_likelihood=result.get("audio_fake_likelihood")
+        ),
+        duration_seconds=result["duration_seconds"]
+    )
+
+
+# Celery task states as reported by the job API
+JOB_STATES = {
+    "PENDING": "queued",
+    "RECEIVED": "queued",
+    "STARTED": "running",
+    "RETRY": "running",
+    "SUCCESS": "succeeded",
+    "FAILURE": "failed",
+    "REVOKED": "failed"
+}
+
+
+def build_job_status(job_id: str, content_type: str, state: str, value: Any = None) -> JobStatus:
+    """
+    Build a job status from a Celery task state.
+    
+    Args:
+        job_id: Job identifier
+        content_type: "audio" or "video"
+        state: Celery task state
+        value: Task result on success, exception on failure
+    
+    Returns:
+        JobStatus, with the analysis result once succeeded
+    """
+    status = JOB_STATES.get(state, "running")
+    job = JobStatus(job_id=job_id, status=status, content_type=content_type)
+    
+    if status == "failed":
+        job.error = f"Analysis failed: {value}" if value else "Analysis failed"
+    elif status == "succeeded":
+        if content_type == "audio":
+            job.result = build_audio_result(value)
+        else:
+            job.result = build_video_result(value)
+    
+    return job
+
+
+def job_duration_limit(content_type: str) -> int:
+    """
+    Longest media a job accepts, in seconds.
+    
+    Jobs get the long-video limit rather than the inline endpoints' limits,
+    since taking slow media off the request path is what they are for.
+    """
+    if content_type == "audio":
+        return settings.max_audio_duration_seconds
+    return settings.max_segmented_video_duration_seconds
+
+
+def check_job_duration(content_type: str, duration: float):
+    """
+    Refuse media over the job duration limit.
+    
+    Raises:
+        JobRejected: If the media is too long
+    """
+    limit = job_duration_limit(content_type)
+    if duration > limit:
+        raise JobRejected(f"{content_type.capitalize()} too long. Maximum duration: {limit} seconds")
+
+
+def check_job_media(content_type: str, file_path: Path) -> float:
+    """
+    Probe a job's media and refuse it before any analysis runs.
+    
+    Reads only the container headers (blocking).
+    
+    Args:
+        content_type: "audio" or "video"
+        file_path: Stored upload
+    
+    Returns:
+        Duration in seconds
+    
+    Raises:
+        JobRejected: If the media is unreadable or too long
+    """
+    try:
+        if content_type == "audio":
+            from app.models.audio_analyzer import get_audio_analyzer
+            
+            duration = get_audio_analyzer()._get_audio_duration(file_path)
+        else:
+            from app.models.video_analyzer import get_video_analyzer
+            
+            duration = get_video_analyzer().probe(file_path)["duration"]
+    except Exception as e:
+        raise JobRejected(f"Could not read {content_type}: {e}") from e
+    
+    check_job_duration(content_type, duration)
+    return duration
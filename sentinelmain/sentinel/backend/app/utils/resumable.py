@@ -0,0 +1,266 @@
+"""
+Sentinel AI - Resumable Uploads
+Uploads sent in byte ranges that survive dropped connections.
+"""
+import fcntl
+import hashlib
+import json
+import os
+import re
+import time
+import uuid
+from pathlib import Path
+from typing import AsyncIterator, Dict, Optional, Tuple
+
+import aiofiles
+from fastapi import HTTPException
+
+from app.config import settings
+from app.utils.file_handler import (
+    ALLOWED_EXTENSIONS,
+    SNIFF_BYTES,
+    validate_magic,
+    write_chunks
+)
+from app.utils.upload_store import DIGEST_ALGORITHM, store_upload
+from app.utils.janitor import get_janitor
+
+
+UPLOAD_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+
+# Running digests, valid while they cover exactly the bytes on disk. Another
+# replica (or a restart) falls back to hashing the file once at finalize.
+_hashers: Dict[str, Tuple[object, int]] = {}
+
+
+def _resumable_dir() -> Path:
+    """Directory holding unfinished uploads and their metadata."""
+    return settings.upload_dir / "resumable"
+
+
+def _paths(upload_id: str) -> Tuple[Path, Path]:
+    """Data and metadata files of an upload."""
+    if not UPLOAD_ID_RE.match(upload_id):
+        raise HTTPException(status_code=404, detail="Upload not found")
+    directory = _resumable_dir()
+    return directory / f"{upload_id}.part", directory / f"{upload_id}.json"
+
+
+def create_upload(filename: str, content_type: str, size: int) -> Dict:
+    """
+    Start a resumable upload.
+    
+    Args:
+        filename: Original file name (for the extension)
+        content_type: "audio" or "video"
+        size: Total size in bytes
+    
+    Returns:
+        Upload state dict
+    """
+    ext = Path(filename).suffix.lower()
+    if ext not in ALLOWED_EXTENSIONS[content_type]:
+        allowed = ", ".join(ALLOWED_EXTENSIONS[content_type])
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid file type. Allowed extensions for {content_type}: {allowed}"
+        )
+    if size > settings.max_upload_size_mb * 1024 * 1024:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size: {settings.max_upload_size_mb}MB"
+        )
+    
+    upload_id = uuid.uuid4().hex
+    ttl = settings.resumable_upload_ttl_seconds
+    meta = {
+        "upload_id": upload_id,
+        "content_type": content_type,
+        "ext": ext,
+        "size": size,
+        "expires_at": time.time() + ttl
+    }
+    
+    _resumable_dir().mkdir(parents=True, exist_ok=True)
+    part, meta_path = _paths(upload_id)
+    part.touch()
+    meta_path.write_text(json.dumps(meta))
+    _hashers[upload_id] = (hashlib.new(DIGEST_ALGORITHM), 0)
+    
+    # Unfinished uploads expire through the janitor like any other file
+    janitor = get_janitor()
+    janitor.schedule(part, ttl)
+    janitor.schedule(meta_path, ttl)
+    
+    return {**meta, "offset": 0}
+
+
+def get_upload(upload_id: str) -> Dict:
+    """
+    Get an upload's state; the offset is the size of the data on disk.
+    
+    Args:
+        upload_id: Upload identifier
+    
+    Returns:
+        Upload state dict
+    """
+    part, meta_path = _paths(upload_id)
+    try:
+        meta = json.loads(meta_path.read_text())
+        offset = part.stat().st_size
+    except FileNotFoundError:
+        # Expired or discarded: forget any in-memory state too
+        _hashers.pop(upload_id, None)
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return {**meta, "offset": offset}
+
+
+async def _sniffed(chunks: AsyncIterator[bytes], content_type: str, head: bytes, size: int) -> AsyncIterator[bytes]:
+    """
+    Check an upload's first bytes as soon as they have all arrived.
+    
+    Chunks are held back until the bytes already on disk plus the new
+    ones reach ``SNIFF_BYTES`` (or the whole upload, if it is smaller),
+    so a short first range is stored unchecked and the check happens in
+    whichever range completes the head.
+    
+    Args:
+        chunks: Request body
+        content_type: "audio" or "video"
+        head: Bytes of the upload already on disk
+        size: Total size of the upload
+    """
+    needed = min(SNIFF_BYTES, size)
+    pending = b""
+    async for chunk in chunks:
+        if head is not None:
+            pending += chunk
+            if len(head) + len(pending) < needed:
+                continue
+            validate_magic((head + pending)[:SNIFF_BYTES], content_type)
+            chunk, pending, head = pending, b"", None
+        yield chunk
+    if pending:
+        # The range ended before the head was complete
+        yield pending
+
+
+async def append_chunk(upload_id: str, offset: int, chunks: AsyncIterator[bytes]) -> Dict:
+    """
+    Append a byte range at ``offset`` using the upload chunk writer.
+    
+    Bytes written before a dropped connection are kept, so the client
+    resumes from the offset reported afterwards. The append holds an
+    exclusive ``flock`` on the upload's data file and checks the offset
+    under it, so concurrent appends are refused even when they reach
+    different API processes or replicas sharing the upload volume.
+    
+    Args:
+        upload_id: Upload identifier
+        offset: Where the client believes the upload stands
+        chunks: Request body
+    
+    Returns:
+        Upload state dict after the append
+    """
+    upload = get_upload(upload_id)
+    part, _ = _paths(upload_id)
+    try:
+        f = await aiofiles.open(part, "r+b")
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    
+    # The lock is released when the file is closed
+    try:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise HTTPException(
+                status_code=409,
+                detail="Another append to this upload is in progress",
+                headers={"Upload-Offset": str(upload["offset"])}
+            )
+        
+        current = os.fstat(f.fileno()).st_size
+        if offset != current:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Upload offset is {current}, not {offset}",
+                headers={"Upload-Offset": str(current)}
+            )
+        
+        if offset < SNIFF_BYTES:
+            head = await f.read(offset)
+            chunks = _sniffed(chunks, upload["content_type"], head, upload["size"])
+        
+        hasher, hashed = _hashers.pop(upload_id, (None, -1))
+        if hashed != offset:
+            hasher = None
+        
+        await f.seek(offset)
+        written = await write_chunks(chunks, f, hasher, offset, upload["size"])
+        
+        # Only a range that completed leaves the digest in step with the file
+        if hasher is not None:
+            _hashers[upload_id] = (hasher, written)
+    finally:
+        await f.close()
+    
+    return {**upload, "offset": written}
+
+
+def _file_digest(file_path: Path) -> str:
+    """Hash a file from disk."""
+    hasher = hashlib.new(DIGEST_ALGORITHM)
+    with open(file_path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def finalize_upload(upload_id: str, retention: Optional[float] = None) -> Tuple[Dict, Path, str]:
+    """
+    Add a complete upload to the content-addressed store.
+    
+    The upload itself is kept (the store gets a hard link), so finalizing
+    can be retried if queueing fails; ``discard_upload`` it afterwards.
+    
+    Args:
+        upload_id: Upload identifier
+        retention: Seconds to keep the stored file
+    
+    Returns:
+        Tuple of (upload state, file_path, content_digest)
+    """
+    upload = get_upload(upload_id)
+    if upload["offset"] != upload["size"]:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Upload incomplete: {upload['offset']} of {upload['size']} bytes received",
+            headers={"Upload-Offset": str(upload["offset"])}
+        )
+    
+    part, _ = _paths(upload_id)
+    hasher, hashed = _hashers.get(upload_id, (None, -1))
+    digest = hasher.hexdigest() if hashed == upload["size"] else _file_digest(part)
+    
+    # store_upload consumes the file it is given
+    link = part.with_name(f"{upload_id}.{uuid.uuid4().hex}.link")
+    os.link(part, link)
+    return upload, store_upload(link, digest, upload["ext"], retention), digest
+
+
+def discard_upload(upload_id: str):
+    """
+    Delete an upload, finished or not.
+    
+    Args:
+        upload_id: Upload identifier
+    """
+    part, meta_path = _paths(upload_id)
+    if not meta_path.exists():
+        raise HTTPException(status_code=404, detail="Upload not found")
+    part.unlink(missing_ok=True)
+    meta_path.unlink(missing_ok=True)
+    _hashers.pop(upload_id, None)
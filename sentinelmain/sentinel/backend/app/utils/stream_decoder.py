@@ -0,0 +1,63 @@
+"""
+Sentinel AI - Stream Decoder
+Decodes live compressed audio streams to PCM through an ffmpeg pipe.
+"""
+import asyncio
+from typing import Optional
+
+
+class FfmpegStreamDecoder:
+    """
+    Decode an Opus stream (Ogg or WebM container) to 16-bit mono PCM.
+    
+    Bytes are written to ffmpeg's stdin as they arrive and decoded PCM is
+    read back from stdout, so decoding keeps pace with the call instead of
+    waiting for a complete file.
+    """
+    
+    def __init__(self, sample_rate: int = 16000):
+        """Initialize the decoder."""
+        self.sample_rate = sample_rate
+        self._process: Optional[asyncio.subprocess.Process] = None
+    
+    async def start(self):
+        """Spawn the ffmpeg process."""
+        self._process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-loglevel", "error", "-nostdin",
+            "-fflags", "nobuffer",
+            "-i", "pipe:0",
+            "-f", "s16le", "-acodec", "pcm_s16le",
+            "-ac", "1", "-ar", str(self.sample_rate),
+            "pipe:1",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+    
+    async def write(self, data: bytes):
+        """Feed compressed bytes to the decoder."""
+        self._process.stdin.write(data)
+        await self._process.stdin.drain()
+    
+    async def read(self, size: int = 32768) -> bytes:
+        """
+        Read decoded PCM.
+        
+        Returns:
+            PCM bytes, or b"" once the stream has ended
+        """
+        return await self._process.stdout.read(size)
+    
+    async def finish(self):
+        """Signal end of input so ffmpeg flushes its remaining output."""
+        if self._process and self._process.stdin and not self._process.stdin.is_closing():
+            self._process.stdin.close()
+    
+    async def close(self):
+        """Terminate the decoder process."""
+        if self._process is None:
+            return
+        if self._process.returncode is None:
+            self._process.kill()
+        await self._process.wait()
+        self._process = None
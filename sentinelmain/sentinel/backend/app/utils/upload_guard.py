@@ -0,0 +1,156 @@
+"""
+Sentinel AI - Upload Guard
+ASGI middleware rejecting oversized or mislabeled uploads before the body is read.
+"""
+import re
+from typing import Dict, List, Optional
+
+from starlette.responses import JSONResponse
+
+from app.config import settings
+from app.utils.file_handler import ALLOWED_FORMATS, SNIFF_BYTES, sniff_format
+
+
+# Upload endpoints and the file type each accepts
+UPLOAD_ROUTES = {
+    "/analyze/image": "image",
+    "/analyze/audio": "audio",
+    "/analyze/video": "video",
+    "/analyze/video/segments": "video",
+    "/jobs/audio": "audio",
+    "/jobs/video": "video"
+}
+
+# Allowance for multipart boundaries, part headers and small form fields
+MULTIPART_OVERHEAD = 64 * 1024
+
+# Give up sniffing (and leave it to the route) if the file part starts later
+MAX_PREAMBLE = 64 * 1024
+
+BOUNDARY_RE = re.compile(rb'boundary="?([^";]+)"?', re.IGNORECASE)
+
+
+def _find_file_head(body: bytes, boundary: bytes, complete: bool) -> Optional[bytes]:
+    """
+    Find the first bytes of the first file part in a multipart body prefix.
+    
+    Args:
+        body: Body bytes received so far
+        boundary: Multipart boundary
+        complete: Whether the whole body has been received
+    
+    Returns:
+        Up to ``SNIFF_BYTES`` of file content, b"" if there is no file
+        part, or None if more of the body is needed
+    """
+    delimiter = b"--" + boundary
+    pos = 0
+    while True:
+        start = body.find(delimiter, pos)
+        if start < 0 or len(body) < start + len(delimiter) + 2:
+            return b"" if complete else None
+        if body[start + len(delimiter):start + len(delimiter) + 2] == b"--":
+            return b""  # Closing delimiter: no file part
+        
+        headers_end = body.find(b"\r\n\r\n", start)
+        if headers_end < 0:
+            return b"" if complete else None
+        data_start = headers_end + 4
+        
+        if b"filename=" not in body[start:headers_end].lower():
+            pos = data_start  # A plain form field
+            continue
+        
+        part_end = body.find(b"\r\n" + delimiter, data_start)
+        if part_end >= 0:
+            return body[data_start:min(part_end, data_start + SNIFF_BYTES)]
+        if len(body) - data_start >= SNIFF_BYTES or complete:
+            return body[data_start:data_start + SNIFF_BYTES]
+        return None
+
+
+class UploadGuardMiddleware:
+    """
+    Reject bad uploads while they are still on the wire.
+    
+    Starlette parses the whole multipart body (spooling it to disk) before
+    a route runs, so checks in the route come after the upload has been
+    received and written. This middleware runs first on upload endpoints:
+    
+    - A ``Content-Length`` over the upload limit is refused with 413
+      before any of the body is read.
+    - Body chunks are held only until the first bytes of the file part
+      have arrived; its magic bytes are sniffed and a file whose contents
+      do not match the endpoint's type is refused with 400 right there.
+    
+    Accepted requests are passed on with the held chunks replayed, so
+    only the bytes needed for the decision are read ahead.
+    """
+    
+    def __init__(self, app):
+        """
+        Wrap an ASGI application.
+        
+        Args:
+            app: The application to guard
+        """
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        """Handle one ASGI connection."""
+        file_type = None
+        if scope["type"] == "http" and scope["method"] == "POST":
+            file_type = UPLOAD_ROUTES.get(scope["path"].rstrip("/"))
+        if file_type is None:
+            await self.app(scope, receive, send)
+            return
+        
+        headers = dict(scope["headers"])
+        
+        # Size check from the header alone
+        max_size = settings.max_upload_size_mb * 1024 * 1024
+        content_length = headers.get(b"content-length")
+        if content_length and content_length.isdigit() and int(content_length) > max_size + MULTIPART_OVERHEAD:
+            await self._reject(scope, receive, send, 413, f"File too large. Maximum size: {settings.max_upload_size_mb}MB")
+            return
+        
+        match = BOUNDARY_RE.search(headers.get(b"content-type", b""))
+        if match is None:
+            await self.app(scope, receive, send)
+            return
+        
+        # Read just far enough to see the start of the file
+        held: List[Dict] = []
+        body = b""
+        while True:
+            message = await receive()
+            held.append(message)
+            if message["type"] != "http.request":
+                break
+            body += message.get("body", b"")
+            complete = not message.get("more_body", False)
+            
+            head = _find_file_head(body, match.group(1), complete)
+            if head is not None:
+                if head and sniff_format(head) not in ALLOWED_FORMATS[file_type]:
+                    await self._reject(scope, receive, send, 400, f"File contents are not a supported {file_type} format")
+                    return
+                break
+            if complete or len(body) > MAX_PREAMBLE:
+                break
+        
+        async def replay():
+            if held:
+                return held.pop(0)
+            return await receive()
+        
+        await self.app(scope, replay, send)
+    
+    async def _reject(self, scope, receive, send, status_code: int, detail: str):
+        """Answer without reading the rest of the body."""
+        response = JSONResponse(
+            status_code=status_code,
+            content={"detail": detail},
+            headers={"Connection": "close"}
+        )
+        await response(scope, receive, send)
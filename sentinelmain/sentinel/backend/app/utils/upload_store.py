@@ -0,0 +1,164 @@
+"""
+Sentinel AI - Upload Store
+Content-addressed storage of uploads, shared by the API and Celery workers.
+"""
+import hashlib
+import os
+import time
+import uuid
+from pathlib import Path
+from typing import Optional, Union
+
+from app.config import settings
+from app.utils.janitor import get_janitor
+
+
+# Content-addressed store: one blob per digest under upload_dir/objects.
+# Each upload gets its own hard link ("handle") to the blob, named
+# "<digest>-<id><ext>", so the blob's link count is its reference count
+# and the API and Celery workers can share it through the upload volume.
+DIGEST_ALGORITHM = "sha256"
+DIGEST_LENGTH = hashlib.new(DIGEST_ALGORITHM).digest_size * 2
+
+
+def _objects_dir() -> Path:
+    """Directory holding one blob per distinct upload."""
+    return settings.upload_dir / "objects"
+
+
+def content_digest(file_path: Union[Path, str]) -> Optional[str]:
+    """
+    Get the content digest of a stored upload from its handle name.
+    
+    Args:
+        file_path: Path returned by ``save_upload``
+        
+    Returns:
+        Hex digest, or None if the file is not in the store
+    """
+    digest = Path(file_path).name.split("-", 1)[0]
+    if len(digest) != DIGEST_LENGTH:
+        return None
+    try:
+        int(digest, 16)
+    except ValueError:
+        return None
+    return digest
+
+
+def _blob_path(file_path: Path) -> Optional[Path]:
+    """Blob a handle links to, or None if it is not a stored upload."""
+    digest = content_digest(file_path)
+    if digest is None:
+        return None
+    return _objects_dir() / f"{digest}{file_path.suffix}"
+
+
+def _link_handle(partial: Path, digest: str, ext: str) -> Path:
+    """
+    Store a fully written upload under its digest and link a new handle.
+    
+    If the content is already stored, the partial file is discarded and
+    the handle links the existing blob.
+    """
+    objects = _objects_dir()
+    objects.mkdir(parents=True, exist_ok=True)
+    
+    blob = objects / f"{digest}{ext}"
+    handle = settings.upload_dir / f"{digest}-{uuid.uuid4().hex}{ext}"
+    
+    try:
+        os.link(partial, blob)
+    except FileExistsError:
+        pass  # Duplicate content: keep the stored copy
+    
+    try:
+        os.link(blob, handle)
+        # Handles share the blob's mtime; refresh it so retention counts from now
+        os.utime(handle)
+    except FileNotFoundError:
+        # The last reference was released between the two links
+        os.link(partial, handle)
+    finally:
+        partial.unlink(missing_ok=True)
+    
+    return handle
+
+
+def store_upload(partial: Path, digest: str, ext: str, retention: Optional[float] = None) -> Path:
+    """
+    Move a fully written file into the store and schedule its expiry.
+    
+    Args:
+        partial: Complete file, consumed by this call
+        digest: Its content digest
+        ext: File extension, including the dot
+        retention: Seconds to keep it (default ``file_retention_seconds``)
+        
+    Returns:
+        Path of the stored upload
+    """
+    file_path = _link_handle(partial, digest, ext)
+    get_janitor().schedule(file_path, retention)
+    return file_path
+
+
+def delete_file(file_path: Path) -> bool:
+    """
+    Delete a file from disk.
+    
+    For a stored upload this releases one reference; the blob itself is
+    removed with its last handle.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        True if deleted, False if not found
+    """
+    try:
+        if file_path.exists():
+            file_path.unlink()
+            _release_blob(file_path)
+            return True
+        return False
+    except Exception as e:
+        print(f"Error deleting file {file_path}: {e}")
+        return False
+
+
+def _release_blob(file_path: Path):
+    """Remove a handle's blob once no other handle links to it."""
+    blob = _blob_path(file_path)
+    try:
+        if blob is not None and blob.stat().st_nlink == 1:
+            blob.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def release_orphaned_blobs(retention: float) -> int:
+    """
+    Remove stored blobs no handle links to (e.g. after a crash).
+    
+    Args:
+        retention: Minimum age in seconds, so blobs being linked are kept
+        
+    Returns:
+        Number of blobs deleted
+    """
+    objects = _objects_dir()
+    if not objects.exists():
+        return 0
+    
+    deleted = 0
+    current_time = time.time()
+    for blob in objects.iterdir():
+        try:
+            stat = blob.stat()
+        except FileNotFoundError:
+            continue
+        if stat.st_nlink == 1 and current_time - stat.st_mtime > retention:
+            blob.unlink(missing_ok=True)
+            deleted += 1
+    return deleted
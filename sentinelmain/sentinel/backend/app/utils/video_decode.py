@@ -0,0 +1,180 @@
+"""
+Sentinel AI - Video Decoding
+ffmpeg/ffprobe helpers that decode frames at model resolution.
+"""
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+def ffmpeg_available() -> bool:
+    """Check that ffmpeg and ffprobe are on PATH."""
+    return shutil.which("ffmpeg") is not None and shutil.which("ffprobe") is not None
+
+
+def probe_video(file_path: Path) -> Dict:
+    """
+    Read video stream metadata with ffprobe.
+    
+    Returns:
+        Dict with duration, fps, frame_count, width, height
+    """
+    output = subprocess.run(
+        [
+            "ffprobe", "-v", "error",
+            "-select_streams", "v:0",
+            "-show_entries", "stream=avg_frame_rate,nb_frames,duration,width,height:format=duration",
+            "-of", "json",
+            str(file_path)
+        ],
+        capture_output=True, check=True, timeout=30
+    ).stdout
+    info = json.loads(output)
+    stream = (info.get("streams") or [{}])[0]
+    
+    num, _, den = stream.get("avg_frame_rate", "0/1").partition("/")
+    fps = float(num) / float(den) if den and float(den) else 0.0
+    duration = float(stream.get("duration") or info.get("format", {}).get("duration") or 0)
+    
+    frame_count = int(stream.get("nb_frames") or 0)
+    if frame_count == 0 and fps > 0:
+        frame_count = int(duration * fps)
+    
+    return {
+        "duration": duration,
+        "fps": fps,
+        "frame_count": frame_count,
+        "width": int(stream.get("width") or 0),
+        "height": int(stream.get("height") or 0)
+    }
+
+
+def extract_audio(file_path: Path, sample_rate: int = 16000, max_seconds: Optional[float] = None):
+    """
+    Demux and decode a video's audio track to mono float samples.
+    
+    ffmpeg resamples and downmixes while decoding and the samples are read
+    straight from the pipe, so no intermediate WAV is written.
+    
+    Args:
+        file_path: Video file
+        sample_rate: Output sample rate
+        max_seconds: Decode at most this many seconds
+    
+    Returns:
+        float32 array, or None if the video has no audio track
+    """
+    import numpy as np
+    
+    command = ["ffmpeg", "-v", "error", "-nostdin", "-i", str(file_path), "-vn", "-sn"]
+    if max_seconds:
+        command += ["-t", f"{max_seconds:.3f}"]
+    command += ["-ac", "1", "-ar", str(sample_rate), "-f", "f32le", "pipe:1"]
+    
+    output = subprocess.run(command, capture_output=True, timeout=60).stdout
+    if not output:
+        return None
+    return np.frombuffer(output, np.float32)
+
+
+class FfmpegFrameReader:
+    """
+    Decode frames through an ffmpeg pipe.
+    
+    Frame-rate selection, scaling and pixel-format conversion run inside
+    ffmpeg's filter graph, so a 4K upload is never materialised at full
+    resolution in Python. Raw frames are read from the pipe straight into a
+    preallocated NumPy buffer with ``readinto``. Closing the reader early
+    stops decoding.
+    """
+    
+    def __init__(
+        self,
+        file_path: Path,
+        size: Tuple[int, int],
+        fps: Optional[float] = None,
+        max_frames: Optional[int] = None,
+        start: Optional[float] = None,
+        duration: Optional[float] = None
+    ):
+        """
+        Start the decoder.
+        
+        Args:
+            file_path: Video file
+            size: Output (width, height)
+            fps: Output frame rate; None keeps every frame
+            max_frames: Stop after this many frames
+            start: Start time in seconds (input seek)
+            duration: Decode at most this many seconds
+        """
+        import numpy as np
+        
+        self.width, self.height = size
+        self.frame_bytes = self.width * self.height * 3
+        self.max_frames = max_frames
+        
+        filters = []
+        if fps:
+            filters.append(f"fps={fps}")
+        filters.append(f"scale={self.width}:{self.height}:flags=area")
+        
+        command = ["ffmpeg", "-v", "error", "-nostdin"]
+        if start:
+            command += ["-ss", f"{start:.3f}"]
+        if duration:
+            command += ["-t", f"{duration:.3f}"]
+        command += ["-i", str(file_path), "-an", "-sn", "-vf", ",".join(filters)]
+        if max_frames:
+            command += ["-frames:v", str(max_frames)]
+        command += ["-pix_fmt", "rgb24", "-f", "rawvideo", "pipe:1"]
+        
+        self._process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=self.frame_bytes
+        )
+        
+        self.buffer = np.empty((max_frames or 1, self.height, self.width, 3), np.uint8)
+    
+    def _read_into(self, slot: int) -> bool:
+        """Fill one buffer slot from the pipe. Returns False at end of stream."""
+        view = memoryview(self.buffer[slot]).cast("B")
+        filled = 0
+        while filled < self.frame_bytes:
+            n = self._process.stdout.readinto(view[filled:])
+            if not n:
+                return False
+            filled += n
+        return True
+    
+    def __iter__(self):
+        """
+        Yield decoded frames as uint8 arrays.
+        
+        With ``max_frames`` set each frame has its own buffer slot and stays
+        valid; otherwise the same slot is reused and callers must copy.
+        """
+        index = 0
+        while self.max_frames is None or index < self.max_frames:
+            slot = index if self.max_frames else 0
+            if not self._read_into(slot):
+                break
+            yield self.buffer[slot]
+            index += 1
+    
+    def close(self):
+        """Stop the decoder."""
+        if self._process.poll() is None:
+            self._process.kill()
+        self._process.stdout.close()
+        self._process.wait()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1 +1 @@
-# Workers package
+# Workers package
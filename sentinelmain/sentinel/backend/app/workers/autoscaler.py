@@ -0,0 +1,253 @@
+"""
+Sentinel AI - Worker Autoscaler
+Grows and shrinks Celery worker pools from lane queue depth and wait times.
+"""
+import json
+import math
+import time
+from typing import Dict, List, Optional
+
+from app.config import settings
+from app.workers.celery_app import celery_app
+from app.workers.lanes import lane_stats
+
+
+# Controller state and recent decisions, read by GET /metrics/autoscaler
+AUTOSCALER_STATE_KEY = "sentinel:autoscaler:state"
+AUTOSCALER_DECISIONS_KEY = "sentinel:autoscaler:decisions"
+DECISIONS_KEPT = 100
+
+# Redis client (lazy)
+_redis = None
+
+
+def _get_redis():
+    """Get or create the Redis client."""
+    global _redis
+    if _redis is None:
+        import redis
+        
+        _redis = redis.Redis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_timeout=2,
+            socket_connect_timeout=2
+        )
+    return _redis
+
+
+class WorkerAutoscaler:
+    """
+    Control loop sizing every worker's process pool.
+    
+    Each interval it reads the lanes' depth and oldest wait from the
+    broker and each worker's pool size, queues and running tasks through
+    Celery's remote control, then resizes pools with ``pool_grow`` and
+    ``pool_shrink`` within ``autoscale_min_processes`` and
+    ``autoscale_max_processes``.
+    
+    A worker's demand is its running tasks plus its share of the queued
+    tasks in the lanes it consumes (split evenly between the workers
+    consuming a lane), at ``autoscale_tasks_per_process`` per process. A
+    lane whose oldest task has waited over ``autoscale_max_wait_seconds``
+    asks for one more process regardless.
+    
+    Hysteresis: pools grow as soon as demand exceeds them, up to
+    ``autoscale_step`` processes at a time, but shrink one process at a
+    time and only after demand has stayed below the pool size for
+    ``autoscale_scale_down_delay_seconds``, so bursty traffic does not
+    make pools flap.
+    """
+    
+    def __init__(self):
+        """Create the controller; call ``run`` to start the loop."""
+        self._low_since: Dict[str, float] = {}
+        self._workers: Dict[str, Dict] = {}
+        self._stats = {"polls": 0, "grown": 0, "shrunk": 0, "errors": 0}
+    
+    def desired_processes(
+        self,
+        current: int,
+        running: int,
+        worker_queues: List[str],
+        lanes: Dict[str, Dict],
+        consumers: Dict[str, int]
+    ) -> int:
+        """
+        Pool size a worker should have for the current load.
+        
+        Args:
+            current: Current pool size
+            running: Tasks the worker is executing
+            worker_queues: Lane queues the worker consumes
+            lanes: ``lane_stats`` output
+            consumers: Number of workers consuming each queue
+        
+        Returns:
+            Target pool size within the configured bounds
+        """
+        queued = 0.0
+        late = False
+        for queue in worker_queues:
+            lane = lanes.get(queue)
+            if lane is None:
+                continue
+            queued += lane["depth"] / max(1, consumers.get(queue, 1))
+            late = late or lane["oldest_wait_seconds"] > settings.autoscale_max_wait_seconds
+        
+        desired = math.ceil((running + queued) / settings.autoscale_tasks_per_process)
+        if late:
+            desired = max(desired, current + 1)
+        return max(settings.autoscale_min_processes, min(settings.autoscale_max_processes, desired))
+    
+    def decide(self, worker: str, current: int, desired: int, now: float) -> int:
+        """
+        Apply hysteresis to a target pool size.
+        
+        Args:
+            worker: Worker node name
+            current: Current pool size
+            desired: Target from ``desired_processes``
+            now: Current time
+        
+        Returns:
+            Processes to add (positive) or remove (negative)
+        """
+        if desired > current:
+            self._low_since.pop(worker, None)
+            return min(desired - current, settings.autoscale_step)
+        
+        if desired == current:
+            self._low_since.pop(worker, None)
+            return 0
+        
+        low_since = self._low_since.setdefault(worker, now)
+        if now - low_since < settings.autoscale_scale_down_delay_seconds:
+            return 0
+        # Restart the delay so each further step needs sustained low demand too
+        self._low_since[worker] = now
+        return -1
+    
+    def _inspect_workers(self) -> Dict[str, Dict]:
+        """Pool size, lane queues and running task count of every live worker."""
+        inspect = celery_app.control.inspect(timeout=settings.autoscale_inspect_timeout_seconds)
+        stats = inspect.stats() or {}
+        queues = inspect.active_queues() or {}
+        active = inspect.active() or {}
+        
+        workers = {}
+        for name, worker_stats in stats.items():
+            pool = worker_stats.get("pool", {})
+            processes = pool.get("processes")
+            workers[name] = {
+                "processes": len(processes) if isinstance(processes, list) else pool.get("max-concurrency", 0),
+                "queues": [q["name"] for q in queues.get(name, [])],
+                "running": len(active.get(name, []))
+            }
+        return workers
+    
+    def poll(self, now: Optional[float] = None) -> List[Dict]:
+        """
+        Run one control step.
+        
+        Returns:
+            Decisions taken (one dict per resized worker)
+        """
+        if now is None:
+            now = time.time()
+        lanes = lane_stats()
+        workers = self._inspect_workers()
+        
+        consumers: Dict[str, int] = {}
+        for worker in workers.values():
+            for queue in worker["queues"]:
+                consumers[queue] = consumers.get(queue, 0) + 1
+        
+        decisions = []
+        for name, worker in workers.items():
+            desired = self.desired_processes(
+                worker["processes"], worker["running"], worker["queues"], lanes, consumers
+            )
+            change = self.decide(name, worker["processes"], desired, now)
+            worker["desired"] = desired
+            
+            if change > 0:
+                celery_app.control.pool_grow(change, destination=[name])
+                self._stats["grown"] += change
+            elif change < 0:
+                celery_app.control.pool_shrink(-change, destination=[name])
+                self._stats["shrunk"] += -change
+            if change:
+                worker["processes"] += change
+                decisions.append({
+                    "time": now,
+                    "worker": name,
+                    "change": change,
+                    "processes": worker["processes"],
+                    "desired": desired,
+                    "running": worker["running"]
+                })
+        
+        # Forget workers that went away
+        for name in set(self._low_since) - set(workers):
+            del self._low_since[name]
+        self._workers = workers
+        self._stats["polls"] += 1
+        return decisions
+    
+    def _publish(self, decisions: List[Dict]):
+        """Store the state and new decisions in Redis for the metrics endpoint."""
+        pipe = _get_redis().pipeline()
+        pipe.set(
+            AUTOSCALER_STATE_KEY,
+            json.dumps({**self.stats(), "updated_at": time.time()}),
+            ex=max(60, int(settings.autoscale_interval_seconds * 10))
+        )
+        for decision in decisions:
+            pipe.lpush(AUTOSCALER_DECISIONS_KEY, json.dumps(decision))
+        pipe.ltrim(AUTOSCALER_DECISIONS_KEY, 0, DECISIONS_KEPT - 1)
+        pipe.execute()
+    
+    def run(self):
+        """Control loop; runs until interrupted."""
+        print(
+            f"📈 Worker autoscaler: {settings.autoscale_min_processes}-{settings.autoscale_max_processes} "
+            f"processes per worker, every {settings.autoscale_interval_seconds}s"
+        )
+        while True:
+            try:
+                decisions = self.poll()
+                for d in decisions:
+                    print(f"{d['worker']}: {d['change']:+d} -> {d['processes']} processes (desired {d['desired']})")
+                self._publish(decisions)
+            except Exception as e:
+                self._stats["errors"] += 1
+                print(f"Autoscaler step failed: {e}")
+            time.sleep(settings.autoscale_interval_seconds)
+    
+    def stats(self) -> Dict:
+        """Decision counts and the last observed state of every worker."""
+        return {**self._stats, "workers": self._workers}
+
+
+def autoscaler_stats() -> Dict:
+    """
+    Controller state and recent scaling decisions, as published in Redis.
+    
+    Returns:
+        Dict with the controller ``state`` (None if it is not running)
+        and ``decisions``, newest first
+    """
+    pipe = _get_redis().pipeline()
+    pipe.get(AUTOSCALER_STATE_KEY)
+    pipe.lrange(AUTOSCALER_DECISIONS_KEY, 0, -1)
+    state, decisions = pipe.execute()
+    return {
+        "state": json.loads(state) if state else None,
+        "decisions": [json.loads(d) for d in decisions]
+    }
+
+
+if __name__ == "__main__":
+    # Run the controller: python -m app.workers.autoscaler
+    WorkerAutoscaler().run()
@@ -1,29 +1,42 @@
-"""
-Sentinel AI - Celery Worker Configuration
-Async task processing for audio and video analysis.
-"""
-from celery import Celery
-
-from app.config import settings
-
-
-# Create Celery app
-celery_app = Celery(
-    "sentinel",
-    broker=settings.redis_url,
-    backend=settings.redis_url,
-    include=["app.workers.tasks"]
-)
-
-# Celery configuration
-celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
-    timezone="UTC",
-    enable_utc=True,
-    task_track_started=True,
-    task_time_limit=300,  # 5 minute timeout
-    worker_prefetch_multiplier=1,
-    task_acks_late=True,
-)
+"""
+Sentinel AI - Celery Worker Configuration
+Async task processing for audio and video analysis.
+"""
+from celery import Celery
+from celery.signals import before_task_publish, task_prerun
+from kombu import Queue
+
+from app.config import settings
+from app.workers.lanes import MODALITIES, lane_queue, lane_queues, record_wait, stamp_enqueued
+
+
+# Create Celery app
+celery_app = Celery(
+    "sentinel",
+    broker=settings.redis_url,
+    backend=settings.redis_url,
+    include=["app.workers.tasks"]
+)
+
+# Celery configuration
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    result_serializer="json",
+    timezone="UTC",
+    enable_utc=True,
+    task_track_started=True,
+    task_time_limit=300,  # 5 minute timeout
+    worker_prefetch_multiplier=1,
+    task_acks_late=True,
+    result_expires=settings.job_ttl_seconds,  # Job results for /jobs
+    # Priority lanes: a worker started without -Q consumes every lane, and
+    # the "sorted" order makes it take interactive work before bulk work
+    task_queues=[Queue(queue) for queue in lane_queues()],
+    task_default_queue=lane_queue(MODALITIES[0], settings.job_default_priority),
+    broker_transport_options={"queue_order_strategy": "sorted"},
+)
+
+# Per-lane wait metrics (GET /metrics/lanes)
+before_task_publish.connect(stamp_enqueued, weak=False)
+task_prerun.connect(record_wait, weak=False)
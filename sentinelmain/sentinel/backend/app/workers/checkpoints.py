@@ -0,0 +1,117 @@
+"""
+Sentinel AI - Task Checkpoints
+Stage results of analysis tasks, stored in Redis by content digest.
+"""
+import json
+from typing import Any, Callable, Dict, Optional
+
+from app.config import settings
+from app.utils.result_cache import get_result_cache
+
+
+# Content digest (or object key), model version, stage
+CHECKPOINT_KEY = "sentinel:checkpoint:{}:{}:{}"
+
+# Redis client (lazy)
+_redis = None
+
+
+def _get_redis():
+    """Get or create the Redis client."""
+    global _redis
+    if _redis is None:
+        import redis
+        
+        _redis = redis.Redis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_timeout=2,
+            socket_connect_timeout=2
+        )
+    return _redis
+
+
+def load_checkpoint(digest: Optional[str], model_version: str, stage: str) -> Optional[Any]:
+    """
+    Look up a finished stage.
+    
+    Args:
+        digest: Content digest of the input (None: nothing is stored)
+        model_version: Version of the analyzer running the stage
+        stage: Stage name, e.g. "probe" or "range:0.0:10.0"
+    
+    Returns:
+        The stage's result, or None if it has not finished
+    """
+    if digest is None:
+        return None
+    try:
+        data = _get_redis().get(CHECKPOINT_KEY.format(digest, model_version, stage))
+    except Exception as e:
+        print(f"Checkpoint {stage} not loaded: {e}")
+        return None
+    return json.loads(data) if data else None
+
+
+def save_checkpoint(digest: Optional[str], model_version: str, stage: str, value: Any):
+    """
+    Record a finished stage for ``job_ttl_seconds``.
+    
+    A failure to save only costs the work being redone later, so it is
+    logged rather than failing the task.
+    """
+    if digest is None:
+        return
+    try:
+        _get_redis().set(
+            CHECKPOINT_KEY.format(digest, model_version, stage),
+            json.dumps(value),
+            ex=settings.job_ttl_seconds
+        )
+    except Exception as e:
+        print(f"Checkpoint {stage} not saved: {e}")
+
+
+def checkpointed(digest: Optional[str], model_version: str, stage: str, compute: Callable[[], Any]) -> Any:
+    """
+    Run a stage unless it has already finished for this content.
+    
+    Args:
+        digest: Content digest of the input
+        model_version: Version of the analyzer running the stage
+        stage: Stage name
+        compute: Runs the stage; its result must be JSON-serializable
+    
+    Returns:
+        The stage's result, stored or freshly computed
+    """
+    value = load_checkpoint(digest, model_version, stage)
+    if value is None:
+        value = compute()
+        save_checkpoint(digest, model_version, stage, value)
+    return value
+
+
+def load_result(modality: str, digest: Optional[str], model_version: str) -> Optional[Dict]:
+    """
+    Look up the final result of an analysis.
+    
+    With the result cache enabled this is its Redis tier, so a job for
+    content the API has already analyzed (or the other way round) is
+    answered without running again.
+    """
+    if digest is None:
+        return None
+    if settings.result_cache_enabled:
+        return get_result_cache().lookup(modality, digest, model_version)
+    return load_checkpoint(digest, model_version, f"result:{modality}")
+
+
+def save_result(modality: str, digest: Optional[str], model_version: str, result: Dict):
+    """Store the final result of an analysis (see ``load_result``)."""
+    if digest is None:
+        return
+    if settings.result_cache_enabled:
+        get_result_cache().store(modality, digest, model_version, result)
+    else:
+        save_checkpoint(digest, model_version, f"result:{modality}", result)
@@ -0,0 +1,99 @@
+"""
+Sentinel AI - Analysis Jobs
+Enqueue audio/video analysis on Celery and report job status.
+"""
+import json
+import uuid
+from pathlib import Path
+from typing import Optional, Union
+
+import redis
+from celery.result import AsyncResult
+
+from app.config import settings
+from app.schemas.responses import JobStatus
+from app.utils.results import build_job_status
+from app.workers.celery_app import celery_app
+from app.workers.lanes import lane_queue
+from app.workers.tasks import (
+    analyze_audio_task,
+    analyze_video_distributed_task,
+    deliver_job_failure_webhook,
+    deliver_job_webhook
+)
+
+
+JOB_KEY = "sentinel:job:{}"
+
+# Redis client (lazy)
+_redis = None
+
+
+def _get_redis() -> redis.Redis:
+    """Get or create the Redis client."""
+    global _redis
+    if _redis is None:
+        _redis = redis.Redis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_timeout=5,
+            socket_connect_timeout=5
+        )
+    return _redis
+
+
+def submit_job(
+    content_type: str,
+    file_path: Union[Path, str],
+    callback_url: Optional[str] = None,
+    priority: Optional[str] = None
+) -> str:
+    """
+    Enqueue analysis of an uploaded file.
+    
+    The job id is the Celery task id. A job record is kept in Redis for
+    ``job_ttl_seconds`` so unknown ids can be told apart from queued jobs
+    (Celery reports both as PENDING). The job and its follow-up tasks
+    run in the lane for its modality and priority.
+    
+    Args:
+        content_type: "audio" or "video"
+        file_path: Saved upload, deleted by the task when done, or an
+            ``object_source`` the task downloads from object storage
+        callback_url: Optional URL to POST the final job status to
+        priority: "interactive" or "bulk" (default ``job_default_priority``)
+    
+    Returns:
+        Job id
+    """
+    job_id = str(uuid.uuid4())
+    _get_redis().set(
+        JOB_KEY.format(job_id),
+        json.dumps({"content_type": content_type, "callback_url": callback_url}),
+        ex=settings.job_ttl_seconds
+    )
+    
+    queue = lane_queue(content_type, priority or settings.job_default_priority)
+    options = {"task_id": job_id, "queue": queue}
+    if callback_url:
+        options["link"] = deliver_job_webhook.s(job_id, content_type, callback_url).set(queue=queue)
+        options["link_error"] = deliver_job_failure_webhook.s(job_id, content_type, callback_url).set(queue=queue)
+    
+    task = analyze_audio_task if content_type == "audio" else analyze_video_distributed_task
+    task.apply_async((str(file_path),), **options)
+    return job_id
+
+
+def get_job(job_id: str) -> Optional[JobStatus]:
+    """
+    Look up a job's status and, once finished, its result.
+    
+    Returns:
+        JobStatus, or None if the job is unknown or expired
+    """
+    record = _get_redis().get(JOB_KEY.format(job_id))
+    if record is None:
+        return None
+    
+    result = AsyncResult(job_id, app=celery_app)
+    return build_job_status(job_id, json.loads(record)["content_type"], result.state, result.result)
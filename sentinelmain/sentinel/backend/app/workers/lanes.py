@@ -0,0 +1,151 @@
+"""
+Sentinel AI - Priority Lanes
+Celery queues per modality and priority, with queue depth and wait metrics.
+"""
+import json
+import math
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.config import settings
+
+
+# Highest priority first
+PRIORITIES = ("interactive", "bulk")
+MODALITIES = ("audio", "video")
+
+# Recent queue waits per lane (seconds, newest first)
+LANE_WAITS_KEY = "sentinel:lane:{}:waits"
+
+# Message header carrying the time a task became runnable
+ENQUEUED_HEADER = "sentinel_enqueued_at"
+
+# Redis client (lazy)
+_redis = None
+
+
+def lane_queue(modality: str, priority: str) -> str:
+    """
+    Celery queue of one lane, e.g. "0-interactive.audio".
+    
+    The priority's rank leads the name so that workers using the Redis
+    transport's "sorted" queue order always drain higher lanes first.
+    """
+    return f"{PRIORITIES.index(priority)}-{priority}.{modality}"
+
+
+def lane_queues(priorities=PRIORITIES) -> List[str]:
+    """Queues of every lane at the given priorities, in consumption order."""
+    return sorted(lane_queue(modality, priority) for priority in priorities for modality in MODALITIES)
+
+
+def _get_redis():
+    """Get or create the Redis client."""
+    global _redis
+    if _redis is None:
+        import redis
+        
+        _redis = redis.Redis.from_url(
+            settings.redis_url,
+            decode_responses=True,
+            socket_timeout=2,
+            socket_connect_timeout=2
+        )
+    return _redis
+
+
+def stamp_enqueued(headers: Optional[Dict] = None, **kwargs):
+    """
+    ``before_task_publish`` handler: record when a task becomes runnable.
+    
+    A retry's countdown is not queueing, so delayed tasks are stamped
+    with their ETA instead of the publish time.
+    """
+    if headers is None:
+        return
+    runnable_at = time.time()
+    if headers.get("eta"):
+        try:
+            runnable_at = max(runnable_at, datetime.fromisoformat(headers["eta"]).timestamp())
+        except (TypeError, ValueError):
+            pass
+    headers[ENQUEUED_HEADER] = runnable_at
+
+
+def record_wait(task=None, **kwargs):
+    """``task_prerun`` handler: sample how long the task sat in its lane."""
+    request = getattr(task, "request", None)
+    # Custom headers arrive in request.headers; older Celery versions
+    # only copy them onto the request itself
+    headers = getattr(request, "headers", None) or {}
+    enqueued_at = headers.get(ENQUEUED_HEADER, getattr(request, ENQUEUED_HEADER, None))
+    queue = (getattr(request, "delivery_info", None) or {}).get("routing_key")
+    if enqueued_at is None or queue not in lane_queues():
+        return
+    
+    wait = max(0.0, time.time() - float(enqueued_at))
+    key = LANE_WAITS_KEY.format(queue)
+    try:
+        pipe = _get_redis().pipeline()
+        pipe.lpush(key, round(wait, 4))
+        pipe.ltrim(key, 0, settings.lane_wait_samples - 1)
+        pipe.execute()
+    except Exception as e:
+        print(f"Lane wait not recorded: {e}")
+
+
+def _percentile(values: List[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    index = max(0, math.ceil(q * len(values)) - 1)
+    return round(values[index], 3)
+
+
+def lane_stats() -> Dict:
+    """
+    Queue depth and wait times of every lane.
+    
+    Depth and the age of the oldest waiting task come from the broker's
+    lists; wait percentiles cover the last ``lane_wait_samples`` tasks
+    the workers started from each lane.
+    
+    Returns:
+        Dict of lane queue name -> stats
+    """
+    client = _get_redis()
+    now = time.time()
+    
+    queues = lane_queues()
+    pipe = client.pipeline()
+    for queue in queues:
+        pipe.llen(queue)
+        pipe.lindex(queue, -1)  # Oldest message: the workers pop from this end
+        pipe.lrange(LANE_WAITS_KEY.format(queue), 0, -1)
+    replies = pipe.execute()
+    
+    stats = {}
+    for i, queue in enumerate(queues):
+        depth, oldest, samples = replies[3 * i:3 * i + 3]
+        
+        oldest_wait = 0.0
+        if oldest:
+            try:
+                enqueued_at = json.loads(oldest)["headers"].get(ENQUEUED_HEADER)
+                if enqueued_at is not None:
+                    oldest_wait = round(max(0.0, now - float(enqueued_at)), 3)
+            except (ValueError, KeyError, TypeError):
+                pass
+        
+        waits = sorted(float(s) for s in samples)
+        priority, modality = queue.split("-", 1)[1].split(".")
+        stats[queue] = {
+            "modality": modality,
+            "priority": priority,
+            "depth": depth,
+            "oldest_wait_seconds": oldest_wait,
+            "samples": len(waits),
+            "wait_p50_seconds": _percentile(waits, 0.50) if waits else None,
+            "wait_p95_seconds": _percentile(waits, 0.95) if waits else None,
+            "wait_p99_seconds": _percentile(waits, 0.99) if waits else None
+        }
+    return stats
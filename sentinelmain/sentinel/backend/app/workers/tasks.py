@@ -1,58 +1,371 @@
-"""
-Sentinel AI - Celery Tasks
-Async tasks for heavy processing operations.
-"""
-from pathlib import Path
-
-from app.workers.celery_app import celery_app
-from app.models.audio_analyzer import get_audio_analyzer
-from app.models.video_analyzer import get_video_analyzer
-from app.utils.file_handler import delete_file
-
-
-@celery_app.task(bind=True, max_retries=3)
-def analyze_audio_task(self, file_path: str) -> dict:
-    """
-    Async task for audio analysis.
-    
-    Args:
-        file_path: Path to the audio file
-        
-    Returns:
-        Analysis results dict
-    """
-    try:
-        analyzer = get_audio_analyzer()
-        result = analyzer.analyze(Path(file_path))
-        
-        # Clean up file after processing
-        delete_file(Path(file_path))
-        
-        return result
-    except Exception as e:
-        # Retry on failure
-        raise self.retry(exc=e, countdown=5)
-
-
-@celery_app.task(bind=True, max_retries=3)
-def analyze_video_task(self, file_path: str) -> dict:
-    """
-    Async task for video analysis.
-    
-    Args:
-        file_path: Path to the video file
-        
-    Returns:
-        Analysis results dict
-    """
-    try:
-        analyzer = get_video_analyzer()
-        result = analyzer.analyze(Path(file_path))
-        
-        # Clean up file after processing
-        delete_file(Path(file_path))
-        
-        return result
-    except Exception as e:
-        # Retry on failure
-        raise self.retry(exc=e, countdown=5)
+"""
+Sentinel AI - Celery Tasks
+Async tasks for heavy processing operations.
+"""
+from pathlib import Path
+from typing import Callable, Optional
+
+import httpx
+from celery import chord
+
+from app.config import settings
+from app.workers.celery_app import celery_app
+from app.models.audio_analyzer import get_audio_analyzer
+from app.models.video_analyzer import get_video_analyzer
+from app.utils.upload_store import content_digest, delete_file
+from app.utils.object_storage import fetch_object, parse_object_source
+from app.utils.callbacks import check_callback_url
+from app.utils.results import JobRejected, build_job_status, check_job_duration, check_job_media
+from app.workers.checkpoints import checkpointed, load_checkpoint, load_result, save_checkpoint, save_result
+
+
+# Object keys map to content digests independently of any model
+OBJECT_STAGE_VERSION = "object"
+
+
+def _local_file(source: str) -> Path:
+    """
+    Local path of a task's input file.
+    
+    Uploads saved by the API are already in the shared upload directory;
+    objects uploaded to presigned URLs are downloaded into it here, so
+    the API never handles their bytes. An object's digest is checkpointed
+    so retries and duplicates can find its results without downloading.
+    """
+    location = parse_object_source(source)
+    if location is None:
+        return Path(source)
+    local_path = fetch_object(location[1], retention=settings.job_ttl_seconds)
+    save_checkpoint(location[1], OBJECT_STAGE_VERSION, "digest", content_digest(local_path))
+    return local_path
+
+
+def _source_digest(source: str) -> Optional[str]:
+    """Content digest of a task's input, without reading it (None if unknown)."""
+    location = parse_object_source(source)
+    if location is None:
+        return content_digest(source)
+    return load_checkpoint(location[1], OBJECT_STAGE_VERSION, "digest")
+
+
+def _clean_up(source: str, local_path: Optional[Path]):
+    """
+    Delete a finished task's input.
+    
+    Runs after the result is stored and outside the retry handling:
+    ``delete_file`` tolerates files that are already gone, and a failed
+    deletion is left to the janitor rather than redoing the analysis.
+    """
+    if local_path is not None:
+        delete_file(local_path)
+    elif parse_object_source(source) is None:
+        delete_file(Path(source))
+
+
+def _lane(task) -> dict:
+    """Options keeping follow-up tasks in the calling task's priority lane."""
+    queue = (task.request.delivery_info or {}).get("routing_key")
+    return {"queue": queue} if queue else {}
+
+
+def _analyze_once(
+    task,
+    modality: str,
+    analyzer,
+    source: str,
+    run: Optional[Callable[[Path, str], dict]] = None
+) -> dict:
+    """
+    Run a whole-file analysis at most once per content digest.
+    
+    The result is stored by digest (in the result cache's Redis tier)
+    before the input is deleted, so a retry, a redelivery or a duplicate
+    submission of the same content returns it without decoding anything,
+    even once the file is gone.
+    
+    Media over the job duration limit fails the job without retrying.
+    The API checks uploads before queueing them; this catches objects in
+    object storage, which it never reads in full.
+    
+    ``run(local_path, digest)``, if given, replaces the media check and
+    ``analyzer.analyze``, and must reject media itself.
+    """
+    model_version = analyzer.model_version
+    local_path = None
+    try:
+        digest = _source_digest(source)
+        result = load_result(modality, digest, model_version)
+        if result is None:
+            local_path = _local_file(source)
+            digest = content_digest(local_path)
+            if run is None:
+                check_job_media(modality, local_path)
+                result = analyzer.analyze(local_path, digest)
+            else:
+                result = run(local_path, digest)
+            save_result(modality, digest, model_version, result)
+    except JobRejected:
+        _clean_up(source, local_path)
+        raise
+    except Exception as e:
+        # A downloaded copy is fetched again by the retry
+        if local_path is not None and str(local_path) != source:
+            delete_file(local_path)
+        # Retry on failure
+        raise task.retry(exc=e, countdown=5)
+    
+    _clean_up(source, local_path)
+    return result
+
+
+def _analyze_video_staged(analyzer, local_path: Path, digest: str) -> dict:
+    """
+    Analyze a whole video with each stage checkpointed.
+    
+    The probe, the sampled frame scores and the audio track are stored by
+    content digest as each finishes, so a retry (say after the audio
+    branch failed, or the worker was lost) only runs the unfinished
+    stages. The audio stage is shared with ``analyze_video_audio_task``.
+    """
+    model_version = analyzer.model_version
+    
+    def stage(name, compute):
+        return checkpointed(digest, model_version, name, compute)
+    
+    def probe():
+        try:
+            return analyzer.probe(local_path)
+        except Exception as e:
+            raise JobRejected(f"Could not read video: {e}") from e
+    
+    video_info = stage("video_info", probe)
+    check_job_duration("video", video_info["duration"])
+    return analyzer.analyze(local_path, digest, video_info=video_info, stage=stage)
+
+
+@celery_app.task(bind=True, max_retries=3)
+def analyze_audio_task(self, file_path: str) -> dict:
+    """
+    Async task for audio analysis.
+    
+    Args:
+        file_path: Path to the audio file, or an object storage source
+        
+    Returns:
+        Analysis results dict
+    """
+    return _analyze_once(self, "audio", get_audio_analyzer(), file_path)
+
+
+@celery_app.task(bind=True, max_retries=3)
+def analyze_video_task(self, file_path: str) -> dict:
+    """
+    Async task for video analysis.
+    
+    Stages are checkpointed (see ``_analyze_video_staged``).
+    
+    Args:
+        file_path: Path to the video file, or an object storage source
+        
+    Returns:
+        Analysis results dict
+    """
+    analyzer = get_video_analyzer()
+    return _analyze_once(
+        self, "video", analyzer, file_path,
+        run=lambda local_path, digest: _analyze_video_staged(analyzer, local_path, digest)
+    )
+
+
+@celery_app.task(bind=True, max_retries=3)
+def analyze_video_distributed_task(self, file_path: str) -> dict:
+    """
+    Coordinator for distributed video analysis.
+    
+    Probes the video, splits it into ``video_fanout_range_seconds`` time
+    ranges and replaces itself with a chord: one range-scoring task per
+    range (plus the audio track) fanned out across workers, reduced by
+    ``reduce_video_task``. The coordinator's result becomes the reduced
+    result, so callers wait on it exactly like ``analyze_video_task``.
+    
+    Every worker must see the same upload directory (the shared uploads
+    volume). A video in object storage is downloaded into it once, here,
+    and the range tasks read that copy. The fan-out stays in the
+    coordinator's priority lane.
+    
+    Each stage (probe, range scores, audio track, result) is
+    checkpointed by content digest, so a retried or duplicate job only
+    runs the stages that have not finished.
+    
+    Args:
+        file_path: Path to the video file, or an object storage source
+        
+    Returns:
+        Analysis results dict (via the replacing chord)
+    """
+    analyzer = get_video_analyzer()
+    model_version = analyzer.model_version
+    local_path = None
+    try:
+        digest = _source_digest(file_path)
+        result = load_result("video", digest, model_version)
+        if result is None:
+            local_path = _local_file(file_path)
+            digest = content_digest(local_path)
+            duration = checkpointed(
+                digest, model_version, "probe",
+                lambda: {"duration": analyzer.probe(local_path)["duration"]}
+            )["duration"]
+            check_job_duration("video", duration)
+            ranges = analyzer.segment_ranges(duration, settings.video_fanout_range_seconds)
+            
+            if len(ranges) == 1:
+                # Short video: not worth a fan-out
+                result = analyzer.analyze(local_path, digest)
+                save_result("video", digest, model_version, result)
+    except JobRejected:
+        _clean_up(file_path, local_path)
+        raise
+    except Exception as e:
+        # A downloaded copy is fetched again by the retry
+        if local_path is not None and str(local_path) != file_path:
+            delete_file(local_path)
+        # Retry on failure
+        raise self.retry(exc=e, countdown=5)
+    
+    if result is not None:
+        _clean_up(file_path, local_path)
+        return result
+    
+    file_path = str(local_path)
+    lane = _lane(self)
+    header = [score_video_range_task.s(file_path, start, end - start).set(**lane) for start, end in ranges]
+    if analyzer.audio_track:
+        header.append(analyze_video_audio_task.s(file_path).set(**lane))
+    
+    # replace() raises to hand over to the chord, so it stays outside the try
+    return self.replace(chord(header, reduce_video_task.s(file_path, duration).set(**lane)))
+
+
+@celery_app.task(bind=True, max_retries=3)
+def score_video_range_task(self, file_path: str, start: float, duration: float) -> dict:
+    """
+    Map step: score the sampled frames of one time range.
+    
+    Checkpointed by content digest and range, so a retried chord only
+    scores the ranges that had not finished.
+    
+    Returns:
+        Dict with the range start and per-frame scores
+    """
+    analyzer = get_video_analyzer()
+    try:
+        return checkpointed(
+            content_digest(file_path), analyzer.model_version, f"range:{start}:{duration}",
+            lambda: analyzer.score_range(Path(file_path), start, duration)
+        )
+    except Exception as e:
+        # Retry on failure
+        raise self.retry(exc=e, countdown=5)
+
+
+@celery_app.task(bind=True, max_retries=3)
+def analyze_video_audio_task(self, file_path: str) -> dict:
+    """
+    Score a video's audio track alongside its frame ranges.
+    
+    Returns:
+        Dict with the audio analysis under ``audio`` (None without audio)
+    """
+    analyzer = get_video_analyzer()
+    try:
+        return checkpointed(
+            content_digest(file_path), analyzer.model_version, "audio",
+            lambda: {"audio": analyzer.analyze_audio_track(Path(file_path))}
+        )
+    except Exception as e:
+        # Retry on failure
+        raise self.retry(exc=e, countdown=5)
+
+
+@celery_app.task(bind=True, max_retries=3)
+def reduce_video_task(self, results: list, file_path: str, duration: float) -> dict:
+    """
+    Reduce step: pool every range's frame scores and fuse the audio.
+    
+    Args:
+        results: Chord header results (range dicts and the audio dict)
+        file_path: Path to the video file, deleted once reduced
+        duration: Video duration in seconds
+        
+    Returns:
+        Analysis results dict
+    """
+    ranges = [r for r in results if "start_seconds" in r]
+    audio_result = next((r["audio"] for r in results if "audio" in r), None)
+    
+    analyzer = get_video_analyzer()
+    try:
+        result = analyzer.combine_ranges(ranges, audio_result, duration)
+        save_result("video", content_digest(file_path), analyzer.model_version, result)
+    except Exception as e:
+        # Retry on failure
+        raise self.retry(exc=e, countdown=5)
+    
+    # Clean up file after processing
+    delete_file(Path(file_path))
+    
+    return result
+
+
+@celery_app.task(bind=True, max_retries=3)
+def deliver_job_webhook(self, result: dict, job_id: str, content_type: str, callback_url: str):
+    """
+    POST a finished job's status to its callback URL.
+    
+    Linked to the analysis task, so it receives the task result first. The
+    payload is the same ``JobStatus`` that ``GET /jobs/{id}`` returns.
+    """
+    try:
+        check_callback_url(callback_url)
+    except ValueError as e:
+        print(f"Job {job_id} webhook not sent: {e}")
+        return
+    
+    job = build_job_status(job_id, content_type, "SUCCESS", result)
+    try:
+        response = httpx.post(
+            callback_url,
+            content=job.model_dump_json(),
+            headers={"Content-Type": "application/json"},
+            timeout=settings.job_webhook_timeout_seconds
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        # Retry on failure
+        raise self.retry(exc=e, countdown=5)
+
+
+@celery_app.task
+def deliver_job_failure_webhook(request, exc, traceback, job_id: str, content_type: str, callback_url: str):
+    """
+    POST a failed job's status to its callback URL.
+    
+    Runs as the analysis task's error callback; delivery is best effort.
+    """
+    try:
+        check_callback_url(callback_url)
+    except ValueError as e:
+        print(f"Job {job_id} failure webhook not sent: {e}")
+        return
+    
+    job = build_job_status(job_id, content_type, "FAILURE", exc)
+    try:
+        httpx.post(
+            callback_url,
+            content=job.model_dump_json(),
+            headers={"Content-Type": "application/json"},
+            timeout=settings.job_webhook_timeout_seconds
+        )
+    except httpx.HTTPError as e:
+        print(f"Job {job_id} failure webhook failed: {e}")
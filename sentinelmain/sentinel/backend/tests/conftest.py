@@ -0,0 +1,80 @@
+"""
+Sentinel AI - Test Fixtures
+Shared fixtures for the backend tests.
+"""
+import hashlib
+import uuid
+
+import pytest
+
+from app.config import settings
+from app.utils import result_cache
+from app.workers import checkpoints
+
+
+@pytest.fixture
+def upload_dir(tmp_path, monkeypatch):
+    """Point the upload store at a temporary directory."""
+    monkeypatch.setattr(settings, "upload_dir", tmp_path)
+    return tmp_path
+
+
+def store_bytes(data: bytes, ext: str = ".mp4"):
+    """Store ``data`` in the upload store as the API would; returns its handle."""
+    from app.utils.upload_store import store_upload
+    
+    partial = settings.upload_dir / f"{uuid.uuid4().hex}.partial"
+    partial.write_bytes(data)
+    return store_upload(partial, hashlib.sha256(data).hexdigest(), ext)
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis commands the app uses."""
+    
+    def __init__(self):
+        self.data = {}
+    
+    def get(self, key):
+        return self.data.get(key)
+    
+    def set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Point checkpoints and a fresh result cache at one in-memory Redis."""
+    client = FakeRedis()
+    cache = result_cache.ResultCache(max_entries=4, ttl_seconds=60)
+    cache._redis = client
+    monkeypatch.setattr(checkpoints, "_redis", client)
+    monkeypatch.setattr(result_cache, "_cache", cache)
+    return client
+
+
+def write_video(path, frames: int = 50, fps: float = 10.0, size=(64, 48)):
+    """
+    Write an MJPEG AVI whose frame ``i`` is a flat grey of level ``5 * i``.
+    
+    The level identifies which frame a decoder returned.
+    """
+    import cv2
+    import numpy as np
+    
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), fps, size)
+    for i in range(frames):
+        writer.write(np.full((size[1], size[0], 3), (5 * i) % 256, np.uint8))
+    writer.release()
+    return path
+
+
+def frame_index(frame) -> int:
+    """Frame number of a decoded ``write_video`` frame."""
+    return int(round(float(frame.mean()) / 5))
+
+
+@pytest.fixture
+def video(tmp_path):
+    """Five-second, 10 fps test video."""
+    return write_video(tmp_path / "clip.avi")
@@ -0,0 +1,125 @@
+"""
+Sentinel AI - Audio Fingerprint Tests
+Landmark hashes and known-clip lookups.
+"""
+import numpy as np
+import pytest
+
+from app.models import audio_fingerprint
+from app.models.audio_analyzer import get_audio_analyzer
+from app.models.audio_fingerprint import AudioFingerprinter, FingerprintIndex
+from app.models.audio_stream import AudioStreamSession
+
+
+SAMPLE_RATE = 16000
+
+
+def _melody(seed: int, seconds: float) -> np.ndarray:
+    """Random tone sequence, changing pitch every 100 ms, over light noise."""
+    rng = np.random.default_rng(seed)
+    notes = []
+    for freq in rng.uniform(200, 3500, int(seconds * 10)):
+        t = np.arange(SAMPLE_RATE // 10) / SAMPLE_RATE
+        notes.append(0.5 * np.sin(2 * np.pi * freq * t))
+    y = np.concatenate(notes) + rng.normal(0, 0.01, len(notes) * (SAMPLE_RATE // 10))
+    return y.astype(np.float32)
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    """Index with two known clips, installed as the shared index."""
+    index = FingerprintIndex(tmp_path)
+    index.add_clip("robocall-1", "tts", _melody(1, 6))
+    index.add_clip("clone-7", "voice_clone", _melody(2, 6))
+    monkeypatch.setattr(audio_fingerprint, "_index", index)
+    return index
+
+
+def test_hashes_pack_bins_and_delta():
+    fingerprinter = AudioFingerprinter(SAMPLE_RATE)
+    hashes, anchors = fingerprinter.fingerprint(_melody(1, 3))
+    
+    assert len(hashes) == len(anchors) > 0
+    deltas = hashes & 0xFF
+    assert deltas.min() > 0 and deltas.max() <= fingerprinter.max_delta
+    assert (hashes >> 16).max() < fingerprinter.max_bin
+    
+    again, _ = fingerprinter.fingerprint(_melody(1, 3))
+    np.testing.assert_array_equal(hashes, again)
+
+
+def test_lookup_matches_an_excerpt_of_a_known_clip(index):
+    excerpt = _melody(2, 6)[int(1.3 * SAMPLE_RATE):int(4.5 * SAMPLE_RATE)]
+    noisy = excerpt + np.random.default_rng(5).normal(0, 0.05, len(excerpt)).astype(np.float32)
+    
+    match = index.lookup(noisy)
+    
+    assert match["clip"] == "clone-7"
+    assert match["label"] == "voice_clone"
+    assert 0.9 < match["confidence"] <= 0.99
+
+
+def test_short_excerpt_gets_lower_confidence(index):
+    clip = _melody(1, 6)
+    
+    short = index.lookup(clip[SAMPLE_RATE:2 * SAMPLE_RATE])
+    long = index.lookup(clip[SAMPLE_RATE:5 * SAMPLE_RATE])
+    
+    assert short["clip"] == long["clip"] == "robocall-1"
+    assert short["confidence"] < 0.9 < long["confidence"]
+
+
+def _keys(*groups):
+    """Match keys from (clip id, offset, votes) groups."""
+    return np.concatenate([
+        np.full(votes, (clip_id << 32) | (offset & 0xFFFFFFFF), np.int64)
+        for clip_id, offset, votes in groups
+    ])
+
+
+def test_confidence_is_measured_against_chance_alignments(index):
+    # Jitter of one frame still counts for the winner
+    clean = index.best_match(_keys((0, 40, 14), (0, 41, 6), (1, -3, 2)))
+    crowded = index.best_match(_keys((0, 40, 20), (1, -3, 10)))
+    
+    assert clean["clip"] == crowded["clip"] == "robocall-1"
+    assert clean["confidence"] == pytest.approx(1 - np.exp(-18 / 8))
+    assert crowded["confidence"] == pytest.approx(1 - np.exp(-10 / 8))
+
+
+def test_winner_close_to_chance_is_no_match(index):
+    assert index.best_match(_keys((0, 40, 20), (1, 7, 15))) is None
+    assert index.best_match(_keys((1, 7, 7))) is None
+
+
+def test_lookup_ignores_unknown_audio(index):
+    assert index.lookup(_melody(3, 4)) is None
+
+
+def test_saved_index_is_reloaded(index, tmp_path):
+    index.save()
+    
+    reloaded = FingerprintIndex(tmp_path)
+    
+    assert len(reloaded) == 2
+    assert reloaded.lookup(_melody(1, 6)[SAMPLE_RATE:4 * SAMPLE_RATE])["clip"] == "robocall-1"
+
+
+def test_unknown_label_is_refused(index):
+    with pytest.raises(ValueError):
+        index.add_clip("clip", "music", _melody(4, 1))
+
+
+def test_stream_matches_known_clip_from_new_audio(index):
+    session = AudioStreamSession(get_audio_analyzer())
+    stream = np.concatenate([_melody(3, 3), _melody(1, 6)[:3 * SAMPLE_RATE]])
+    pcm = (stream * 32767).astype("<i2").tobytes()
+    
+    for hop in session.feed_pcm(pcm):
+        session.score_hop(hop)
+        if session.known_clip:
+            break
+    
+    assert session.known_clip["clip"] == "robocall-1"
+    assert session.hops_scored <= 5
+    assert session.window_scores()["known_clip"] == "robocall-1"
@@ -0,0 +1,131 @@
+"""
+Sentinel AI - Worker Autoscaler Tests
+Pool sizing from lane demand, with hysteresis.
+"""
+import pytest
+
+from app.config import settings
+from app.workers import autoscaler
+from app.workers.autoscaler import WorkerAutoscaler
+
+
+AUDIO = "0-interactive.audio"
+BULK = "1-bulk.audio"
+
+
+@pytest.fixture(autouse=True)
+def limits(monkeypatch):
+    monkeypatch.setattr(settings, "autoscale_min_processes", 1)
+    monkeypatch.setattr(settings, "autoscale_max_processes", 8)
+    monkeypatch.setattr(settings, "autoscale_tasks_per_process", 1.0)
+    monkeypatch.setattr(settings, "autoscale_max_wait_seconds", 10.0)
+    monkeypatch.setattr(settings, "autoscale_step", 2)
+    monkeypatch.setattr(settings, "autoscale_scale_down_delay_seconds", 60.0)
+
+
+def _lane(depth=0, oldest_wait=0.0):
+    return {"depth": depth, "oldest_wait_seconds": oldest_wait}
+
+
+def test_demand_is_running_plus_share_of_queued():
+    lanes = {AUDIO: _lane(6), BULK: _lane(3)}
+    
+    # 2 running + 6 / 2 consumers + 3 / 1 consumer
+    desired = WorkerAutoscaler().desired_processes(2, 2, [AUDIO, BULK], lanes, {AUDIO: 2, BULK: 1})
+    
+    assert desired == 8
+
+
+def test_tasks_per_process(monkeypatch):
+    monkeypatch.setattr(settings, "autoscale_tasks_per_process", 2.0)
+    
+    assert WorkerAutoscaler().desired_processes(1, 1, [AUDIO], {AUDIO: _lane(4)}, {AUDIO: 1}) == 3
+
+
+def test_demand_is_clamped_to_bounds():
+    scaler = WorkerAutoscaler()
+    
+    assert scaler.desired_processes(4, 0, [AUDIO], {AUDIO: _lane(0)}, {AUDIO: 1}) == 1
+    assert scaler.desired_processes(4, 3, [AUDIO], {AUDIO: _lane(50)}, {AUDIO: 1}) == 8
+
+
+def test_late_lane_asks_for_one_more_process():
+    lanes = {AUDIO: _lane(1, oldest_wait=30.0)}
+    
+    assert WorkerAutoscaler().desired_processes(4, 2, [AUDIO], lanes, {AUDIO: 1}) == 5
+
+
+def test_unknown_queues_are_ignored():
+    assert WorkerAutoscaler().desired_processes(2, 2, ["celery"], {AUDIO: _lane(9)}, {}) == 2
+
+
+def test_growth_is_immediate_but_stepped():
+    scaler = WorkerAutoscaler()
+    
+    assert scaler.decide("w1", current=2, desired=7, now=0.0) == 2
+    assert scaler.decide("w1", current=2, desired=3, now=0.0) == 1
+    assert scaler.decide("w1", current=3, desired=3, now=0.0) == 0
+
+
+def test_shrinking_waits_for_sustained_low_demand():
+    scaler = WorkerAutoscaler()
+    
+    assert scaler.decide("w1", current=6, desired=2, now=0.0) == 0
+    assert scaler.decide("w1", current=6, desired=2, now=59.0) == 0
+    assert scaler.decide("w1", current=6, desired=2, now=60.0) == -1
+    # Each further step needs its own delay
+    assert scaler.decide("w1", current=5, desired=2, now=61.0) == 0
+    assert scaler.decide("w1", current=5, desired=2, now=120.0) == -1
+
+
+def test_demand_spike_resets_the_shrink_delay():
+    scaler = WorkerAutoscaler()
+    
+    scaler.decide("w1", current=6, desired=2, now=0.0)
+    scaler.decide("w1", current=6, desired=6, now=30.0)
+    
+    assert scaler.decide("w1", current=6, desired=2, now=70.0) == 0
+    assert scaler.decide("w1", current=6, desired=2, now=130.0) == -1
+
+
+def test_workers_shrink_independently():
+    scaler = WorkerAutoscaler()
+    
+    scaler.decide("w1", current=4, desired=1, now=0.0)
+    
+    assert scaler.decide("w2", current=4, desired=1, now=60.0) == 0
+    assert scaler.decide("w1", current=4, desired=1, now=60.0) == -1
+
+
+class FakeControl:
+    """Records pool resizes sent through Celery's remote control."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def pool_grow(self, n, destination):
+        self.calls.append(("grow", n, destination))
+    
+    def pool_shrink(self, n, destination):
+        self.calls.append(("shrink", n, destination))
+
+
+def test_poll_resizes_workers(monkeypatch):
+    control = FakeControl()
+    monkeypatch.setattr(autoscaler.celery_app, "control", control)
+    monkeypatch.setattr(autoscaler, "lane_stats", lambda: {AUDIO: _lane(5)})
+    
+    scaler = WorkerAutoscaler()
+    monkeypatch.setattr(scaler, "_inspect_workers", lambda: {
+        "busy@host": {"processes": 2, "queues": [AUDIO], "running": 2},
+        "idle@host": {"processes": 3, "queues": [], "running": 0}
+    })
+    
+    decisions = scaler.poll(now=0.0)
+    
+    assert control.calls == [("grow", 2, ["busy@host"])]
+    assert [(d["worker"], d["change"], d["processes"]) for d in decisions] == [("busy@host", 2, 4)]
+    assert scaler.stats()["grown"] == 2
+    
+    scaler.poll(now=60.0)
+    assert control.calls[-1] == ("shrink", 1, ["idle@host"])
@@ -0,0 +1,45 @@
+"""
+Sentinel AI - Job Callback Tests
+Callback URLs must not reach internal addresses.
+"""
+import pytest
+
+from app.config import settings
+from app.utils.callbacks import check_callback_url
+
+
+@pytest.mark.parametrize("url", [
+    "http://127.0.0.1:8000/hook",
+    "http://localhost/hook",
+    "http://10.1.2.3/hook",
+    "http://192.168.0.10/hook",
+    "http://169.254.169.254/latest/meta-data",
+    "http://100.64.0.1/hook",
+    "http://0.0.0.0/hook",
+    "http://224.0.0.1/hook",
+    "http://[::1]/hook",
+    "http://[fe80::1]/hook",
+    "http://[::ffff:127.0.0.1]/hook"
+])
+def test_internal_addresses_are_refused(url):
+    with pytest.raises(ValueError):
+        check_callback_url(url)
+
+
+@pytest.mark.parametrize("url", ["ftp://93.184.216.34/hook", "http:///hook", "not a url"])
+def test_non_http_urls_are_refused(url):
+    with pytest.raises(ValueError):
+        check_callback_url(url)
+
+
+def test_public_address_is_accepted():
+    check_callback_url("https://93.184.216.34/hook")
+
+
+def test_allowlist_replaces_address_check(monkeypatch):
+    monkeypatch.setattr(settings, "job_callback_allowed_hosts", "receiver, Hooks.Internal")
+    
+    check_callback_url("http://receiver:9000/hook")
+    check_callback_url("http://hooks.internal/hook")
+    with pytest.raises(ValueError):
+        check_callback_url("https://93.184.216.34/hook")
@@ -0,0 +1,158 @@
+"""
+Sentinel AI - Task Checkpoint Tests
+Stage and result checkpoints that let retried jobs skip finished work.
+"""
+import pytest
+import redis
+
+from app.config import settings
+from app.models.video_analyzer import get_video_analyzer
+from app.utils.result_cache import get_result_cache
+from app.workers import checkpoints, tasks
+from app.workers.checkpoints import checkpointed, load_checkpoint, load_result, save_result
+from tests.conftest import store_bytes, write_video
+
+
+class BrokenRedis:
+    def get(self, key):
+        raise redis.ConnectionError("down")
+    
+    def set(self, key, value, ex=None):
+        raise redis.ConnectionError("down")
+
+
+def _counting(value):
+    calls = []
+    
+    def compute():
+        calls.append(1)
+        return value
+    
+    return compute, calls
+
+
+def test_checkpointed_computes_once(fake_redis):
+    compute, calls = _counting({"duration": 4.0})
+    
+    assert checkpointed("d1", "v1", "probe", compute) == {"duration": 4.0}
+    assert checkpointed("d1", "v1", "probe", compute) == {"duration": 4.0}
+    assert len(calls) == 1
+    # Another model version or stage is a miss
+    checkpointed("d1", "v2", "probe", compute)
+    checkpointed("d1", "v1", "frames", compute)
+    assert len(calls) == 3
+
+
+def test_unknown_digest_is_never_stored(fake_redis):
+    compute, calls = _counting({"duration": 4.0})
+    
+    checkpointed(None, "v1", "probe", compute)
+    checkpointed(None, "v1", "probe", compute)
+    
+    assert len(calls) == 2
+    assert fake_redis.data == {}
+
+
+def test_checkpoints_degrade_to_computing_without_redis(monkeypatch):
+    monkeypatch.setattr(checkpoints, "_redis", BrokenRedis())
+    compute, calls = _counting({"duration": 4.0})
+    
+    assert checkpointed("d1", "v1", "probe", compute) == {"duration": 4.0}
+    assert load_checkpoint("d1", "v1", "probe") is None
+
+
+def test_results_go_through_the_cache_tier(fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "result_cache_enabled", True)
+    
+    save_result("audio", "d1", "v1", {"score": 0.5})
+    
+    assert list(fake_redis.data) == [get_result_cache().key("audio", "d1", "v1")]
+    assert load_result("audio", "d1", "v1") == {"score": 0.5}
+    assert get_result_cache().lookup("audio", "d1", "v1") == {"score": 0.5}
+
+
+def test_results_without_the_cache_are_checkpoints(fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "result_cache_enabled", False)
+    
+    save_result("audio", "d1", "v1", {"score": 0.5})
+    
+    assert load_checkpoint("d1", "v1", "result:audio") == {"score": 0.5}
+    assert load_result("audio", "d1", "v1") == {"score": 0.5}
+    assert load_result("audio", None, "v1") is None
+
+
+def test_finished_job_returns_without_its_input(upload_dir, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "result_cache_enabled", True)
+    analyzer = get_video_analyzer()
+    handle = store_bytes(b"video")
+    handle.unlink()  # Deleted by the first delivery
+    save_result("video", tasks.content_digest(handle), analyzer.model_version, {"score": 0.5})
+    monkeypatch.setattr(analyzer, "analyze", lambda *args, **kwargs: pytest.fail("analyzed again"))
+    
+    result = tasks.analyze_video_task.apply(args=[str(handle)])
+    
+    assert result.get() == {"score": 0.5}
+
+
+@pytest.fixture
+def staged(upload_dir, fake_redis, tmp_path, monkeypatch):
+    """A stored test video and the analyzer, with OpenCV decoding."""
+    monkeypatch.setattr(settings, "video_decode_backend", "opencv")
+    handle = store_bytes(write_video(tmp_path / "clip.avi").read_bytes(), ".avi")
+    return get_video_analyzer(), handle, tasks.content_digest(handle)
+
+
+def test_video_stages_are_checkpointed(staged, fake_redis):
+    analyzer, handle, digest = staged
+    
+    result = tasks._analyze_video_staged(analyzer, handle, digest)
+    
+    stages = {key.rsplit(":", 1)[1] for key in fake_redis.data}
+    assert {"video_info", "frames", "audio"} <= stages
+    assert result["duration_seconds"] == pytest.approx(5.0)
+    assert result["frames_analyzed"] > 0
+
+
+def test_retry_skips_finished_stages(staged, monkeypatch):
+    analyzer, handle, digest = staged
+    first = tasks._analyze_video_staged(analyzer, handle, digest)
+    
+    monkeypatch.setattr(analyzer, "probe", lambda path: pytest.fail("probed again"))
+    monkeypatch.setattr(analyzer, "_score_frames", lambda *args, **kwargs: pytest.fail("scored again"))
+    monkeypatch.setattr(analyzer, "analyze_audio_track", lambda path: pytest.fail("audio again"))
+    
+    assert tasks._analyze_video_staged(analyzer, handle, digest) == first
+
+
+def test_unreadable_video_is_rejected(upload_dir, fake_redis, monkeypatch):
+    analyzer = get_video_analyzer()
+    handle = store_bytes(b"not a video", ".avi")
+    
+    def probe(path):
+        raise RuntimeError("ffprobe failed")
+    
+    monkeypatch.setattr(analyzer, "probe", probe)
+    
+    with pytest.raises(tasks.JobRejected, match="Could not read video"):
+        tasks._analyze_video_staged(analyzer, handle, tasks.content_digest(handle))
+    assert fake_redis.data == {}
+
+
+def test_reduce_retries_on_failure(upload_dir, fake_redis, monkeypatch):
+    analyzer = get_video_analyzer()
+    combine_ranges = analyzer.combine_ranges
+    attempts = []
+    
+    def flaky(*args):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("lost the result store")
+        return combine_ranges(*args)
+    
+    monkeypatch.setattr(analyzer, "combine_ranges", flaky)
+    ranges = [{"start_seconds": 0.0, "frame_results": [], "early_exit": False, "face_crops": None}]
+    
+    result = tasks.reduce_video_task.apply(args=[ranges, str(store_bytes(b"video")), 5.0])
+    
+    assert result.get()["duration_seconds"] == 5.0
+    assert len(attempts) == 2
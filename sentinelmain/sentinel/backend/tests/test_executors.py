@@ -0,0 +1,126 @@
+"""
+Sentinel AI - Analysis Executor Tests
+Admission control, timeouts and streaming of the bounded executors.
+"""
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+from app.utils import executors
+from app.utils.executors import BoundedExecutor, ExecutorSaturated
+
+
+@pytest.fixture
+def gate():
+    """Event blocking work until the test releases it."""
+    gate = threading.Event()
+    yield gate
+    gate.set()
+
+
+def _blocked(gate, value=None):
+    gate.wait(5)
+    return value
+
+
+def test_capacity_is_workers_plus_queue(gate):
+    executor = BoundedExecutor("audio", max_workers=1, max_queued=1, timeout=5)
+    
+    running = executor.submit(_blocked, gate)
+    queued = executor.submit(_blocked, gate)
+    with pytest.raises(ExecutorSaturated) as refused:
+        executor.submit(_blocked, gate)
+    
+    stats = executor.stats()
+    assert (stats["in_flight"], stats["queued"], stats["rejected"]) == (2, 1, 1)
+    assert refused.value.retry_after >= 1
+    
+    gate.set()
+    running.result(5)
+    queued.result(5)
+    executor.submit(_blocked, gate, "again").result(5)
+    assert executor.stats()["in_flight"] == 0
+    assert executor.stats()["completed"] == 3
+
+
+def test_run_refuses_with_503_and_cleans_up(gate):
+    executor = BoundedExecutor("image", max_workers=1, max_queued=0, timeout=5)
+    executor.submit(_blocked, gate)
+    cleaned = []
+    
+    with pytest.raises(HTTPException) as refused:
+        asyncio.run(executor.run(_blocked, gate, cleanup=lambda: cleaned.append(True)))
+    
+    assert refused.value.status_code == 503
+    assert int(refused.value.headers["Retry-After"]) >= 1
+    assert cleaned == [True]
+
+
+def test_timed_out_work_keeps_its_slot_until_it_finishes(gate):
+    executor = BoundedExecutor("video", max_workers=1, max_queued=0, timeout=0.05)
+    cleaned = threading.Event()
+    
+    with pytest.raises(HTTPException) as timed_out:
+        asyncio.run(executor.run(_blocked, gate, cleanup=cleaned.set))
+    
+    assert timed_out.value.status_code == 504
+    assert executor.stats()["timed_out"] == 1
+    assert not cleaned.is_set()
+    with pytest.raises(ExecutorSaturated):
+        executor.submit(_blocked, gate)
+    
+    gate.set()
+    assert cleaned.wait(5)
+    executor.submit(_blocked, gate).result(5)
+
+
+def test_run_returns_the_result():
+    executor = BoundedExecutor("text", max_workers=2, max_queued=0, timeout=5)
+    
+    assert asyncio.run(executor.run(sum, [1, 2, 3])) == 6
+
+
+def test_iterate_streams_items_and_errors():
+    executor = BoundedExecutor("video", max_workers=1, max_queued=0, timeout=5)
+    
+    def numbers(n):
+        yield from range(n)
+        raise ValueError("decoder failed")
+    
+    async def collect():
+        items = []
+        with pytest.raises(ValueError):
+            async for item in executor.iterate(numbers, 3):
+                items.append(item)
+        return items
+    
+    assert asyncio.run(collect()) == [0, 1, 2]
+
+
+def test_iterate_refuses_before_streaming(gate):
+    executor = BoundedExecutor("video", max_workers=1, max_queued=0, timeout=5)
+    executor.submit(_blocked, gate)
+    
+    async def start():
+        return executor.iterate(iter, [1])
+    
+    with pytest.raises(HTTPException) as refused:
+        asyncio.run(start())
+    assert refused.value.status_code == 503
+
+
+def test_saturated_route_answers_503(gate, monkeypatch):
+    executor = BoundedExecutor("text", max_workers=1, max_queued=0, timeout=5)
+    executor.submit(_blocked, gate)
+    monkeypatch.setitem(executors._executors, "text", executor)
+    monkeypatch.setattr(settings, "result_cache_enabled", False)
+    
+    response = TestClient(app).post("/analyze/text", json={"text": "Your account is locked, pay now"})
+    
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
@@ -0,0 +1,95 @@
+"""
+Sentinel AI - Face ROI Tests
+Face tracking and the decode size used for cropping.
+"""
+import numpy as np
+import pytest
+
+from app.models.face_roi import FaceTracker
+from app.models.video_analyzer import VideoAnalyzer
+
+
+class FakeCascade:
+    """Reports a fixed face box, given in full-frame pixels."""
+    
+    def __init__(self, box, frame_width):
+        self.box = box
+        self.frame_width = frame_width
+        self.calls = 0
+    
+    def detectMultiScale(self, image, **kwargs):
+        self.calls += 1
+        if self.box is None:
+            return []
+        scale = image.shape[1] / self.frame_width
+        return [tuple(int(v * scale) for v in self.box)]
+
+
+def _frame(face_at=None, size=(640, 480)):
+    """Dark frame with a textured 80x80 "face" patch at ``face_at``."""
+    frame = np.full((size[1], size[0], 3), 20, np.uint8)
+    if face_at is not None:
+        x, y = face_at
+        patch = np.random.default_rng(0).integers(0, 256, (80, 80), np.uint8)
+        frame[y:y + 80, x:x + 80] = patch[..., None]
+    return frame
+
+
+@pytest.fixture
+def tracker():
+    tracker = FaceTracker((112, 112))
+    tracker._cascade = FakeCascade((200, 160, 80, 80), 640)
+    return tracker
+
+
+def test_no_face_returns_whole_frame(tracker):
+    tracker._cascade.box = None
+    
+    crop = tracker.process(_frame())
+    
+    assert crop.shape == (112, 112, 3)
+    assert tracker.face_crops == 0
+
+
+def test_detects_once_then_tracks(tracker):
+    tracker.process(_frame((200, 160)))
+    crop = tracker.process(_frame((208, 164)))
+    
+    assert tracker.detections == 1
+    assert tracker.face_crops == 2
+    assert tracker._box == (208, 164, 80, 80)
+    assert crop.shape == (112, 112, 3)
+
+
+def test_lost_face_runs_the_detector_again(tracker):
+    tracker.process(_frame((200, 160)))
+    tracker.process(_frame())
+    
+    assert tracker.detections == 2
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = VideoAnalyzer()
+    analyzer.roi_working_size = 480
+    return analyzer
+
+
+def test_decode_size_without_roi_is_model_size(analyzer):
+    analyzer.face_roi = False
+    
+    assert analyzer._decode_size({"width": 1920, "height": 1080}) == (224, 224)
+
+
+def test_decode_size_keeps_aspect_ratio(analyzer):
+    analyzer.face_roi = True
+    
+    assert analyzer._decode_size({"width": 1920, "height": 1080}) == (480, 270)
+    assert analyzer._decode_size({"width": 1080, "height": 1920}) == (270, 480)
+
+
+def test_decode_size_never_upscales_and_is_even(analyzer):
+    analyzer.face_roi = True
+    
+    assert analyzer._decode_size({"width": 333, "height": 201}) == (332, 200)
+    assert analyzer._decode_size({"width": 0, "height": 0}) == (224, 224)
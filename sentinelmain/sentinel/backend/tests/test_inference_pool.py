@@ -0,0 +1,95 @@
+"""
+Sentinel AI - Inference Pool Tests
+Shared-memory block allocation and replacement of crashed workers.
+"""
+import os
+import signal
+import time
+
+import numpy as np
+import pytest
+
+from app.config import settings
+from app.models.inference_pool import InferencePool
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = InferencePool(processes=1, ring_bytes=4096, max_input_bytes=2048, block_bytes=1024)
+    yield pool
+    pool.shutdown()
+
+
+def _frame(level=0):
+    return np.full((8, 8, 3), level, np.uint8)
+
+
+def _wait_for(condition, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.05)
+
+
+def test_frames_are_scored_in_a_worker(pool):
+    result = pool.submit("video_frame", _frame()).result(timeout=30)
+    
+    assert set(result) == {"real_score", "fake_score"}
+    assert pool.stats()["blocks_used"] == 0
+
+
+def test_oversized_input_is_refused(pool):
+    with pytest.raises(ValueError):
+        pool.submit("video_frame", np.zeros(4096, np.uint8))
+
+
+def test_inputs_take_contiguous_blocks(pool):
+    first = pool._acquire(1500)
+    second = pool._acquire(10)
+    try:
+        assert first == (0, 2)
+        assert second == (2, 1)
+        assert pool._find_blocks(2) is None
+        assert pool._find_blocks(1) == 3
+    finally:
+        pool._release(first)
+        pool._release(second)
+    assert pool.stats()["blocks_used"] == 0
+
+
+def test_full_ring_times_out(pool, monkeypatch):
+    monkeypatch.setattr(settings, "inference_timeout_seconds", 0.05)
+    held = pool._acquire(2048), pool._acquire(2048)
+    try:
+        with pytest.raises(TimeoutError):
+            pool._acquire(1)
+    finally:
+        for blocks in held:
+            pool._release(blocks)
+
+
+def test_crashed_worker_fails_its_requests_and_is_replaced(pool):
+    worker = pool._workers[0]
+    os.kill(worker.process.pid, signal.SIGSTOP)
+    future = pool.submit("video_frame", _frame(1))
+    os.kill(worker.process.pid, signal.SIGKILL)
+    
+    with pytest.raises(RuntimeError, match="exited"):
+        future.result(timeout=30)
+    _wait_for(lambda: pool.stats()["restarts"] == 1)
+    
+    assert pool._workers[0] is not worker
+    assert pool.stats()["blocks_used"] == 0
+    assert "fake_score" in pool.submit("video_frame", _frame(2)).result(timeout=30)
+
+
+def test_requests_without_a_live_worker_fail_at_once(pool):
+    worker = pool._workers[0]
+    worker.alive = False
+    try:
+        future = pool.submit("video_frame", _frame())
+        with pytest.raises(RuntimeError, match="No inference process"):
+            future.result(timeout=1)
+    finally:
+        worker.alive = True
+    assert pool.stats()["blocks_used"] == 0
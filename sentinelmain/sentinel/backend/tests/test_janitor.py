@@ -0,0 +1,90 @@
+"""
+Sentinel AI - Upload Janitor Tests
+Expiry heap ordering, batching and the startup scan.
+"""
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from app.config import settings
+from app.utils import janitor as janitor_module
+from app.utils.janitor import UploadJanitor
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def janitor(upload_dir):
+    janitor = UploadJanitor()
+    yield janitor
+    janitor.stop()
+
+
+def _touch(path: Path, age: float = 0.0) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"data")
+    if age:
+        old = time.time() - age
+        os.utime(path, (old, old))
+    return path
+
+
+def test_schedule_is_a_no_op_when_not_running(janitor, upload_dir):
+    janitor.schedule(_touch(upload_dir / "a.wav"), 0)
+    
+    assert janitor.stats()["pending"] == 0
+
+
+def test_expired_entries_come_out_in_deadline_order(janitor, monkeypatch):
+    monkeypatch.setattr(janitor_module, "BATCH_SIZE", 2)
+    now = time.time()
+    for offset, name in [(-1, "b"), (-3, "a"), (60, "later"), (-2, "c")]:
+        janitor._push(now + offset, Path(name))
+    
+    assert janitor._next_batch() == ["a", "c"]
+    assert janitor._next_batch() == ["b"]
+    assert janitor.stats()["pending"] == 1
+
+
+def test_stopped_janitor_returns_no_batch(janitor):
+    janitor.stop()
+    
+    assert janitor._next_batch() is None
+
+
+def test_earlier_deadline_wakes_the_thread(janitor, upload_dir):
+    janitor.start()
+    keep = _touch(upload_dir / "keep.wav")
+    expire = _touch(upload_dir / "expire.wav")
+    
+    janitor.schedule(keep, 60)
+    janitor.schedule(expire, 0.05)
+    
+    _wait_for(lambda: not expire.exists())
+    assert keep.exists()
+    assert janitor.stats()["deleted"] == 1
+
+
+def test_startup_scan_recovers_leftovers(janitor, upload_dir, monkeypatch):
+    monkeypatch.setattr(settings, "file_retention_seconds", 60)
+    monkeypatch.setattr(settings, "job_ttl_seconds", 60)
+    monkeypatch.setattr(settings, "resumable_upload_ttl_seconds", 60)
+    fresh = _touch(upload_dir / "fresh.wav")
+    stale = _touch(upload_dir / "stale.wav", age=120)
+    stale_part = _touch(upload_dir / "resumable" / "abc.part", age=120)
+    orphan = _touch(upload_dir / "objects" / ("0" * 64 + ".wav"), age=120)
+    
+    janitor.start()
+    _wait_for(lambda: janitor.stats()["recovered"] == 1 and not orphan.exists())
+    
+    assert fresh.exists()
+    assert not stale.exists() and not stale_part.exists()
+    assert janitor.stats()["deleted"] == 3
+    assert janitor.stats()["pending"] == 1
@@ -0,0 +1,168 @@
+"""
+Sentinel AI - Priority Lane Tests
+Lane naming and queue wait statistics.
+"""
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import settings
+from app.workers import lanes
+from app.workers.lanes import ENQUEUED_HEADER, _percentile, lane_queue, lane_queues, lane_stats
+
+
+class FakeRedis:
+    """Just enough of a Redis client for the lane code: lists and pipelines."""
+    
+    def __init__(self):
+        self.lists = {}
+    
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+    
+    def __getattr__(self, name):
+        return lambda *args: self.calls.append((name, args))
+    
+    def execute(self):
+        return [getattr(self, f"_{name}")(*args) for name, args in self.calls]
+    
+    def _list(self, key):
+        return self.client.lists.setdefault(key, [])
+    
+    def _lpush(self, key, value):
+        self._list(key).insert(0, str(value))
+        return len(self._list(key))
+    
+    def _ltrim(self, key, start, end):
+        self.client.lists[key] = self._list(key)[start:end + 1]
+        return True
+    
+    def _llen(self, key):
+        return len(self._list(key))
+    
+    def _lindex(self, key, index):
+        values = self._list(key)
+        return values[index] if values else None
+    
+    def _lrange(self, key, start, end):
+        values = self._list(key)
+        return values[start:] if end == -1 else values[start:end + 1]
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(lanes, "_redis", client)
+    return client
+
+
+def test_higher_priority_lanes_sort_first():
+    assert lane_queue("audio", "interactive") == "0-interactive.audio"
+    assert lane_queues() == ["0-interactive.audio", "0-interactive.video", "1-bulk.audio", "1-bulk.video"]
+
+
+@pytest.mark.parametrize("q, expected", [(0.0, 1.0), (0.5, 50.0), (0.95, 95.0), (0.99, 99.0), (1.0, 100.0)])
+def test_nearest_rank_percentile(q, expected):
+    values = [float(v) for v in range(1, 101)]
+    
+    assert _percentile(values, q) == expected
+
+
+def test_percentile_of_one_sample():
+    assert _percentile([2.5], 0.99) == 2.5
+
+
+def test_lane_stats(redis):
+    now = time.time()
+    queue = "0-interactive.audio"
+    # Workers pop from the right: the last element is the oldest message
+    redis.lists[queue] = [
+        json.dumps({"headers": {ENQUEUED_HEADER: now - 1}}),
+        json.dumps({"headers": {ENQUEUED_HEADER: now - 30}})
+    ]
+    redis.lists[lanes.LANE_WAITS_KEY.format(queue)] = [str(w) for w in (0.4, 0.1, 3.0, 0.2)]
+    
+    stats = lane_stats()
+    
+    assert set(stats) == set(lane_queues())
+    lane = stats[queue]
+    assert (lane["modality"], lane["priority"], lane["depth"], lane["samples"]) == ("audio", "interactive", 2, 4)
+    assert lane["oldest_wait_seconds"] == pytest.approx(30, abs=1)
+    assert (lane["wait_p50_seconds"], lane["wait_p95_seconds"], lane["wait_p99_seconds"]) == (0.2, 3.0, 3.0)
+    
+    idle = stats["1-bulk.video"]
+    assert (idle["depth"], idle["oldest_wait_seconds"], idle["wait_p50_seconds"]) == (0, 0.0, None)
+
+
+def test_unreadable_oldest_message_counts_as_no_wait(redis):
+    redis.lists["1-bulk.audio"] = ["not json"]
+    
+    assert lane_stats()["1-bulk.audio"]["oldest_wait_seconds"] == 0.0
+
+
+def _task(queue, enqueued_at):
+    request = SimpleNamespace(delivery_info={"routing_key": queue})
+    setattr(request, ENQUEUED_HEADER, enqueued_at)
+    return SimpleNamespace(request=request)
+
+
+def test_wait_is_read_from_message_headers(redis):
+    request = SimpleNamespace(
+        delivery_info={"routing_key": "0-interactive.audio"},
+        headers={ENQUEUED_HEADER: time.time() - 2}
+    )
+    
+    lanes.record_wait(task=SimpleNamespace(request=request))
+    
+    assert round(float(redis.lists[lanes.LANE_WAITS_KEY.format("0-interactive.audio")][0])) == 2
+
+
+def test_wait_is_recorded_for_a_published_task(redis, monkeypatch):
+    from celery.contrib.testing.worker import start_worker
+    
+    from app.workers.celery_app import celery_app
+    from app.workers.tasks import deliver_job_failure_webhook
+    
+    monkeypatch.setitem(celery_app.conf, "broker_url", "memory://")
+    queue = lane_queue("video", "bulk")
+    key = lanes.LANE_WAITS_KEY.format(queue)
+    
+    with start_worker(celery_app, pool="solo", perform_ping_check=False, queues=[queue]):
+        # Not an http(s) callback, so the task returns without sending anything
+        deliver_job_failure_webhook.apply_async(
+            args=[None, None, None, "job", "video", "ftp://example.com"], queue=queue, ignore_result=True
+        )
+        deadline = time.monotonic() + 10
+        while not redis.lists.get(key) and time.monotonic() < deadline:
+            time.sleep(0.05)
+    
+    assert len(redis.lists[key]) == 1
+
+
+def test_recorded_waits_are_trimmed(redis, monkeypatch):
+    monkeypatch.setattr(settings, "lane_wait_samples", 3)
+    key = lanes.LANE_WAITS_KEY.format("1-bulk.video")
+    
+    for waited in (5, 4, 3, 2):
+        lanes.record_wait(task=_task("1-bulk.video", time.time() - waited))
+    lanes.record_wait(task=_task("celery", time.time() - 9))
+    
+    assert [round(float(w)) for w in redis.lists[key]] == [2, 3, 4]
+    assert list(redis.lists) == [key]
+
+
+def test_retry_countdown_is_not_queueing():
+    eta = time.time() + 60
+    headers = {"eta": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(eta))}
+    
+    lanes.stamp_enqueued(headers=headers)
+    
+    assert headers[ENQUEUED_HEADER] == pytest.approx(eta, abs=1)
@@ -0,0 +1,128 @@
+"""
+Sentinel AI - In-Memory Upload Tests
+Parsing image and audio uploads without spooling them to disk.
+"""
+import pytest
+from fastapi.testclient import TestClient
+from starlette.formparsers import MultiPartParser
+
+from app.api.routes import image
+from app.config import settings
+from app.main import app
+
+
+BOUNDARY = "sentinel-boundary"
+
+PNG_HEAD = b"\x89PNG\r\n\x1a\n\x00\x00\x00\x0dIHDR"
+
+
+def _body(data: bytes, name: str = "file", filename: str = "photo.png") -> bytes:
+    field = b'--sentinel-boundary\r\nContent-Disposition: form-data; name="note"\r\n\r\nhello\r\n'
+    part = (
+        f'--{BOUNDARY}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+        f"Content-Type: image/png\r\n\r\n"
+    ).encode()
+    return field + part + data + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+@pytest.fixture
+def uploads(monkeypatch):
+    """Record the upload each image request parsed, then stop the request."""
+    seen = []
+    
+    async def read_upload(file, file_type):
+        seen.append({
+            "filename": file.filename,
+            "content_type": file.content_type,
+            "data": file.file.read(),
+            "in_memory": not file.file._rolled
+        })
+        raise image.HTTPException(status_code=418, detail="recorded")
+    
+    monkeypatch.setattr(image, "read_upload", read_upload)
+    return seen
+
+
+@pytest.fixture
+def client(upload_dir):
+    return TestClient(app)
+
+
+def _post(client, body, **headers):
+    return client.post(
+        "/analyze/image",
+        content=body,
+        headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}", **headers}
+    )
+
+
+def test_file_field_is_parsed(client, uploads):
+    data = PNG_HEAD + b"\x00" * 100
+    
+    assert _post(client, _body(data)).status_code == 418
+    assert uploads == [{"filename": "photo.png", "content_type": "image/png", "data": data, "in_memory": True}]
+
+
+def test_upload_under_the_threshold_stays_in_memory(client, uploads, monkeypatch):
+    monkeypatch.setattr(settings, "upload_memory_threshold_mb", 2)
+    
+    _post(client, _body(PNG_HEAD + b"\x00" * 1_500_000))
+    
+    assert uploads[0]["in_memory"]
+
+
+def test_upload_over_the_threshold_spills(client, uploads, monkeypatch):
+    monkeypatch.setattr(settings, "upload_memory_threshold_mb", 1)
+    
+    _post(client, _body(PNG_HEAD + b"\x00" * 1_500_000))
+    
+    assert not uploads[0]["in_memory"]
+
+
+def test_oversized_stream_is_refused(client, uploads, monkeypatch):
+    monkeypatch.setattr(settings, "max_upload_size_mb", 1)
+    body = _body(PNG_HEAD + b"\x00" * 1_500_000)
+    
+    # Chunked, so only the parser sees the size
+    response = _post(client, (body[i:i + 65536] for i in range(0, len(body), 65536)))
+    
+    assert response.status_code == 413
+    assert uploads == []
+
+
+def test_missing_file_field_is_refused(client, uploads):
+    response = _post(client, _body(PNG_HEAD, name="picture"))
+    
+    assert response.status_code == 400
+    assert uploads == []
+
+
+def test_non_multipart_body_is_refused(client, uploads):
+    response = client.post("/analyze/image", content=PNG_HEAD, headers={"Content-Type": "image/png"})
+    
+    assert response.status_code == 400
+
+
+def test_starlette_spool_size_is_left_alone():
+    attribute = "spool_max_size" if hasattr(MultiPartParser, "spool_max_size") else "max_file_size"
+    
+    assert getattr(MultiPartParser, attribute) == 1024 * 1024
+
+
+def test_openapi_documents_the_file_field(client):
+    schema = client.get("/openapi.json").json()
+    body = schema["paths"]["/analyze/audio"]["post"]["requestBody"]
+    
+    assert body["content"]["multipart/form-data"]["schema"]["required"] == ["file"]
+
+
+def test_image_is_analyzed_from_memory(client):
+    import cv2
+    import numpy as np
+    
+    _, png = cv2.imencode(".png", np.full((32, 32, 3), 128, np.uint8))
+    
+    response = client.post("/analyze/image", files={"file": ("photo.png", png.tobytes(), "image/png")})
+    
+    assert response.status_code == 200
+    assert response.json()["content_type"] == "image"
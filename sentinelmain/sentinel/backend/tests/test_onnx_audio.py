@@ -0,0 +1,112 @@
+"""
+Sentinel AI - ONNX Audio Backend Tests
+Length buckets and micro-batching, with a stand-in inference session.
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import onnxruntime
+import pytest
+
+from app.config import settings
+from app.models.onnx_audio import AUDIO_CLASSES, OnnxAudioBackend
+
+
+SAMPLE_RATE = 16000
+
+
+class FakeSession:
+    """Records each batch; the logits favour class (row % 3)."""
+    
+    fail = False
+    
+    def __init__(self, path, sess_options=None, providers=None):
+        self.batches = []
+        self.lock = threading.Lock()
+    
+    def get_inputs(self):
+        return [SimpleNamespace(name="input_values"), SimpleNamespace(name="attention_mask")]
+    
+    def get_outputs(self):
+        return [SimpleNamespace(name="logits")]
+    
+    def get_providers(self):
+        return ["CPUExecutionProvider"]
+    
+    def run(self, outputs, feeds):
+        if self.fail:
+            raise RuntimeError("model failed")
+        with self.lock:
+            self.batches.append(feeds)
+        logits = np.zeros((len(feeds["input_values"]), 3), np.float32)
+        logits[np.arange(len(logits)), np.arange(len(logits)) % 3] = 5.0
+        return [logits]
+
+
+@pytest.fixture
+def backend(monkeypatch, tmp_path):
+    monkeypatch.setattr(onnxruntime, "InferenceSession", FakeSession)
+    monkeypatch.setattr(settings, "audio_bucket_seconds", [4, 2, 8])
+    monkeypatch.setattr(settings, "audio_max_batch_size", 3)
+    monkeypatch.setattr(settings, "audio_max_batch_wait_ms", 50)
+    return OnnxAudioBackend(tmp_path / "model.onnx")
+
+
+def _clip(seconds: float) -> np.ndarray:
+    return np.random.default_rng(0).normal(0, 0.1, int(seconds * SAMPLE_RATE)).astype(np.float32)
+
+
+@pytest.mark.parametrize("seconds, bucket", [(0.5, 2), (2.0, 2), (2.1, 4), (7.9, 8), (30.0, 8)])
+def test_smallest_bucket_that_fits(backend, seconds, bucket):
+    assert backend._bucket_for(int(seconds * SAMPLE_RATE)) == bucket
+
+
+def test_clips_are_batched_per_bucket_and_padded_to_it(backend):
+    futures = [backend.submit(_clip(1.0)) for _ in range(2)] + [backend.submit(_clip(3.0))]
+    results = [f.result(timeout=5) for f in futures]
+    
+    shapes = sorted(batch["input_values"].shape for batch in backend.session.batches)
+    assert shapes == [(1, 4 * SAMPLE_RATE), (2, 2 * SAMPLE_RATE)]
+    for batch in backend.session.batches:
+        assert batch["attention_mask"].sum(axis=1).tolist() in ([SAMPLE_RATE] * 2, [3 * SAMPLE_RATE])
+    
+    for result in results:
+        assert set(result) == set(AUDIO_CLASSES)
+        assert sum(result.values()) == pytest.approx(1.0)
+    assert results[0]["human_voice"] > 0.9 and results[1]["tts_likelihood"] > 0.9
+    
+    stats = backend.stats()["buckets"]
+    assert stats["2s"]["clips"] == 2 and stats["2s"]["padding_ratio"] == pytest.approx(0.5)
+    assert stats["4s"]["padding_ratio"] == pytest.approx(0.25)
+
+
+def test_full_batch_runs_without_waiting(backend):
+    backend.max_wait = 10.0
+    started = time.monotonic()
+    
+    futures = [backend.submit(_clip(1.0)) for _ in range(3)]
+    for future in futures:
+        future.result(timeout=5)
+    
+    assert time.monotonic() - started < 1.0
+    assert [len(b["input_values"]) for b in backend.session.batches] == [3]
+
+
+def test_oversized_clip_is_truncated_to_the_largest_bucket(backend):
+    backend.infer(_clip(10.0))
+    
+    batch = backend.session.batches[0]
+    assert batch["input_values"].shape == (1, 8 * SAMPLE_RATE)
+    assert batch["attention_mask"].all()
+
+
+def test_model_errors_reach_every_caller(backend, monkeypatch):
+    monkeypatch.setattr(FakeSession, "fail", True)
+    
+    futures = [backend.submit(_clip(1.0)) for _ in range(2)]
+    
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=5)
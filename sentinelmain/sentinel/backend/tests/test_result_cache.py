@@ -0,0 +1,149 @@
+"""
+Sentinel AI - Result Cache Tests
+Two-tier caching and single-flighting of analysis results.
+"""
+import asyncio
+
+import pytest
+import redis
+
+from app.utils.result_cache import ResultCache
+from tests.conftest import FakeRedis
+
+
+class BrokenRedis:
+    def get(self, key):
+        raise redis.ConnectionError("down")
+    
+    def set(self, key, value, ex=None):
+        raise redis.ConnectionError("down")
+
+
+def _cache(client=None, max_entries=4):
+    cache = ResultCache(max_entries=max_entries, ttl_seconds=60)
+    cache._redis = client if client is not None else FakeRedis()
+    return cache
+
+
+def _counter(result=None):
+    calls = []
+    
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return dict(result or {"score": len(calls)})
+    
+    return compute, calls
+
+
+def test_second_lookup_is_a_local_hit():
+    cache = _cache()
+    compute, calls = _counter()
+    
+    async def run():
+        first = await cache.get_or_compute("image", "d1", "v1", compute)
+        first["score"] = 99  # Callers get copies
+        return await cache.get_or_compute("image", "d1", "v1", compute)
+    
+    assert asyncio.run(run()) == {"score": 1}
+    assert len(calls) == 1
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_concurrent_misses_compute_once():
+    cache = _cache()
+    compute, calls = _counter()
+    
+    async def run():
+        return await asyncio.gather(*(cache.get_or_compute("audio", "d1", "v1", compute) for _ in range(5)))
+    
+    assert asyncio.run(run()) == [{"score": 1}] * 5
+    assert len(calls) == 1
+    assert cache.stats()["coalesced"] == 4
+    assert cache._in_flight == {}
+
+
+def test_failure_reaches_waiters_and_is_not_cached():
+    cache = _cache()
+    attempts = []
+    
+    async def failing():
+        attempts.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("model crashed")
+    
+    async def run():
+        return await asyncio.gather(
+            *(cache.get_or_compute("audio", "d1", "v1", failing) for _ in range(3)),
+            return_exceptions=True
+        )
+    
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(attempts) == 1
+    
+    compute, calls = _counter()
+    assert asyncio.run(cache.get_or_compute("audio", "d1", "v1", compute)) == {"score": 1}
+
+
+def test_waiter_takes_over_from_a_cancelled_request():
+    cache = _cache()
+    compute, calls = _counter()
+    
+    async def run():
+        first = asyncio.ensure_future(cache.get_or_compute("audio", "d1", "v1", compute))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cache.get_or_compute("audio", "d1", "v1", compute))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, first.cancelled()
+    
+    assert asyncio.run(run()) == ({"score": 1}, True)
+    assert cache._in_flight == {}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = _cache(max_entries=2)
+    compute, _ = _counter()
+    
+    async def run():
+        for digest in ("a", "b", "a", "c"):
+            await cache.get_or_compute("image", digest, "v1", compute)
+    
+    asyncio.run(run())
+    keys = [key.rsplit(":", 1)[1] for key in cache._entries]
+    assert keys == ["a", "c"]
+
+
+def test_results_are_shared_through_redis():
+    client = FakeRedis()
+    compute, calls = _counter()
+    asyncio.run(_cache(client).get_or_compute("video", "d1", "v1", compute))
+    
+    other = _cache(client)
+    assert asyncio.run(other.get_or_compute("video", "d1", "v1", compute)) == {"score": 1}
+    assert other.stats()["redis_hits"] == 1
+    assert len(calls) == 1
+    assert other.lookup("video", "d1", "v1") == {"score": 1}
+    assert other.lookup("video", "d1", "v2") is None
+
+
+def test_redis_outage_is_skipped():
+    cache = _cache(BrokenRedis())
+    compute, _ = _counter()
+    
+    assert asyncio.run(cache.get_or_compute("image", "d1", "v1", compute)) == {"score": 1}
+    assert cache.stats()["redis_errors"] == 1
+    # Backing off: the tier is not tried again
+    assert cache._redis_client() is None
+    cache.store("image", "d2", "v1", {"score": 2})
+    assert cache.stats()["redis_errors"] == 1
+
+
+def test_unserializable_result_is_not_an_outage():
+    cache = _cache()
+    
+    with pytest.raises(TypeError):
+        cache.store("image", "d1", "v1", {"labels": {"a"}})
+    assert cache.stats()["redis_errors"] == 0
+    assert cache._redis_client() is not None
@@ -0,0 +1,115 @@
+"""
+Sentinel AI - Resumable Upload Tests
+Offsets, conflicting appends and the magic-byte check of PATCH /uploads.
+"""
+import fcntl
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.utils import resumable
+
+
+WAV = b"RIFF\x24\x00\x00\x00WAVEfmt " + bytes(100)
+
+
+@pytest.fixture
+def client(upload_dir):
+    """API client without the startup tasks (janitor, pools)."""
+    return TestClient(app)
+
+
+def _start(client, size=len(WAV), filename="clip.wav"):
+    response = client.post("/uploads", json={"filename": filename, "content_type": "audio", "size": size})
+    assert response.status_code == 201
+    return response.json()["upload_id"]
+
+
+def _patch(client, upload_id, offset, data):
+    return client.patch(f"/uploads/{upload_id}", content=data, headers={"Upload-Offset": str(offset)})
+
+
+def test_ranges_append_at_the_reported_offset(client):
+    upload_id = _start(client)
+    
+    response = _patch(client, upload_id, 0, WAV[:40])
+    assert response.status_code == 200
+    assert response.headers["Upload-Offset"] == "40"
+    
+    response = client.head(f"/uploads/{upload_id}")
+    assert response.headers["Upload-Offset"] == "40"
+    
+    response = _patch(client, upload_id, 40, WAV[40:])
+    assert response.json()["offset"] == len(WAV)
+
+
+def test_stale_offset_is_a_conflict(client):
+    upload_id = _start(client)
+    _patch(client, upload_id, 0, WAV[:40])
+    
+    response = _patch(client, upload_id, 0, WAV[:40])
+    
+    assert response.status_code == 409
+    assert response.headers["Upload-Offset"] == "40"
+    assert client.head(f"/uploads/{upload_id}").headers["Upload-Offset"] == "40"
+
+
+def test_range_past_the_size_is_refused(client):
+    upload_id = _start(client)
+    
+    response = _patch(client, upload_id, 0, WAV + b"extra")
+    
+    assert response.status_code == 413
+
+
+def test_concurrent_append_is_a_conflict(client):
+    upload_id = _start(client)
+    part, _ = resumable._paths(upload_id)
+    
+    # Another process (or replica) holding the upload's lock
+    with open(part, "r+b") as holder:
+        fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+        response = _patch(client, upload_id, 0, WAV[:40])
+    
+    assert response.status_code == 409
+    assert part.stat().st_size == 0
+
+
+def test_short_first_range_is_sniffed_when_the_head_completes(client):
+    upload_id = _start(client)
+    
+    response = _patch(client, upload_id, 0, WAV[:5])
+    assert response.status_code == 200
+    assert response.json()["offset"] == 5
+    
+    response = _patch(client, upload_id, 5, WAV[5:])
+    assert response.status_code == 200
+    assert response.json()["offset"] == len(WAV)
+
+
+def test_wrong_format_is_refused_once_the_head_is_known(client):
+    data = b"\x89PNG\r\n\x1a\n" + bytes(100)
+    upload_id = _start(client, size=len(data))
+    
+    assert _patch(client, upload_id, 0, data[:5]).status_code == 200
+    response = _patch(client, upload_id, 5, data[5:])
+    
+    assert response.status_code == 400
+    assert client.head(f"/uploads/{upload_id}").headers["Upload-Offset"] == "5"
+
+
+def test_finalize_needs_every_byte(client, monkeypatch):
+    monkeypatch.setattr("app.api.routes.uploads.submit_job", lambda *args: "job-1")
+    monkeypatch.setattr("app.api.routes.uploads.check_job_media", lambda *args: 1.0)
+    upload_id = _start(client)
+    _patch(client, upload_id, 0, WAV[:40])
+    
+    response = client.post(f"/uploads/{upload_id}/finalize", json={})
+    assert response.status_code == 409
+    assert response.headers["Upload-Offset"] == "40"
+    
+    _patch(client, upload_id, 40, WAV[40:])
+    response = client.post(f"/uploads/{upload_id}/finalize", json={})
+    assert response.status_code == 202
+    assert response.json()["job_id"] == "job-1"
@@ -0,0 +1,111 @@
+"""
+Sentinel AI - Early Exit Tests
+Sequential probability ratio test over per-frame video scores.
+"""
+import pytest
+
+from app.models.video_analyzer import VideoAnalyzer
+
+
+FAKE = {"real_score": 0.05, "fake_score": 0.95}
+REAL = {"real_score": 0.95, "fake_score": 0.05}
+UNSURE = {"real_score": 0.5, "fake_score": 0.5}
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = VideoAnalyzer()
+    analyzer.face_roi = False
+    analyzer.early_exit = True
+    analyzer.sprt_alpha = analyzer.sprt_beta = 0.05
+    analyzer.sprt_min_frames = 3
+    analyzer.sprt_max_step = 1.5
+    return analyzer
+
+
+def _run(analyzer, results):
+    llr, decisions = 0.0, []
+    for result in results:
+        llr, decision = analyzer._sprt_step(llr, result)
+        decisions.append(decision)
+    return llr, decisions
+
+
+def test_one_frame_cannot_decide(analyzer):
+    llr, decision = analyzer._sprt_step(0.0, {"real_score": 0.0, "fake_score": 1.0})
+    
+    assert llr == pytest.approx(1.5)
+    assert decision is None
+
+
+def test_consistent_fake_frames_decide_fake(analyzer):
+    _, decisions = _run(analyzer, [FAKE, FAKE])
+    
+    # Wald's upper bound is log(0.95 / 0.05) ~ 2.94: two clipped steps
+    assert decisions == [None, "fake"]
+
+
+def test_consistent_real_frames_decide_real(analyzer):
+    _, decisions = _run(analyzer, [REAL, REAL])
+    
+    assert decisions == [None, "real"]
+
+
+def test_unsure_and_conflicting_frames_keep_sampling(analyzer):
+    llr, decisions = _run(analyzer, [UNSURE, FAKE, REAL, UNSURE, FAKE, REAL])
+    
+    assert llr == pytest.approx(0.0)
+    assert decisions == [None] * 6
+
+
+def test_scores_are_normalized_before_the_log_odds(analyzer):
+    llr, _ = analyzer._sprt_step(0.0, {"real_score": 0.2, "fake_score": 0.2})
+    
+    assert llr == pytest.approx(0.0)
+
+
+def _stub_frames(analyzer, monkeypatch, results):
+    """Serve ``results`` as frame scores, recording how many were consumed."""
+    consumed = []
+    
+    def sample_frames(file_path, tracker=None, start=None, duration=None, video_info=None):
+        return {"duration": 10.0}, (i for i in range(len(results)))
+    
+    def frame_scores(frames):
+        for i in frames:
+            consumed.append(i)
+            yield results[i]
+    
+    monkeypatch.setattr(analyzer, "_sample_frames", sample_frames)
+    monkeypatch.setattr(analyzer, "_frame_scores", frame_scores)
+    return consumed
+
+
+def test_scoring_stops_once_confident(analyzer, monkeypatch):
+    consumed = _stub_frames(analyzer, monkeypatch, [FAKE] * 8)
+    
+    _, frame_results, early_exit, _ = analyzer._score_frames("video.mp4")
+    
+    # Decided after two frames, but never before sprt_min_frames
+    assert early_exit is True
+    assert len(frame_results) == 3
+    assert consumed == [0, 1, 2]
+
+
+def test_inconclusive_video_uses_the_whole_budget(analyzer, monkeypatch):
+    _stub_frames(analyzer, monkeypatch, [UNSURE] * 8)
+    
+    _, frame_results, early_exit, _ = analyzer._score_frames("video.mp4")
+    
+    assert early_exit is False
+    assert len(frame_results) == 8
+
+
+def test_early_exit_disabled(analyzer, monkeypatch):
+    analyzer.early_exit = False
+    _stub_frames(analyzer, monkeypatch, [FAKE] * 8)
+    
+    _, frame_results, early_exit, _ = analyzer._score_frames("video.mp4")
+    
+    assert early_exit is False
+    assert len(frame_results) == 8
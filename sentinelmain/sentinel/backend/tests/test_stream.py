@@ -0,0 +1,153 @@
+"""
+Sentinel AI - Streaming Audio Route Tests
+WebSocket protocol, latency budget and decoder failures.
+"""
+import asyncio
+import time
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes import stream
+from app.config import settings
+from app.main import app
+from app.models.audio_analyzer import get_audio_analyzer
+from app.models.audio_stream import AudioStreamSession
+
+
+SAMPLE_RATE = 16000
+
+
+def _pcm(seconds: float) -> bytes:
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    y = 0.3 * np.sin(2 * np.pi * 180 * t) + rng.normal(0, 0.01, len(t))
+    return (y * 32767).astype("<i2").tobytes()
+
+
+def _messages(ws):
+    """Receive messages up to and including the final verdict or an error."""
+    messages = []
+    while not messages or messages[-1]["type"] not in ("final", "error"):
+        message = ws.receive_json()
+        if message["type"] != "backpressure":
+            messages.append(message)
+    return messages
+
+
+@pytest.fixture(scope="module", autouse=True)
+def warm_up():
+    """Load the audio libraries once so the first window meets its budget."""
+    get_audio_analyzer().analyze_samples(np.zeros(SAMPLE_RATE, np.float32), check_known=False)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(settings, "stream_window_timeout_seconds", 5.0)
+    monkeypatch.setattr(settings, "stream_hop_seconds", 1.0)
+    monkeypatch.setattr(settings, "stream_window_seconds", 6.0)
+    return TestClient(app)
+
+
+@pytest.fixture
+def scored(monkeypatch):
+    """Record the length of every hop scored, optionally slowing some down."""
+    lengths, slow = [], set()
+    score_hop = AudioStreamSession.score_hop
+    
+    def recording(self, hop):
+        lengths.append(len(hop))
+        if len(lengths) in slow:
+            time.sleep(0.5)
+        return score_hop(self, hop)
+    
+    monkeypatch.setattr(AudioStreamSession, "score_hop", recording)
+    return lengths, slow
+
+
+def test_unsupported_codec_is_refused(client):
+    with client.websocket_connect("/analyze/audio/stream?codec=mp3") as ws:
+        assert ws.receive_json()["type"] == "error"
+        assert ws.receive()["code"] == 1003
+
+
+def test_every_hop_is_scored_then_final(client, scored):
+    lengths, _ = scored
+    with client.websocket_connect("/analyze/audio/stream?codec=pcm") as ws:
+        ws.send_bytes(_pcm(3.5))
+        ws.send_text("end")
+        messages = _messages(ws)
+    
+    assert [m["type"] for m in messages] == ["score"] * 4 + ["final"]
+    assert [m["window"] for m in messages] == [1, 2, 3, 4, 4]
+    assert lengths == [SAMPLE_RATE] * 3 + [SAMPLE_RATE // 2]
+    assert messages[-1]["stream_seconds"] == 3.5
+    assert 0 <= messages[-1]["risk_score"] <= 100
+
+
+def test_audio_behind_a_slow_window_is_scored_when_it_finishes(client, scored, monkeypatch):
+    monkeypatch.setattr(settings, "stream_window_timeout_seconds", 0.1)
+    lengths, slow = scored
+    slow.add(2)
+    
+    with client.websocket_connect("/analyze/audio/stream?codec=pcm") as ws:
+        ws.send_bytes(_pcm(5))
+        time.sleep(1.0)
+        ws.send_text("end")
+        messages = _messages(ws)
+    
+    kinds = [m["type"] for m in messages]
+    assert kinds[:2] == ["score", "skipped"]
+    assert messages[1]["reason"] == "latency budget exceeded"
+    assert kinds[-1] == "final"
+    # Nothing dropped: hops 3-5 were scored together after the slow one
+    assert sum(lengths) == 5 * SAMPLE_RATE
+    assert lengths[-1] == 3 * SAMPLE_RATE
+
+
+class BrokenDecoder:
+    """Stand-in for the ffmpeg decoder whose process exits on bad input."""
+    
+    fail_start = False
+    
+    def __init__(self, sample_rate):
+        self.finished = asyncio.Event()
+    
+    async def start(self):
+        if self.fail_start:
+            raise FileNotFoundError("ffmpeg")
+    
+    async def write(self, data):
+        raise BrokenPipeError("ffmpeg exited")
+    
+    async def read(self, size=32768):
+        await self.finished.wait()
+        return b""
+    
+    async def finish(self):
+        self.finished.set()
+    
+    async def close(self):
+        pass
+
+
+def test_undecodable_stream_is_reported(client, monkeypatch):
+    monkeypatch.setattr(stream, "FfmpegStreamDecoder", BrokenDecoder)
+    
+    with client.websocket_connect("/analyze/audio/stream?codec=opus") as ws:
+        ws.send_bytes(b"OggS not really opus")
+        messages = _messages(ws)
+        assert messages[-1] == {"type": "error", "detail": "Audio stream could not be decoded"}
+        final = ws.receive_json()
+        assert final["type"] == "final"
+        assert ws.receive()["code"] == 1000
+
+
+def test_missing_decoder_is_reported(client, monkeypatch):
+    monkeypatch.setattr(BrokenDecoder, "fail_start", True)
+    monkeypatch.setattr(stream, "FfmpegStreamDecoder", BrokenDecoder)
+    
+    with client.websocket_connect("/analyze/audio/stream?codec=opus") as ws:
+        assert ws.receive_json()["type"] == "error"
+        assert ws.receive()["code"] == 1011
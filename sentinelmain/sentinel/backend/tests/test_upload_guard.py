@@ -0,0 +1,99 @@
+"""
+Sentinel AI - Upload Guard Tests
+Magic-byte sniffing and early rejection of multipart uploads.
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+from app.utils.file_handler import SNIFF_BYTES, sniff_format
+from app.utils.upload_guard import _find_file_head
+
+
+BOUNDARY = b"sentinel-boundary"
+
+JPEG = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01" + b"\x00" * 64
+WAV = b"RIFF\x24\x00\x00\x00WAVEfmt " + b"\x00" * 64
+
+
+@pytest.mark.parametrize("head, expected", [
+    (JPEG, "jpeg"),
+    (b"\x89PNG\r\n\x1a\n\x00\x00\x00\x0dIHDR", "png"),
+    (WAV, "wav"),
+    (b"RIFF\x00\x00\x00\x00AVI LIST", "avi"),
+    (b"RIFF\x00\x00\x00\x00WEBPVP8 ", None),
+    (b"ID3\x04\x00\x00\x00\x00\x00\x00\x00\x00", "mp3"),
+    (b"\xff\xfb\x90\x64\x00\x00\x00\x00\x00\x00\x00\x00", "mp3"),
+    (b"\x00\x00\x00\x20ftypisom\x00\x00", "mp4"),
+    (b"\x00\x00\x00\x08wide\x00\x00\x00\x00", "mp4"),
+    (b"\x1a\x45\xdf\xa3\x9f\x42\x86\x81\x01\x42\xf7\x81", "webm"),
+    (b"OggS\x00\x02\x00\x00\x00\x00\x00\x00", "ogg"),
+    (b"%PDF-1.7\n%\xe2\xe3\xcf\xd3", None),
+    (b"", None)
+])
+def test_sniff_format(head, expected):
+    assert sniff_format(head[:SNIFF_BYTES]) == expected
+
+
+def _multipart(*parts):
+    """Build a multipart body from (headers, data) pairs."""
+    body = b""
+    for headers, data in parts:
+        body += b"--" + BOUNDARY + b"\r\n" + headers + b"\r\n\r\n" + data + b"\r\n"
+    return body + b"--" + BOUNDARY + b"--\r\n"
+
+
+FIELD = (b'Content-Disposition: form-data; name="callback_url"', b"https://example.com/hook")
+FILE = (b'Content-Disposition: form-data; name="file"; filename="a.jpg"\r\nContent-Type: image/jpeg', JPEG)
+
+
+def test_file_head_after_a_form_field():
+    body = _multipart(FIELD, FILE)
+    
+    assert _find_file_head(body, BOUNDARY, complete=True) == JPEG[:SNIFF_BYTES]
+
+
+def test_file_head_needs_more_body():
+    body = _multipart(FIELD, FILE)
+    file_start = body.index(JPEG)
+    
+    # Cut inside the part headers, then inside the first bytes of the file
+    assert _find_file_head(body[:file_start - 10], BOUNDARY, complete=False) is None
+    assert _find_file_head(body[:file_start + 4], BOUNDARY, complete=False) is None
+    assert _find_file_head(body[:file_start + SNIFF_BYTES], BOUNDARY, complete=False) == JPEG[:SNIFF_BYTES]
+
+
+def test_file_shorter_than_sniff_bytes():
+    body = _multipart((FILE[0], b"\xff\xd8\xff"))
+    
+    assert _find_file_head(body, BOUNDARY, complete=True) == b"\xff\xd8\xff"
+
+
+def test_body_without_file_part():
+    body = _multipart(FIELD)
+    
+    assert _find_file_head(body, BOUNDARY, complete=True) == b""
+    assert _find_file_head(body[:20], BOUNDARY, complete=True) == b""
+
+
+@pytest.fixture
+def client(upload_dir):
+    """API client without the startup tasks (janitor, pools)."""
+    return TestClient(app)
+
+
+def test_mislabeled_upload_is_refused(client):
+    response = client.post("/analyze/image", files={"file": ("photo.jpg", WAV, "image/jpeg")})
+    
+    assert response.status_code == 400
+    assert response.json()["detail"] == "File contents are not a supported image format"
+    assert response.headers["connection"] == "close"  # From the guard, not the route
+
+
+def test_oversized_upload_is_refused_from_its_header(client, monkeypatch):
+    monkeypatch.setattr(settings, "max_upload_size_mb", 0)
+    
+    response = client.post("/analyze/audio", files={"file": ("call.wav", WAV + b"\x00" * 128 * 1024, "audio/wav")})
+    
+    assert response.status_code == 413
@@ -0,0 +1,71 @@
+"""
+Sentinel AI - Upload Store Tests
+Content-addressed blobs shared through hard-linked handles.
+"""
+import hashlib
+import os
+import time
+
+from app.utils.upload_store import content_digest, delete_file, release_orphaned_blobs
+from tests.conftest import store_bytes
+
+
+def _blobs(upload_dir):
+    return sorted((upload_dir / "objects").iterdir())
+
+
+def test_handle_is_named_by_digest(upload_dir):
+    handle = store_bytes(b"clip", ".wav")
+    
+    assert content_digest(handle) == hashlib.sha256(b"clip").hexdigest()
+    assert handle.suffix == ".wav"
+    assert handle.read_bytes() == b"clip"
+    assert not list(upload_dir.glob("*.partial"))
+
+
+def test_identical_uploads_share_one_blob(upload_dir):
+    first = store_bytes(b"clip")
+    second = store_bytes(b"clip")
+    other = store_bytes(b"other clip")
+    
+    assert first != second
+    assert len(_blobs(upload_dir)) == 2
+    assert os.stat(first).st_ino == os.stat(second).st_ino
+    # Blob plus two handles
+    assert os.stat(first).st_nlink == 3
+    assert os.stat(other).st_nlink == 2
+
+
+def test_blob_is_removed_with_its_last_handle(upload_dir):
+    first = store_bytes(b"clip")
+    second = store_bytes(b"clip")
+    
+    assert delete_file(first)
+    assert second.read_bytes() == b"clip"
+    assert len(_blobs(upload_dir)) == 1
+    
+    assert delete_file(second)
+    assert _blobs(upload_dir) == []
+    assert not delete_file(second)
+
+
+def test_content_digest_of_foreign_files():
+    assert content_digest("/tmp/clip.mp4") is None
+    assert content_digest("/tmp/" + "z" * 64 + "-id.mp4") is None
+
+
+def test_orphaned_blobs_are_released_after_retention(upload_dir):
+    handle = store_bytes(b"clip")
+    orphan = store_bytes(b"orphan")
+    # A crash between unlinking a handle and releasing its blob
+    orphan.unlink()
+    
+    assert release_orphaned_blobs(retention=60) == 0
+    
+    old = time.time() - 120
+    for blob in _blobs(upload_dir):
+        os.utime(blob, (old, old))
+    
+    assert release_orphaned_blobs(retention=60) == 1
+    assert len(_blobs(upload_dir)) == 1
+    assert handle.read_bytes() == b"clip"
@@ -0,0 +1,93 @@
+"""
+Sentinel AI - Voice Activity Detection Tests
+Silence and noise are dropped before the feature and model stages.
+"""
+import numpy as np
+import pytest
+
+from app.models.audio_analyzer import AudioAnalyzer
+
+
+SAMPLE_RATE = 16000
+
+
+@pytest.fixture
+def analyzer():
+    return AudioAnalyzer()
+
+
+def _voice(seconds: float, amplitude: float = 0.3) -> np.ndarray:
+    """Harmonic tone at a speaking pitch: peaky spectrum, like voiced speech."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    y = sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 6))
+    return (amplitude * y / np.abs(y).max()).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * SAMPLE_RATE), np.float32)
+
+
+def _noise(seconds: float, amplitude: float = 0.3) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return rng.uniform(-amplitude, amplitude, int(seconds * SAMPLE_RATE)).astype(np.float32)
+
+
+def test_voice_between_silences_is_kept(analyzer):
+    y = np.concatenate([_silence(1), _voice(2), _silence(1)])
+    
+    voiced, energies, speech_ratio = analyzer._detect_voice_activity(y)
+    
+    # Two seconds of voice plus the hangover on either side
+    hangover = 2 * analyzer.vad_hangover_frames * analyzer.vad_hop_length / SAMPLE_RATE
+    assert 2.0 <= len(voiced) / SAMPLE_RATE <= 2.0 + hangover + 0.05
+    assert 0.5 <= speech_ratio <= 0.5 + hangover / 4 + 0.02
+    assert len(energies) == int(round(speech_ratio * analyzer._frame_power(y).shape[1]))
+
+
+def test_silence_has_no_speech(analyzer):
+    voiced, energies, speech_ratio = analyzer._detect_voice_activity(_silence(2))
+    
+    assert len(voiced) == 0
+    assert len(energies) == 0
+    assert speech_ratio == 0.0
+
+
+def test_broadband_noise_is_not_speech(analyzer):
+    voiced, _, speech_ratio = analyzer._detect_voice_activity(_noise(2))
+    
+    assert len(voiced) == 0
+    assert speech_ratio == 0.0
+
+
+def test_quiet_frames_below_energy_floor_are_dropped(analyzer):
+    # 60 dB below the loud part, well under the -35 dB floor
+    y = np.concatenate([_voice(1), _silence(1), _voice(1, amplitude=0.0003)])
+    
+    voiced, _, speech_ratio = analyzer._detect_voice_activity(y)
+    
+    assert len(voiced) / SAMPLE_RATE < 1.2
+    assert speech_ratio < 0.4
+
+
+def test_frame_energies_are_mean_square_amplitude(analyzer):
+    t = np.arange(SAMPLE_RATE) / SAMPLE_RATE
+    y = (0.5 * np.sin(2 * np.pi * 1000 * t)).astype(np.float32)
+    
+    _, energies, _ = analyzer._detect_voice_activity(y)
+    
+    # A sine of amplitude A has mean square A^2 / 2
+    assert np.allclose(energies, 0.125, rtol=0.05)
+
+
+def test_clip_shorter_than_a_frame(analyzer):
+    voiced, _, speech_ratio = analyzer._detect_voice_activity(_voice(0.01))
+    
+    assert speech_ratio == 1.0
+    assert len(voiced) == int(0.01 * SAMPLE_RATE)
+
+
+def test_silent_audio_skips_the_model(analyzer):
+    result = analyzer.analyze_samples(_silence(2), check_known=False)
+    
+    assert result["speech_ratio"] == 0.0
+    assert result["compute_saved"] == 1.0
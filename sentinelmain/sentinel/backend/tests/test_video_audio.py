@@ -0,0 +1,74 @@
+"""
+Sentinel AI - Video Audio Track Tests
+Fusing the audio-track score into the video score.
+"""
+import threading
+
+import pytest
+
+from app.config import settings
+from app.models.video_analyzer import VideoAnalyzer
+
+
+AUDIO = {"tts_likelihood": 0.9, "voice_cloning": 0.2, "speech_ratio": 0.5}
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    analyzer = VideoAnalyzer()
+    analyzer.audio_track = True
+    analyzer.audio_weight = 0.6
+    monkeypatch.setattr(analyzer, "_analyze_frames", lambda path, video_info, stage: {"deepfake_likelihood": 0.3})
+    return analyzer
+
+
+def test_audio_only_raises_the_score(analyzer):
+    assert analyzer._fuse_audio(0.3, AUDIO) == pytest.approx((0.48, 0.9))
+    assert analyzer._fuse_audio(0.3, {**AUDIO, "tts_likelihood": 0.1}) == pytest.approx((0.3, 0.2))
+    assert analyzer._fuse_audio(0.3, None) == (0.3, None)
+
+
+def test_missing_speech_ratio_uses_full_weight(analyzer):
+    fused, _ = analyzer._fuse_audio(0.3, {"tts_likelihood": 0.9, "voice_cloning": 0.0})
+    
+    assert fused == pytest.approx(0.66)
+
+
+def test_audio_result_is_fused(analyzer, monkeypatch):
+    monkeypatch.setattr(analyzer, "analyze_audio_track", lambda path: AUDIO)
+    
+    result = analyzer.analyze("clip.mp4", cache_key="digest")
+    
+    assert result["deepfake_likelihood"] == pytest.approx(0.48)
+    assert result["visual_deepfake_likelihood"] == 0.3
+    assert result["audio_fake_likelihood"] == 0.9
+
+
+def test_slow_audio_is_dropped(analyzer, monkeypatch):
+    release = threading.Event()
+    
+    def slow(path):
+        release.wait(5)
+        return AUDIO
+    
+    monkeypatch.setattr(analyzer, "analyze_audio_track", slow)
+    monkeypatch.setattr(settings, "video_audio_timeout_seconds", 0.05)
+    try:
+        result = analyzer.analyze("clip.mp4", cache_key="digest")
+    finally:
+        release.set()
+    
+    assert result["deepfake_likelihood"] == 0.3
+    assert result["audio_fake_likelihood"] is None
+
+
+def test_failed_audio_is_dropped(analyzer, monkeypatch):
+    def broken(path):
+        raise RuntimeError("demux failed")
+    
+    monkeypatch.setattr(analyzer, "analyze_audio_track", broken)
+    
+    result = analyzer.analyze("clip.mp4", cache_key="digest")
+    
+    assert result["deepfake_likelihood"] == 0.3
+    assert result["audio_fake_likelihood"] is None
@@ -0,0 +1,54 @@
+"""
+Sentinel AI - Video Decoding Tests
+Frame reader behaviour against a real ffmpeg.
+"""
+import shutil
+
+import pytest
+
+from app.utils.video_decode import FfmpegFrameReader
+from tests.conftest import frame_index
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def test_frames_are_scaled_rgb(video):
+    with FfmpegFrameReader(video, (32, 24), max_frames=3) as reader:
+        frames = [frame.copy() for frame in reader]
+    
+    assert len(frames) == 3
+    assert frames[0].shape == (24, 32, 3)
+    assert [frame_index(f) for f in frames] == [0, 1, 2]
+
+
+def test_fps_filter_drops_frames(video):
+    with FfmpegFrameReader(video, (32, 24), fps=2) as reader:
+        indices = [frame_index(frame) for frame in reader]
+    
+    assert len(indices) == 10
+    assert indices == sorted(indices)
+    assert indices[1] - indices[0] == 5
+
+
+def test_max_frames_slots_stay_valid(video):
+    with FfmpegFrameReader(video, (32, 24), max_frames=4) as reader:
+        frames = list(reader)
+    
+    # Each frame has its own slot, so earlier frames are not overwritten
+    assert [frame_index(f) for f in frames] == [0, 1, 2, 3]
+
+
+def test_start_and_duration(video):
+    with FfmpegFrameReader(video, (32, 24), start=2.0, duration=1.0) as reader:
+        indices = [frame_index(frame) for frame in reader]
+    
+    assert len(indices) == 10
+    assert indices[0] == 20
+
+
+def test_close_stops_decoder(video):
+    reader = FfmpegFrameReader(video, (32, 24))
+    next(iter(reader))
+    reader.close()
+    
+    assert reader._process.poll() is not None
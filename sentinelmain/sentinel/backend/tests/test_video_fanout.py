@@ -0,0 +1,93 @@
+"""
+Sentinel AI - Distributed Video Tests
+Scoring time ranges separately and reducing them into one result.
+"""
+import pytest
+
+from app.config import settings
+from app.models.video_analyzer import VideoAnalyzer, get_video_analyzer
+from app.workers.checkpoints import load_result
+from app.utils.upload_store import content_digest
+from app.workers.tasks import reduce_video_task
+from tests.conftest import store_bytes
+
+
+def _range(start, fake_scores, early_exit=False, face_crops=None):
+    return {
+        "start_seconds": start,
+        "frame_results": [{"real_score": 1 - s, "fake_score": s} for s in fake_scores],
+        "early_exit": early_exit,
+        "face_crops": face_crops
+    }
+
+
+@pytest.fixture
+def analyzer():
+    analyzer = VideoAnalyzer()
+    analyzer.frame_budget = 8
+    return analyzer
+
+
+def test_score_range_scores_only_that_range(analyzer, monkeypatch):
+    calls = []
+    
+    def score_frames(file_path, start, duration):
+        calls.append((start, duration))
+        return {}, [{"real_score": 0.6, "fake_score": 0.4}], True, 1
+    
+    monkeypatch.setattr(analyzer, "_score_frames", score_frames)
+    result = analyzer.score_range("clip.mp4", 10.0, 10.0)
+    
+    assert calls == [(10.0, 10.0)]
+    assert result == {
+        "start_seconds": 10.0,
+        "frame_results": [{"real_score": 0.6, "fake_score": 0.4}],
+        "early_exit": True,
+        "face_crops": 1
+    }
+
+
+def test_ranges_are_pooled_in_time_order(analyzer):
+    ranges = [_range(10.0, [0.8], early_exit=True, face_crops=2), _range(0.0, [0.2, 0.2], face_crops=1)]
+    
+    result = analyzer.combine_ranges(ranges, None, 20.0)
+    
+    assert result["frames_analyzed"] == 3
+    assert result["frame_budget"] == 16
+    assert result["early_exit"] is True
+    assert result["face_crops"] == 3
+    assert result["duration_seconds"] == 20.0
+    assert result["audio_fake_likelihood"] is None
+
+
+def test_combined_result_matches_a_whole_file_pool(analyzer):
+    ranges = [_range(0.0, [0.2, 0.4]), _range(10.0, [0.6])]
+    _, expected = analyzer._pool_frames([f for r in ranges for f in r["frame_results"]])
+    
+    result = analyzer.combine_ranges(ranges, None, 20.0)
+    
+    assert result["visual_deepfake_likelihood"] == pytest.approx(expected)
+    assert result["face_crops"] is None
+
+
+def test_audio_is_fused_into_the_combined_result(analyzer):
+    audio = {"tts_likelihood": 0.9, "voice_cloning": 0.1, "speech_ratio": 1.0}
+    
+    result = analyzer.combine_ranges([_range(0.0, [0.2])], audio, 10.0)
+    
+    assert result["audio_fake_likelihood"] == 0.9
+    assert result["deepfake_likelihood"] > result["visual_deepfake_likelihood"]
+
+
+def test_reduce_stores_the_result_and_deletes_the_input(upload_dir, fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "result_cache_enabled", True)
+    video = store_bytes(b"video")
+    digest = content_digest(video)
+    audio = {"audio": {"tts_likelihood": 0.1, "voice_cloning": 0.1}}
+    
+    result = reduce_video_task([_range(10.0, [0.4]), audio, _range(0.0, [0.2])], str(video), 20.0)
+    
+    assert result["frames_analyzed"] == 2
+    assert not video.exists()
+    assert not any((upload_dir / "objects").iterdir())
+    assert load_result("video", digest, get_video_analyzer().model_version) == result
@@ -0,0 +1,167 @@
+"""
+Sentinel AI - Video Frame Sampling Tests
+Sequential OpenCV decoding of sampled frames.
+"""
+import cv2
+import pytest
+
+from app.config import settings
+from app.models import video_analyzer
+from app.models.video_analyzer import VideoAnalyzer
+from tests.conftest import frame_index
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.setattr(settings, "video_decode_backend", "opencv")
+    analyzer = VideoAnalyzer()
+    analyzer.face_roi = False
+    return analyzer
+
+
+class RecordingCapture:
+    """Wraps an OpenCV capture, recording grabs and position changes."""
+    
+    seeks = []
+    grabs = []
+    
+    def __init__(self, path):
+        self._cap = OpenCVCapture(path)
+    
+    def set(self, prop, value):
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            self.seeks.append(value)
+        return self._cap.set(prop, value)
+    
+    def grab(self):
+        self.grabs.append(True)
+        return self._cap.grab()
+    
+    def __getattr__(self, name):
+        return getattr(self._cap, name)
+
+
+OpenCVCapture = cv2.VideoCapture
+
+
+@pytest.fixture
+def capture(monkeypatch):
+    monkeypatch.setattr(RecordingCapture, "seeks", [])
+    monkeypatch.setattr(RecordingCapture, "grabs", [])
+    monkeypatch.setattr(cv2, "VideoCapture", RecordingCapture)
+    return RecordingCapture
+
+
+INFO = {"duration": 5.0, "fps": 10.0, "frame_count": 50, "width": 64, "height": 48}
+
+
+def test_target_frames_at_sample_rate(analyzer):
+    assert analyzer._target_frame_indices(INFO, 1, 8) == [0, 10, 20, 30, 40]
+    assert analyzer._target_frame_indices(INFO, 2, 3) == [0, 5, 10]
+    assert analyzer._target_frame_indices(INFO, 1, 8, start=2.0, duration=2.0) == [20, 30]
+
+
+def test_sample_rate_above_video_rate_takes_every_frame(analyzer):
+    assert analyzer._target_frame_indices(INFO, 25, 4) == [0, 1, 2, 3]
+
+
+def test_frames_are_decoded_in_one_pass_without_seeks(analyzer, video, capture):
+    info, frames = analyzer._decode_frames_opencv(video, 2, 8)
+    
+    decoded = list(frames)
+    assert [frame_index(f) for f in decoded] == [0, 5, 10, 15, 20, 25, 30, 35]
+    assert decoded[0].shape == (224, 224, 3)
+    assert info["frame_count"] == 50
+    assert capture.seeks == []
+    assert len(capture.grabs) == 36
+
+
+def test_time_range_costs_one_seek(analyzer, video, capture):
+    _, frames = analyzer._decode_frames_opencv(video, 1, 8, start=2.0, duration=2.0)
+    
+    assert [frame_index(f) for f in frames] == [20, 30]
+    assert capture.seeks == [20]
+
+
+def test_known_metadata_skips_probing(analyzer, video, monkeypatch):
+    monkeypatch.setattr(analyzer, "_get_video_info", lambda cap: pytest.fail("probed again"))
+    
+    info, frames = analyzer._decode_frames_opencv(video, 1, 2, video_info=INFO)
+    
+    assert info is INFO
+    assert [frame_index(f) for f in frames] == [0, 10]
+
+
+def test_uniform_sampling_decodes_lazily(analyzer, video, capture, monkeypatch):
+    monkeypatch.setattr(analyzer, "sampling_mode", "uniform")
+    
+    _, frames = analyzer._sample_frames(video)
+    next(frames)
+    frames.close()
+    
+    assert len(capture.grabs) == 1
+
+
+def test_candidate_rate_covers_long_clips(analyzer, monkeypatch):
+    monkeypatch.setattr(analyzer, "candidate_fps", 4.0)
+    monkeypatch.setattr(analyzer, "max_candidates", 64)
+    
+    assert analyzer._candidate_fps(10.0) == 4.0
+    assert analyzer._candidate_fps(0) == 4.0
+    assert analyzer._candidate_fps(128.0) == 0.5
+
+
+def test_adaptive_candidates_span_the_clip(analyzer, video, monkeypatch):
+    monkeypatch.setattr(analyzer, "sampling_mode", "adaptive")
+    monkeypatch.setattr(analyzer, "early_exit", False)
+    monkeypatch.setattr(analyzer, "max_candidates", 10)
+    monkeypatch.setattr(analyzer, "frame_budget", 4)
+    candidates = []
+    change_scores = analyzer._change_scores
+    
+    def recording(frames):
+        candidates.extend(frame_index(f) for f in frames)
+        return change_scores(frames)
+    
+    monkeypatch.setattr(analyzer, "_change_scores", recording)
+    
+    _, frames = analyzer._sample_frames(video)
+    kept = [frame_index(f) for f in frames]
+    
+    assert candidates == list(range(0, 50, 5))
+    assert len(kept) == 4
+    assert kept[-1] >= 30
+
+
+def _flat(level):
+    import numpy as np
+    return np.full((48, 64, 3), level, np.uint8)
+
+
+def test_incremental_selection_picks_the_biggest_change_per_stretch(analyzer):
+    levels = [0, 0, 0, 200, 10, 10, 10, 10]
+    
+    kept = list(analyzer._select_incremental(iter([_flat(v) for v in levels]), 8, 2))
+    
+    assert [int(f[0, 0, 0]) for f in kept] == [200, 10]
+
+
+def test_incremental_selection_flushes_a_short_decode(analyzer):
+    kept = list(analyzer._select_incremental(iter([_flat(v) for v in (0, 50, 100)]), 8, 4))
+    
+    assert len(kept) == 2
+
+
+def test_adaptive_early_exit_decodes_lazily(analyzer, video, capture, monkeypatch):
+    monkeypatch.setattr(analyzer, "sampling_mode", "adaptive")
+    monkeypatch.setattr(analyzer, "early_exit", True)
+    monkeypatch.setattr(analyzer, "max_candidates", 40)
+    monkeypatch.setattr(analyzer, "frame_budget", 4)
+    
+    _, frames = analyzer._sample_frames(video)
+    first = next(frames)
+    frames.close()
+    
+    # One stretch of 10 candidates at 4 fps from a 10 fps clip
+    assert frame_index(first) < 25
+    assert len(capture.grabs) < 25
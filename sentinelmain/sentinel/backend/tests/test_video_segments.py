@@ -0,0 +1,97 @@
+"""
+Sentinel AI - Segmented Video Tests
+Time ranges, per-segment scoring and the streaming route.
+"""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+from app.models.video_analyzer import VideoAnalyzer, get_video_analyzer
+from tests.conftest import write_video
+
+
+def test_segment_ranges():
+    analyzer = VideoAnalyzer()
+    
+    assert analyzer.segment_ranges(25, 10) == [(0.0, 10), (10, 20), (20, 25)]
+    # A tail under a quarter step joins the previous range
+    assert analyzer.segment_ranges(21, 10) == [(0.0, 10), (10, 21)]
+    assert analyzer.segment_ranges(0, 10) == [(0.0, 0)]
+
+
+def test_segments_then_summary(monkeypatch):
+    analyzer = VideoAnalyzer()
+    analyzer.segment_seconds = 10
+    scores = {0.0: 0.2, 10: 0.8, 20: 0.4}
+    
+    def score_frames(file_path, start, duration, video_info):
+        frame = {"real_score": 1 - scores[start], "fake_score": scores[start]}
+        return video_info, [frame, frame], False, None
+    
+    monkeypatch.setattr(analyzer, "_score_frames", score_frames)
+    events = list(analyzer.analyze_segments("clip.mp4", {"duration": 25}))
+    
+    assert [e["type"] for e in events] == ["segment"] * 3 + ["summary"]
+    assert [e["start_seconds"] for e in events[:3]] == [0.0, 10, 20]
+    assert events[1]["deepfake_likelihood"] == pytest.approx(0.8)
+    assert events[-1]["most_suspicious_segment"] == 1
+    assert events[-1]["frames_analyzed"] == 6
+
+
+def test_too_long_video_is_refused():
+    analyzer = VideoAnalyzer()
+    
+    with pytest.raises(ValueError):
+        list(analyzer.analyze_segments("clip.mp4", {"duration": settings.max_segmented_video_duration_seconds + 1}))
+
+
+@pytest.fixture
+def client(upload_dir, monkeypatch):
+    monkeypatch.setattr(settings, "video_decode_backend", "opencv")
+    monkeypatch.setattr(get_video_analyzer(), "segment_seconds", 2.0)
+    return TestClient(app)
+
+
+def _post(client, path, fmt="ndjson"):
+    with open(path, "rb") as f:
+        return client.post(
+            f"/analyze/video/segments?format={fmt}",
+            files={"file": ("clip.avi", f.read(), "video/x-msvideo")}
+        )
+
+
+def test_route_streams_segments(client, tmp_path):
+    response = _post(client, write_video(tmp_path / "clip.avi"))
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [e["type"] for e in events] == ["segment"] * 3 + ["summary"]
+    assert events[2]["end_seconds"] == pytest.approx(5.0)
+    assert "verdict" in events[0] and "action" in events[-1]
+
+
+def test_route_streams_sse(client, tmp_path):
+    response = _post(client, write_video(tmp_path / "clip.avi"), "sse")
+    
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text.startswith("event: segment\ndata: ")
+    assert "event: summary" in response.text
+
+
+def test_route_refuses_over_long_video(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "max_segmented_video_duration_seconds", 3)
+    
+    response = _post(client, write_video(tmp_path / "clip.avi"))
+    
+    assert response.status_code == 400
+    assert "too long" in response.json()["detail"]
+
+
+def test_route_refuses_empty_video(client, tmp_path):
+    response = _post(client, write_video(tmp_path / "clip.avi", frames=0))
+    
+    assert response.status_code == 400